@@ -0,0 +1,181 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Callable, Iterable, Tuple
+
+import orjson
+
+# In-process admission control: per-client token buckets in front of every route, and a bounded
+# concurrency gate around cache-miss work. Decisions are O(1) and never touch the database.
+
+
+class Overloaded(Exception):
+    """Raised by ConcurrencyGate when cache-miss work can't be admitted; maps to 503."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Server busy, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class RateLimiter:
+    """Token bucket per client: `rate` requests/second sustained, `burst` at once.
+
+    Buckets refill lazily on access. At most `max_clients` are tracked (least recently seen
+    evicted first), so a flood of distinct addresses can't grow memory without bound.
+    Multi-item requests are charged per item after admission and may leave a bucket in debt.
+    """
+
+    def __init__(self, rate: float, burst: float, max_clients: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.max_clients = max_clients
+        self.clock = clock
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+        self.allowed = 0
+        self.limited = 0
+        self.charged = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def _bucket(self, client: str) -> list:
+        # [tokens, last refill], refilled up to now
+        now = self.clock()
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = [self.burst, now]
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        return bucket
+
+    def acquire(self, client: str) -> Tuple[bool, int]:
+        # (allowed, seconds until a token is available)
+        bucket = self._bucket(client)
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            self.allowed += 1
+            return True, 0
+        self.limited += 1
+        return False, max(1, math.ceil((1 - bucket[0]) / self.rate))
+
+    def charge(self, client: str, cost: float) -> None:
+        # Tokens beyond the one the request was admitted with; a negative balance holds the
+        # client's next requests back until it has refilled
+        if self.enabled and cost > 0:
+            self._bucket(client)[0] -= cost
+            self.charged += cost
+
+    def stats(self) -> dict:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "clients": len(self._buckets),
+            "allowed": self.allowed,
+            "limited": self.limited,
+            "charged": self.charged,
+        }
+
+
+class ConcurrencyGate:
+    """At most `limit` holders at once, at most `queue_size` waiting, each for up to `timeout` seconds.
+
+    Anything beyond that is shed immediately with Overloaded instead of piling onto the thread pool.
+    """
+
+    def __init__(self, limit: int, queue_size: int, timeout: float):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._slots = None
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.queued = 0
+        self.shed = 0
+        self.timed_out = 0
+
+    @property
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.timeout))
+
+    @asynccontextmanager
+    async def slot(self):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.limit)
+        if self._slots.locked():
+            if self.waiting >= self.queue_size:
+                self.shed += 1
+                raise Overloaded(self.retry_after)
+            self.queued += 1
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.timeout)
+            except asyncio.TimeoutError:
+                self.timed_out += 1
+                raise Overloaded(self.retry_after) from None
+            finally:
+                self.waiting -= 1
+        else:
+            await self._slots.acquire()
+        self.admitted += 1
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._slots.release()
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "queue_size": self.queue_size,
+            "active": self.active,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "shed": self.shed,
+            "timed_out": self.timed_out,
+        }
+
+
+def client_address(scope) -> str:
+    # The verified peer only. Behind a proxy, uvicorn rewrites it from X-Forwarded-For when the proxy
+    # is listed in FORWARDED_ALLOW_IPS (taking the right-most hop it didn't add); headers are never read here
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RateLimitMiddleware:
+    """Pure ASGI middleware: 429 with Retry-After once a client's bucket is empty."""
+
+    def __init__(self, app, limiter: RateLimiter, exempt: Iterable[str] = ()):
+        self.app = app
+        self.limiter = limiter
+        self.exempt = frozenset(exempt)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.limiter.enabled or scope["path"] in self.exempt:
+            return await self.app(scope, receive, send)
+
+        allowed, retry_after = self.limiter.acquire(client_address(scope))
+        if allowed:
+            return await self.app(scope, receive, send)
+
+        body = orjson.dumps({"detail": f"Rate limit exceeded, retry after {retry_after}s"})
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
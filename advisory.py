@@ -0,0 +1,220 @@
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import islice
+
+from artifact import load_artifact
+from cache import TTLCache
+from compile_calendar import ARTIFACT_PATH
+from database import readonly_uri
+from engine import FRAGMENTS_QUERY, SNAPSHOT_QUERY, CalendarSnapshot, resolve_plan, sowing_status
+from migrate import DB_PATH
+
+# Usage:
+#   python advisory.py farmers.csv advisories.csv               today's advisories
+#   python advisory.py farmers.jsonl out.jsonl --date 2026-07-01
+#   python advisory.py farmers.csv out.csv --workers 1          no process pool
+#
+# Input records need season, crop, variety and sowing_date (YYYY-MM-DD); id (or farmer_id) and
+# language are optional. CSV or JSONL is picked by extension, for input and output alike.
+
+OUTPUT_FIELDS = (
+    "id", "season", "crop", "variety", "language", "as_of", "day_offset", "status", "week", "stage",
+    "field_operation", "irrigation", "fertilizer", "weed_management", "protection", "critical_actions", "error",
+)
+
+# Per-process state, set once by load() in the parent or by the pool initializer in each worker.
+# Only engine-level modules are imported: no web app, no log listener thread to lose across fork
+_snapshot = CalendarSnapshot()
+_as_of = None
+_plans = {}
+# Every (variety, language) plan of the snapshot fits; nothing expires within a run
+_plan_cache = TTLCache(maxsize=100000, ttl=float("inf"))
+
+
+def load_snapshot() -> CalendarSnapshot:
+    # Same sources as the API, read synchronously
+    if os.path.exists(ARTIFACT_PATH):
+        return load_artifact(ARTIFACT_PATH)
+    conn = sqlite3.connect(readonly_uri(DB_PATH), uri=True)
+    try:
+        rows = conn.execute(SNAPSHOT_QUERY).fetchall()
+        fragments = {}
+        for fragment_id, language, text in conn.execute(FRAGMENTS_QUERY):
+            fragments.setdefault(fragment_id, {})[language] = text
+    finally:
+        conn.close()
+    return CalendarSnapshot.from_fragments(rows, fragments)
+
+
+def load(as_of: date) -> None:
+    global _snapshot, _as_of
+    _snapshot = load_snapshot()
+    _as_of = as_of
+    _plans.clear()
+    _plan_cache.clear()
+
+
+def read_records(path: str):
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def resolve(season: str, crop: str, variety: str, language: str):
+    # One resolution and one plan per distinct (variety spelling, language) for the whole run
+    lookup = (season, crop, variety, language)
+    entry = _plans.get(lookup)
+    if entry is None:
+        resolution = _snapshot.catalog.resolve(season, crop, variety)
+        if resolution.key is None:
+            entry = _plans[lookup] = (None, None, resolution.message)
+            return entry
+        plan = resolve_plan(_snapshot, resolution.key, language, _plan_cache)
+        critical = {w.week_number: month.critical_actions for month in plan.timeline for w in month.weeks}
+        entry = _plans[lookup] = (plan, critical, None)
+    return entry
+
+
+def advise(record: dict) -> dict:
+    season, crop, variety = (str(record.get(k) or "") for k in ("season", "crop", "variety"))
+    language = str(record.get("language") or "en")
+    result = {"id": record.get("id", record.get("farmer_id")), "season": season, "crop": crop, "variety": variety,
+              "language": language, "as_of": _as_of.isoformat()}
+    plan, critical, error = resolve(season, crop, variety, language)
+    if error:
+        return {**result, "error": error}
+    try:
+        sowing_date = date.fromisoformat(str(record.get("sowing_date") or ""))
+    except ValueError:
+        return {**result, "error": f"Invalid sowing_date '{record.get('sowing_date')}'."}
+
+    day_offset, status, week = sowing_status(plan, sowing_date, _as_of)
+    result.update(
+        season=plan.context["selected_season"],
+        crop=plan.context["selected_crop"],
+        variety=plan.context["selected_variety"],
+        language=plan.context["language"],
+        day_offset=day_offset,
+        status=status,
+    )
+    if status != "in_progress":
+        # Not sown yet or already harvested: nothing to do today, as the API's current_week of 0 says
+        return result
+    return {
+        **result,
+        "week": week.week_number,
+        "stage": week.stage,
+        "field_operation": week.field_operation,
+        "irrigation": week.irrigation,
+        "fertilizer": week.fertilizer,
+        "weed_management": week.weed_management,
+        "protection": week.protection,
+        "critical_actions": critical.get(week.week_number, []),
+    }
+
+
+def advise_chunk(records: list) -> list:
+    # Farmers sharing a variety are adjacent in the plan cache, not in the input; grouping only
+    # changes evaluation order, output keeps input order
+    order = sorted(range(len(records)), key=lambda i: tuple(str(records[i].get(k) or "") for k in ("season", "crop", "variety", "language")))
+    results = [None] * len(records)
+    for i in order:
+        results[i] = advise(records[i])
+    return results
+
+
+def chunked(records, size: int):
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_chunks(records, chunk_size: int, workers: int, as_of: date):
+    # Small inputs never pay for a pool: one chunk is handled in-process
+    chunks = chunked(records, chunk_size)
+    first = next(chunks, None)
+    if first is None:
+        return
+    second = next(chunks, None)
+    if second is None or workers <= 1:
+        load(as_of)
+        yield advise_chunk(first)
+        if second is not None:
+            yield advise_chunk(second)
+            for chunk in chunks:
+                yield advise_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=load, initargs=(as_of,)) as pool:
+        # At most 2 chunks per worker in flight, so memory stays flat however long the input is
+        pending = [pool.submit(advise_chunk, first), pool.submit(advise_chunk, second)]
+        for chunk in chunks:
+            if len(pending) >= workers * 2:
+                yield pending.pop(0).result()
+            pending.append(pool.submit(advise_chunk, chunk))
+        for future in pending:
+            yield future.result()
+
+
+class Writer:
+    def __init__(self, path: str):
+        self.jsonl = path.endswith(".jsonl")
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        if not self.jsonl:
+            self.csv = csv.DictWriter(self.file, fieldnames=OUTPUT_FIELDS)
+            self.csv.writeheader()
+
+    def write_batch(self, results: list) -> None:
+        if self.jsonl:
+            self.file.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in results))
+        else:
+            self.csv.writerows({**r, "critical_actions": " | ".join(r.get("critical_actions") or ())} for r in results)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def main_cli(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Write today's operations and critical actions for every farmer in a registry.")
+    parser.add_argument("input", help="farmer registry (.csv or .jsonl)")
+    parser.add_argument("output", help="advisories (.csv or .jsonl)")
+    parser.add_argument("--date", type=date.fromisoformat, default=date.today(), help="advisory date, YYYY-MM-DD (default: today)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes for inputs larger than one chunk")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="records per batch")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    writer = Writer(args.output)
+    total = errors = 0
+    try:
+        for results in run_chunks(read_records(args.input), args.chunk_size, args.workers, args.date):
+            writer.write_batch(results)
+            total += len(results)
+            errors += sum(1 for r in results if r.get("error"))
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - started
+
+    rate = total / elapsed if elapsed else 0.0
+    print(f"Advisories for {args.date}: {total} farmers ({errors} errors) in {elapsed:.2f}s, "
+          f"{rate:,.0f} farmers/s -> {args.output}", file=sys.stderr)
+    return 1 if total and errors == total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
@@ -0,0 +1,174 @@
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from typing import Optional, Tuple
+
+import orjson
+
+from engine import CalendarKey, CalendarRow, CalendarSnapshot, CompiledWeek, LocalizedTexts, LocalizedWeek, normalize, source_version
+
+# Layout: header | index (orjson) | one orjson record per variety | one orjson text map per fragment.
+# The index holds the fragment table (flags, stage and the span of its texts) and
+# (season, crop, variety, offset, length) for every record in table order. Records are
+# [month, [4 fragment numbers]] lists; text maps ({language: [text, headline, categories...]},
+# in LocalizedWeek field order) stay in the mapping, so every worker shares them through the
+# page cache and only decodes the languages it serves. Nothing is categorized at serve time.
+MAGIC = b"CCAL"
+FORMAT_VERSION = 4
+HEADER = struct.Struct("<4sHHQ")  # magic, format version, reserved, index length
+
+
+class MappedWeeks(Mapping):
+    """{language: LocalizedWeek} for one fragment, decoded from the mmapped file on each access.
+
+    LocalizedTexts keeps what it looks up per language, so each entry is decoded about once per worker.
+    """
+
+    def __init__(self, buf: mmap.mmap, start: int, length: int):
+        self._buf = buf
+        self._start = start
+        self._length = length
+
+    def _decode(self) -> dict:
+        return orjson.loads(self._buf[self._start:self._start + self._length])
+
+    def __getitem__(self, language: str) -> LocalizedWeek:
+        return LocalizedWeek(*self._decode()[language])
+
+    def __iter__(self):
+        return iter(self._decode())
+
+    def __len__(self) -> int:
+        return len(self._decode())
+
+
+def encode_fragment(week: CompiledWeek, offset: int, length: int) -> list:
+    return [week.resting, week.critical, week.major, week.stage, offset, length]
+
+
+def decode_fragment(record: list, buf: mmap.mmap, base: int) -> CompiledWeek:
+    resting, critical, major, stage, offset, length = record
+    return CompiledWeek(
+        resting=resting,
+        critical=critical,
+        major=major,
+        stage=stage,
+        localized=LocalizedTexts(MappedWeeks(buf, base + offset, length)),
+    )
+
+
+def write_artifact(path: str, snapshot: CalendarSnapshot, data_version: str) -> int:
+    # Written next to the target and renamed over it, so readers see the old or the new file, never half of one
+    entries = []
+    records = []
+    offset = 0
+    # Weeks are shared objects in the snapshot; number each one the first time it is seen
+    numbers = {}
+    fragments = []
+    texts = []
+    texts_offset = 0
+    for key, (season, crop, variety) in snapshot.names.items():
+        encoded = []
+        for row in snapshot.rows[key]:
+            weeks = []
+            for week in row.weeks:
+                number = numbers.get(id(week))
+                if number is None:
+                    number = numbers[id(week)] = len(fragments)
+                    blob = orjson.dumps({language: list(week.localized.weeks[language]) for language in week.localized.weeks})
+                    fragments.append(encode_fragment(week, texts_offset, len(blob)))
+                    texts.append(blob)
+                    texts_offset += len(blob)
+                weeks.append(number)
+            encoded.append([row.month, weeks])
+        blob = orjson.dumps(encoded)
+        entries.append([season, crop, variety, offset, len(blob)])
+        records.append(blob)
+        offset += len(blob)
+
+    index = orjson.dumps({
+        "format": FORMAT_VERSION,
+        "data_version": data_version,
+        "languages": list(snapshot.languages),
+        "fragments": fragments,
+        "entries": entries,
+        "records_length": offset,
+    })
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(index)))
+        f.write(index)
+        for blob in records:
+            f.write(blob)
+        for blob in texts:
+            f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return HEADER.size + len(index) + offset + texts_offset
+
+
+def artifact_data_version(path: str) -> Optional[str]:
+    # None when the file is missing or unreadable by this build, so callers recompile
+    try:
+        with open(path, "rb") as f:
+            magic, fmt, _, index_length = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or fmt != FORMAT_VERSION:
+                return None
+            return orjson.loads(f.read(index_length))["data_version"]
+    except (OSError, struct.error, orjson.JSONDecodeError, KeyError):
+        return None
+
+
+class ArtifactRows(Mapping):
+    """Read-only view over the mmapped records; rows are decoded on access, never copied up front."""
+
+    def __init__(self, buf: mmap.mmap, base: int, spans: dict, fragments: Tuple[CompiledWeek, ...]):
+        self._buf = buf
+        self._base = base
+        self._spans = spans
+        self._fragments = fragments
+
+    def __getitem__(self, key: CalendarKey) -> Tuple[CalendarRow, ...]:
+        offset, length = self._spans[key]
+        start = self._base + offset
+        return tuple(
+            CalendarRow(month=month, weeks=tuple(self._fragments[n] for n in weeks))
+            for month, weeks in orjson.loads(self._buf[start:start + length])
+        )
+
+    def __iter__(self):
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+
+def load_artifact(path: str) -> CalendarSnapshot:
+    with open(path, "rb") as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, fmt, _, index_length = HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a calendar artifact")
+    if fmt != FORMAT_VERSION:
+        raise ValueError(f"{path} has format v{fmt}; this build reads v{FORMAT_VERSION}")
+
+    index = orjson.loads(buf[HEADER.size:HEADER.size + index_length])
+    names = {}
+    spans = {}
+    for season, crop, variety, offset, length in index["entries"]:
+        key = (normalize(season), normalize(crop), normalize(variety))
+        names[key] = (season, crop, variety)
+        spans[key] = (offset, length)
+
+    base = HEADER.size + index_length
+    texts_base = base + index["records_length"]
+    return CalendarSnapshot.assemble(
+        names,
+        ArtifactRows(buf, base, spans, tuple(decode_fragment(f, buf, texts_base) for f in index["fragments"])),
+        version=source_version(path),
+        data_version=index["data_version"],
+        languages=tuple(index["languages"]),
+    )
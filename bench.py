@@ -0,0 +1,335 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+
+try:
+    import httpx
+except ImportError:  # Dev-only dependency
+    sys.exit("bench.py needs httpx: pip install httpx")
+
+import main
+from engine import CalendarSnapshot, build_static_plan, categorize, fragment_tags
+from migrate import CSV_PATH, read_csv_rows
+
+# Usage:
+#   python bench.py                              synthetic mix, print report
+#   python bench.py --mix requests.jsonl         replay a recorded mix (one JSON request per line)
+#   python bench.py --save-baseline bench.json   record a baseline
+#   python bench.py --compare bench.json         exit 1 if anything is slower than the baseline allows
+#   python bench.py --cold-start                 fresh-process startup (Procfile env) vs. --budget-ms and
+#                                                --first-response-budget-ms, plus an import profile
+
+METRICS_COMPARED = ("p50_ms", "p95_ms", "p99_ms")
+
+# Runs in a fresh interpreter: times the framework import (FastAPI, Starlette, pydantic; a floor this
+# repo can't lower), then `import main`, the lifespan startup and the first /calendar response
+COLD_START_PROBE = """
+import asyncio, json, time
+import httpx
+started = time.perf_counter()
+import fastapi
+framework = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+async def probe():
+    async with main.lifespan(main.app):
+        ready = time.perf_counter()
+        season, crop, variety = next(iter(main.store.current.names.values()))
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.get("/calendar", params={"season": season, "crop": crop, "variety": variety})
+        done = time.perf_counter()
+    print(json.dumps({
+        "status": response.status_code,
+        "framework_ms": (framework - started) * 1000,
+        "import_ms": (imported - framework) * 1000,
+        "startup_ms": (ready - imported) * 1000,
+        "first_request_ms": (done - ready) * 1000,
+        "app_ms": (done - framework) * 1000,
+        "first_response_ms": (done - started) * 1000,
+    }), flush=True)
+
+asyncio.run(probe())
+"""
+
+
+def synthetic_mix(count: int, miss_ratio: float, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    names = list(main.store.current.names.values())
+    languages = main.store.current.languages
+    mix = []
+    for _ in range(count):
+        season, crop, variety = rng.choice(names)
+        mix.append({
+            "season": season,
+            "crop": crop,
+            "variety": variety,
+            "language": rng.choice(languages),
+            "method": rng.choice(("GET", "POST")),
+            # A miss drops the caches first so the request pays for the full build
+            "miss": rng.random() < miss_ratio,
+        })
+    return mix
+
+
+def load_mix(path: str) -> list:
+    mix = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if not {"season", "crop", "variety"} <= record.keys():
+                continue
+            mix.append({
+                "season": record["season"],
+                "crop": record["crop"],
+                "variety": record["variety"],
+                "language": record.get("language", "en"),
+                "method": record.get("method", "GET").upper(),
+                "miss": bool(record.get("miss", False)),
+            })
+    return mix
+
+
+async def send(client: "httpx.AsyncClient", item: dict) -> int:
+    if item["miss"]:
+        main._cache.clear()
+        main._rendered.clear()
+    params = {k: item[k] for k in ("season", "crop", "variety", "language")}
+    if item["method"] == "POST":
+        response = await client.post("/calendar", json=params)
+    else:
+        response = await client.get("/calendar", params=params)
+    return response.status_code
+
+
+def percentile(samples: list, pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_load(mix: list, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=main.app)
+    latencies = []
+    statuses = {}
+    queue = list(reversed(mix))
+
+    async def worker(client):
+        while queue:
+            item = queue.pop()
+            started = time.perf_counter()
+            status = await send(client, item)
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers={"accept-encoding": "gzip"}) as client:
+        await send(client, mix[0])  # Warm-up outside the measured window
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "statuses": {str(k): v for k, v in sorted(statuses.items())},
+    }
+
+
+async def measure_allocations(mix: list, sample: int = 200) -> dict:
+    # Separate pass: tracemalloc slows every allocation, so it never runs during the timed load
+    transport = httpx.ASGITransport(app=main.app)
+    items = mix[:sample]
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await send(client, items[0])
+        tracemalloc.start()
+        peaks = []
+        for item in items:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            await send(client, item)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+        tracemalloc.stop()
+    return {"peak_alloc_kib_per_request": round(statistics.fmean(peaks) / 1024, 1)}
+
+
+def micro_benchmarks(repeat: int = 5) -> dict:
+    rows = list(read_csv_rows(CSV_PATH)) if os.path.exists(CSV_PATH) else []
+    snapshot = main.store.current
+    key = next(iter(snapshot.names))
+    fragments = sorted({f for r in rows for text in r[4:] for f in text.split("|")})
+    now = main.datetime.now()
+
+    def cold_categorize():
+        fragment_tags.cache_clear()
+        for text in (t for r in rows for t in r[4:]):
+            categorize(text, "field")
+
+    cases = {
+        "parse_csv": lambda: list(read_csv_rows(CSV_PATH)),
+        "build_snapshot": lambda: CalendarSnapshot.from_rows(rows),
+        "categorize_cold": cold_categorize,
+        "fragment_tags_cold": lambda: (fragment_tags.cache_clear(), [fragment_tags(f) for f in fragments]),
+        "build_static_plan": lambda: build_static_plan(snapshot.rows[key], *snapshot.names[key], "en"),
+        "render_plan": lambda: main.render_plan(main.resolve_plan(key, "en"), now),
+        "compute_progress": lambda: main.compute_progress(main.resolve_plan(key, "en"), now),
+    }
+    results = {}
+    for name, fn in cases.items():
+        if not rows and name in ("parse_csv", "build_snapshot", "categorize_cold", "fragment_tags_cold"):
+            continue
+        timer = timeit.Timer(fn)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        results[name] = {"us_per_call": round(best * 1e6, 2)}
+    return results
+
+
+def import_profile(top: int = 10) -> list:
+    # `python -X importtime` lines: "import time: self [us] | cumulative | imported package"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                            capture_output=True, text=True, env={**os.environ, "CALENDAR_RELOAD_INTERVAL": "0"})
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        modules.append({"module": name.strip(), "self_ms": round(int(own) / 1000, 1), "cumulative_ms": round(int(cumulative) / 1000, 1)})
+    modules.sort(key=lambda m: m["self_ms"], reverse=True)
+    return modules[:top]
+
+
+def procfile_env(path: str = "Procfile") -> dict:
+    # Leading NAME=value words of the Procfile command, so the probe starts the way production does
+    env = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            words = f.readline().split()
+        if words and words[0].endswith(":"):
+            words = words[1:]  # "web:" process type
+        for word in words:
+            name, sep, value = word.partition("=")
+            if not sep or not name.isidentifier():
+                break
+            env[name] = value
+    return env
+
+
+def cold_start(runs: int, budget_ms: float, first_response_budget_ms: float) -> dict:
+    # Each run is a new process; process_ms adds interpreter startup and the probe's own httpx import
+    env = {**os.environ, **procfile_env(), "CALENDAR_RELOAD_INTERVAL": "0"}
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        proc = subprocess.Popen([sys.executable, "-c", COLD_START_PROBE], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                text=True, env=env)
+        line = proc.stdout.readline()
+        process_ms = (time.perf_counter() - started) * 1000
+        proc.wait()
+        if not line:
+            raise RuntimeError(f"Cold-start probe exited with {proc.returncode}")
+        samples.append({**json.loads(line), "process_ms": process_ms})
+
+    phases = ("framework_ms", "import_ms", "startup_ms", "first_request_ms", "app_ms", "first_response_ms", "process_ms")
+    report = {phase: round(statistics.median(s[phase] for s in samples), 1) for phase in phases}
+    # app_ms is what this repo adds on top of the framework import; first_response_ms is what a
+    # client waiting on a fresh worker sees, framework included
+    budgets = {"app_ms": budget_ms, "first_response_ms": first_response_budget_ms}
+    over_budget = [phase for phase, limit in budgets.items() if report[phase] > limit]
+    report.update(
+        runs=runs,
+        statuses=sorted({s["status"] for s in samples}),
+        source=main.ARTIFACT_PATH if os.path.exists(main.ARTIFACT_PATH) else main.DB_PATH,
+        prewarm=env.get("CALENDAR_PREWARM", "1"),
+        budgets_ms=budgets,
+        over_budget=over_budget,
+        within_budget=not over_budget,
+        slowest_imports=import_profile(),
+    )
+    return report
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for metric in METRICS_COMPARED:
+        old, new = baseline["load"].get(metric), report["load"].get(metric)
+        if old and new > old * (1 + tolerance):
+            regressions.append(f"load.{metric}: {old} -> {new}")
+    old, new = baseline["load"].get("throughput_rps"), report["load"]["throughput_rps"]
+    if old and new < old * (1 - tolerance):
+        regressions.append(f"load.throughput_rps: {old} -> {new}")
+    for name, result in report["micro"].items():
+        old = baseline["micro"].get(name, {}).get("us_per_call")
+        if old and result["us_per_call"] > old * (1 + tolerance):
+            regressions.append(f"micro.{name}: {old}us -> {result['us_per_call']}us")
+    return regressions
+
+
+async def run(args) -> int:
+    logging.getLogger("CropCalendarAPI").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    async with main.lifespan(main.app):
+        mix = load_mix(args.mix) if args.mix else synthetic_mix(args.requests, args.miss_ratio)
+        if not mix:
+            print("No requests to replay.")
+            return 1
+        report = {
+            "load": await run_load(mix, args.concurrency),
+            "allocations": await measure_allocations(mix),
+            "micro": micro_benchmarks(),
+        }
+
+    print(json.dumps(report, indent=2))
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.save_baseline}")
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} of {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-test and micro-benchmark the calendar API in-process.")
+    parser.add_argument("--mix", help="JSONL request log to replay (season, crop, variety[, language, method, miss])")
+    parser.add_argument("--requests", type=int, default=2000, help="synthetic request count")
+    parser.add_argument("--miss-ratio", type=float, default=0.05, help="share of synthetic requests that start cold")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown before failing")
+    parser.add_argument("--cold-start", action="store_true", help="measure fresh-process startup instead of load")
+    parser.add_argument("--runs", type=int, default=5, help="cold-start processes to spawn")
+    parser.add_argument("--budget-ms", type=float, default=150,
+                        help="cold-start budget for app_ms: import main (after FastAPI itself), startup and the first /calendar response")
+    parser.add_argument("--first-response-budget-ms", type=float, default=300,
+                        help="cold-start budget for first_response_ms: the same, including the FastAPI import")
+    args = parser.parse_args()
+    if args.cold_start:
+        report = cold_start(args.runs, args.budget_ms, args.first_response_budget_ms)
+        print(json.dumps(report, indent=2))
+        sys.exit(0 if report["within_budget"] else 1)
+    sys.exit(asyncio.run(run(args)))
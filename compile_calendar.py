@@ -0,0 +1,27 @@
+import os
+
+from artifact import FORMAT_VERSION, write_artifact
+from engine import CalendarSnapshot
+from migrate import CSV_PATH, TRANSLATIONS_PATH, read_csv_rows, read_translations, source_digest
+
+ARTIFACT_PATH = os.environ.get("CALENDAR_ARTIFACT", "calendar.bin")
+
+def compile_calendar(csv_path: str = CSV_PATH, artifact_path: str = ARTIFACT_PATH, translations_path: str = TRANSLATIONS_PATH) -> str:
+    if not os.path.exists(csv_path):
+        print(f"Error: {csv_path} not found. Run generate_bilingual.py first.")
+        return ""
+
+    # Flags, stages and every language's text are baked in; the API only slices and decodes records
+    data_version = source_digest(csv_path, translations_path)
+    try:
+        snapshot = CalendarSnapshot.from_rows(read_csv_rows(csv_path), read_translations(translations_path), data_version=data_version)
+    except ValueError as e:
+        print(f"Error: {csv_path}: {e}")
+        return ""
+    size = write_artifact(artifact_path, snapshot, data_version)
+    print(f"Compiled {len(snapshot.names)} varieties in {', '.join(snapshot.languages)}: {csv_path} -> {artifact_path} "
+          f"(format v{FORMAT_VERSION}, data {data_version}, {size} bytes)")
+    return data_version
+
+if __name__ == "__main__":
+    compile_calendar()
@@ -0,0 +1,139 @@
+import asyncio
+import os
+import sqlite3
+import time
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, List, Tuple
+from urllib.parse import quote
+
+if TYPE_CHECKING:
+    import aiosqlite
+
+
+def readonly_uri(db_path: str, immutable: bool = False) -> str:
+    # Quoted, so "?", "#" and "%" in the path name the file instead of URI parts
+    uri = f"file:{quote(os.path.abspath(db_path))}?mode=ro"
+    return uri + "&immutable=1" if immutable else uri
+
+
+class Database:
+    """Bounded pool of read-only aiosqlite connections.
+
+    Connections are opened in `mode=ro` with mmap and page-cache tuning and reused, so the
+    per-connection statement cache keeps queries prepared. `connection()` always releases.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        size: int = 4,
+        mmap_size: int = 64 * 1024 * 1024,
+        cache_kib: int = 8 * 1024,
+        immutable: bool = False,
+        health_check_after: float = 30.0,
+    ):
+        self.db_path = db_path
+        self.size = size
+        self.mmap_size = mmap_size
+        self.cache_kib = cache_kib
+        # immutable=1 skips locking entirely; only safe when the file is replaced, never edited in place
+        self.immutable = immutable
+        self.health_check_after = health_check_after
+        self._idle: List[Tuple["aiosqlite.Connection", int, float]] = []
+        self._slots = None
+        self._generation = 0
+        self.in_use = 0
+        self.created = 0
+        self.discarded = 0
+        self.waits = 0
+        self.acquisitions = 0
+
+    async def _open(self) -> "aiosqlite.Connection":
+        # Imported on first use: servers reading the artifact never open a connection
+        import aiosqlite
+        conn = await aiosqlite.connect(readonly_uri(self.db_path, self.immutable), uri=True, cached_statements=128)
+        conn.row_factory = aiosqlite.Row
+        # Read-side tuning only; the serving process never writes
+        await conn.execute("PRAGMA query_only=ON")
+        await conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        await conn.execute(f"PRAGMA cache_size=-{int(self.cache_kib)}")
+        await conn.execute("PRAGMA temp_store=MEMORY")
+        self.created += 1
+        return conn
+
+    async def _healthy(self, conn: "aiosqlite.Connection") -> bool:
+        try:
+            async with conn.execute("SELECT 1") as cursor:
+                await cursor.fetchone()
+            return True
+        except (sqlite3.Error, ValueError):
+            return False
+
+    async def _discard(self, conn: "aiosqlite.Connection") -> None:
+        self.discarded += 1
+        try:
+            await conn.close()
+        except (sqlite3.Error, ValueError):
+            pass
+
+    @asynccontextmanager
+    async def connection(self):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        if self._slots.locked():
+            self.waits += 1
+        await self._slots.acquire()
+        self.acquisitions += 1
+        self.in_use += 1
+        conn = None
+        generation = self._generation
+        broken = False
+        try:
+            while self._idle and conn is None:
+                conn, generation, last_used = self._idle.pop()
+                if time.monotonic() - last_used > self.health_check_after and not await self._healthy(conn):
+                    await self._discard(conn)
+                    conn = None
+            if conn is None:
+                generation = self._generation
+                conn = await self._open()
+            yield conn
+        except (sqlite3.DatabaseError, ValueError) as e:
+            # Query mistakes leave the connection usable; corruption or a closed connection does not
+            broken = not isinstance(e, (sqlite3.OperationalError, sqlite3.ProgrammingError, sqlite3.IntegrityError))
+            raise
+        finally:
+            self.in_use -= 1
+            self._slots.release()
+            if conn is not None:
+                # Connections from before a reset() point at the old file and are not reused
+                if broken or generation != self._generation:
+                    await self._discard(conn)
+                else:
+                    self._idle.append((conn, generation, time.monotonic()))
+
+    async def fetch_all(self, query: str, params: tuple = ()):
+        async with self.connection() as conn:
+            async with conn.execute(query, params) as cursor:
+                return await cursor.fetchall()
+
+    async def reset(self) -> None:
+        # Call after the database file is replaced so new checkouts open the new file
+        self._generation += 1
+        idle, self._idle = self._idle, []
+        for conn, _, _ in idle:
+            await self._discard(conn)
+
+    async def close(self) -> None:
+        await self.reset()
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "in_use": self.in_use,
+            "created": self.created,
+            "discarded": self.discarded,
+            "acquisitions": self.acquisitions,
+            "waits": self.waits,
+        }
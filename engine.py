@@ -0,0 +1,572 @@
+import calendar
+import difflib
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel
+
+# Columns pulled once at startup; rows are kept in CSV order (position ASC). Weeks are fragment ids
+SNAPSHOT_QUERY = """
+    SELECT season, crop, variety, month, week_1, week_2, week_3, week_4
+    FROM crop_calendar
+    ORDER BY position ASC
+"""
+
+# One row per (fragment, language): the English source text plus every translation
+FRAGMENTS_QUERY = """
+    SELECT id, 'en', source FROM fragment
+    UNION ALL
+    SELECT fragment_id, language, text FROM fragment_translation
+"""
+
+# Stamped by migrate.py in the same transaction as the rows
+DATA_VERSION_QUERY = "SELECT value FROM calendar_meta WHERE key = 'data_version'"
+
+CalendarKey = Tuple[str, str, str]
+
+WILDCARD = "*"
+
+DEFAULT_LANGUAGE = "en"
+
+# Languages CAT_MAP has keywords for; other languages borrow categories from the English text
+KEYWORD_LANGUAGES = ("en", "kn")
+
+# Keywords for categorization
+CAT_MAP = {
+    "irrigation": ["💧", "water", "irrigate", "moist", "drain", "flooded", "remove water", "stop watering", "ನೀರು", "ನೀರಾವರಿ"],
+    "fertilizer": ["🧪", "Urea", "DAP", "Potash", "NPK", "Zinc", "MgSO4", "Borax", "Gypsum", "Basal", "compost", "manure", "Nitrogen", "Growth Dose", "ಗೊಬ್ಬರ", "ಯೂರಿಯಾ"],
+    "weed": ["Weed", "weeder", "pendimethalin", "ಕಳೆ"],
+    "protection": ["🔎", "⚠️", "Scout", "Spray", "BSFB", "Blast", "Stem Borer", "Aphids", "Whitefly", "Gall Midge", "BPH", "Tikka", "Rust", "Mosaic", "fungicide", "insecticide", "ಪರಿಶೀಲಿಸಿ", "ಸಿಂಪಡಿಸಿ"],
+    "field": ["🚜", "📅", "✂️", "Tractor", "Labor", "Thresher", "Land prep", "puddling", "Transplant", "Sow", "Harvest", "Cut", "Collect", "Dry", "Store", "ಟ್ರಾಕ್ಟರ್", "ಕಾರ್ಮಿಕ", "ಬಿತ್ತನೆ", "ನಾಟಿ", "ಕೊಯ್ಲು"]
+}
+
+# Response field -> CAT_MAP category
+CATEGORY_FIELDS = (
+    ("field_operation", "field"),
+    ("irrigation", "irrigation"),
+    ("fertilizer", "fertilizer"),
+    ("weed_management", "weed"),
+    ("protection", "protection"),
+)
+
+# One compiled alternation per category (longest keyword first), built once at import
+CATEGORY_PATTERNS = {
+    category: re.compile("|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)), re.IGNORECASE)
+    for category, keywords in CAT_MAP.items()
+}
+
+# Checked in order, first match wins
+STAGE_RULES = (
+    ("Harvest", re.compile("harvest|cut|store", re.IGNORECASE)),
+    ("Maturity", re.compile("mature|yellow|stop watering", re.IGNORECASE)),
+    ("Reproductive", re.compile("flower|panicle|grain forming|pod", re.IGNORECASE)),
+    ("Vegetative", re.compile("transplant|sow|nursery|land prep", re.IGNORECASE)),
+)
+
+RESTING = re.compile("resting", re.IGNORECASE)
+CRITICAL = re.compile("⚠️|critical", re.IGNORECASE)
+MAJOR_OPERATION = re.compile("📅|🚜")
+# Day 0 for sowing-date progress is the first week seed goes in: the nursery for transplanted crops
+# (trays, beds, "plants ready"), the field otherwise. Transplanting and "after sowing" never anchor it
+SOWING = re.compile(r"(?<!after )\bsow|\btrays?\b|\bnursery\b|plants ready|seedlings ready", re.IGNORECASE)
+
+
+def normalize(value: str) -> str:
+    # Case/whitespace-insensitive key, mirrors the old LOWER(...) comparisons
+    return " ".join(value.split()).lower()
+
+
+def loose(value: str) -> str:
+    # Punctuation/space-insensitive form used for variety matching: "MO 4" == "mo-4" == "MO4"
+    return re.sub(r"[\W_]+", "", value.lower())
+
+
+def variety_aliases(name: str) -> Tuple[str, ...]:
+    # "MO-4 (Bhadra) [Coastal Zone 10]" -> "mo4", "bhadra"; bracketed zone notes are not names
+    base = re.split(r"[(\[]", name)[0]
+    return tuple(a for a in map(loose, (base, *re.findall(r"\(([^)]*)\)", name))) if a)
+
+
+class Resolution(NamedTuple):
+    key: Optional[CalendarKey]
+    message: str = ""
+    candidates: Tuple[str, ...] = ()
+
+
+class VarietyCatalog:
+    """Canonical (season, crop, variety) names with aliases and suggestions; every lookup is a dict hit."""
+
+    def __init__(self, names: Mapping[CalendarKey, CalendarKey]):
+        self.names = names
+        self.seasons = {}
+        self.crops = {}
+        self.varieties = {}
+        self.exact = {}
+        aliases = {}
+        for key, (season, crop, variety) in names.items():
+            self.seasons.setdefault(key[0], season)
+            self.crops.setdefault(key[:2], crop)
+            self.varieties.setdefault(key[:2], []).append(variety)
+            self.exact[(key[0], key[1], loose(variety))] = key
+            for alias in variety_aliases(variety):
+                aliases.setdefault((key[0], key[1], alias), set()).add(key)
+
+        # Aliases that exactly name another variety, or that name several, never resolve on their own
+        self.aliases = {a: next(iter(keys)) for a, keys in aliases.items() if len(keys) == 1 and a not in self.exact}
+        self.ambiguous = {
+            a: tuple(names[k][2] for k in sorted(keys, key=lambda k: self.varieties[k[:2]].index(names[k][2])))
+            for a, keys in aliases.items() if len(keys) > 1 and a not in self.exact
+        }
+
+    def resolve(self, season: str, crop: str, variety: str) -> Resolution:
+        season_key, crop_key = normalize(season), normalize(crop)
+        if season_key not in self.seasons:
+            return Resolution(None, f"Unknown season '{season}'.", suggest(season, self.seasons.values()))
+        if (season_key, crop_key) not in self.crops:
+            crops = [c for (s, _), c in self.crops.items() if s == season_key]
+            return Resolution(None, f"No '{crop}' calendar in {self.seasons[season_key]}.", suggest(crop, crops))
+
+        wanted = (season_key, crop_key, loose(variety))
+        key = self.exact.get(wanted) or self.aliases.get(wanted)
+        if key:
+            return Resolution(key)
+        if wanted in self.ambiguous:
+            return Resolution(None, f"Variety '{variety}' is ambiguous.", self.ambiguous[wanted])
+        return Resolution(
+            None,
+            f"Unknown variety '{variety}' for {self.crops[(season_key, crop_key)]} in {self.seasons[season_key]}.",
+            suggest(variety, self.varieties[(season_key, crop_key)])
+        )
+
+
+def suggest(value: str, names: Iterable[str], limit: int = 5) -> Tuple[str, ...]:
+    # Containment matches first, then close spellings; fall back to listing everything
+    names = list(names)
+    by_loose = {loose(n): n for n in names}
+    needle = loose(value)
+    contained = [n for k, n in by_loose.items() if needle and (needle in k or k in needle)]
+    close = [by_loose[k] for k in difflib.get_close_matches(needle, by_loose, n=limit, cutoff=0.5)]
+    picked = list(dict.fromkeys(contained + close))[:limit]
+    return tuple(picked or names[:limit])
+
+
+def resolve_language(language: str, available: Iterable[str] = KEYWORD_LANGUAGES) -> str:
+    # Unknown languages fall back to English rather than failing the request
+    code = language.strip().lower()
+    return code if code in available else DEFAULT_LANGUAGE
+
+
+@lru_cache(maxsize=4096)
+def fragment_tags(fragment: str) -> FrozenSet[str]:
+    # Categories a single `|` fragment belongs to; each unique fragment is scanned once
+    return frozenset(c for c, pattern in CATEGORY_PATTERNS.items() if pattern.search(fragment))
+
+
+def categorize(text: str, category: str, source: Optional[str] = None) -> str:
+    # `source` is the English text; when its `|` fragments line up with `text`'s, their tags count too
+    if not text or RESTING.search(text) or "ವಿಶ್ರಾಂತಿ" in text:
+        return "No specific activity"
+    fragments = text.split("|")
+    aligned = source.split("|") if source is not None else []
+    if len(aligned) != len(fragments):
+        aligned = [""] * len(fragments)
+    relevant = [f.strip() for f, s in zip(fragments, aligned) if category in fragment_tags(f) | fragment_tags(s)]
+    return " | ".join(relevant) if relevant else "Standard care"
+
+
+def infer_stage(text: str) -> str:
+    for stage, pattern in STAGE_RULES:
+        if pattern.search(text):
+            return stage
+    return "Vegetative" # Default
+
+
+class LocalizedWeek(NamedTuple):
+    text: str
+    headline: str
+    field_operation: str
+    irrigation: str
+    fertilizer: str
+    weed_management: str
+    protection: str
+
+
+def localize(texts: Mapping[str, str]) -> Dict[str, LocalizedWeek]:
+    # {language: text} -> {language: LocalizedWeek}; languages without keyword rules borrow the English tags
+    return {
+        language: LocalizedWeek(
+            text,
+            text.split("|")[0].strip(),
+            *(categorize(text, category, None if language in KEYWORD_LANGUAGES else texts[DEFAULT_LANGUAGE]) for _, category in CATEGORY_FIELDS)
+        )
+        for language, text in texts.items()
+    }
+
+
+class LocalizedTexts(Mapping):
+    """language -> LocalizedWeek for one fragment, categorized when the snapshot is compiled.
+
+    Languages without a translation get the English entry. `weeks` may decode on access
+    (artifact.MappedWeeks), so each language is looked up there once and kept.
+    """
+
+    def __init__(self, weeks: Mapping[str, LocalizedWeek]):
+        self.weeks = weeks
+        self._cache: Dict[str, LocalizedWeek] = {}
+
+    def __getitem__(self, language: str) -> LocalizedWeek:
+        week = self._cache.get(language)
+        if week is None:
+            week = self.weeks.get(language)
+            if week is None:
+                week = self[DEFAULT_LANGUAGE]
+            self._cache[language] = week
+        return week
+
+    def __iter__(self):
+        return iter(self.weeks)
+
+    def __len__(self) -> int:
+        return len(self.weeks)
+
+
+@dataclass(frozen=True)
+class CompiledWeek:
+    """One unique week text, flagged and staged once per snapshot and shared by every row that uses it."""
+
+    resting: bool
+    critical: bool
+    major: bool
+    stage: str
+    localized: LocalizedTexts
+
+    @classmethod
+    def compile(cls, texts: Mapping[str, str]) -> "CompiledWeek":
+        # Flags and stage come from the English text; categories from each display language, all up front
+        raw_en = texts[DEFAULT_LANGUAGE]
+        return cls(
+            resting=bool(RESTING.search(raw_en)),
+            critical=bool(CRITICAL.search(raw_en)),
+            major=bool(MAJOR_OPERATION.search(raw_en)),
+            stage=infer_stage(raw_en),
+            localized=LocalizedTexts(MappingProxyType(localize(texts))),
+        )
+
+
+def translate_cell(text: str, table: Mapping[str, str]) -> Optional[str]:
+    # Whole-cell entry first, then fragment by fragment; partial coverage counts as untranslated
+    if text in table:
+        return table[text]
+    fragments = [f.strip() for f in text.split("|")]
+    if all(f in table for f in fragments):
+        return " | ".join(table[f] for f in fragments)
+    return None
+
+
+def intern_fragments(
+    rows: Iterable, translations: Optional[Mapping[str, Mapping[str, str]]] = None
+) -> Tuple[List[tuple], Dict[int, Dict[str, str]]]:
+    """Split 12-column CSV rows into (season, crop, variety, month, 4 fragment ids) rows
+    plus {fragment id: {language: text}}, one fragment per unique English week text.
+
+    Kannada comes from the CSV's _kn columns; `translations` ({language: {English: text}}) adds
+    or overrides languages. Raises ValueError when rows give one English text different
+    Kannada cells, naming the rows (numbered as in the CSV, header = row 1).
+    """
+    ids: Dict[str, int] = {}
+    fragments: Dict[int, Dict[str, str]] = {}
+    # English text -> {Kannada cell: rows using it}; empty cells don't count
+    kannada: Dict[str, Dict[str, List[int]]] = {}
+    id_rows = []
+    for row_number, r in enumerate(rows, start=2):
+        week_ids = []
+        for en, kn in zip(r[4:8], r[8:12]):
+            fragment_id = ids.get(en)
+            if fragment_id is None:
+                fragment_id = ids[en] = len(ids) + 1
+                texts = {DEFAULT_LANGUAGE: en}
+                for language, table in (translations or {}).items():
+                    text = translate_cell(en, table)
+                    if text:
+                        texts[language] = text
+                fragments[fragment_id] = texts
+            if kn:
+                variants = kannada.setdefault(en, {})
+                if not variants and "kn" not in fragments[fragment_id]:
+                    fragments[fragment_id]["kn"] = kn
+                rows_using = variants.setdefault(kn, [])
+                if not rows_using or rows_using[-1] != row_number:
+                    rows_using.append(row_number)
+            week_ids.append(fragment_id)
+        id_rows.append((r[0], r[1], r[2], r[3], *week_ids))
+
+    # A fragment has one Kannada text; silently keeping the first row's would drop edits to the others
+    conflicts = [
+        f"  {en!r}: " + "; ".join(f"row{'s' if len(numbers) > 1 else ''} {', '.join(map(str, numbers))} -> {kn!r}" for kn, numbers in variants.items())
+        for en, variants in kannada.items() if len(variants) > 1
+    ]
+    if conflicts:
+        raise ValueError(f"{len(conflicts)} English week texts have different Kannada cells; make every row that uses one agree:\n" + "\n".join(conflicts))
+    return id_rows, fragments
+
+
+def ordered_languages(languages: Iterable[str]) -> Tuple[str, ...]:
+    return (DEFAULT_LANGUAGE, *sorted(set(languages) - {DEFAULT_LANGUAGE}))
+
+
+@dataclass(frozen=True)
+class CalendarRow:
+    month: str
+    weeks: Tuple[CompiledWeek, ...]
+
+
+@dataclass(frozen=True)
+class CalendarSnapshot:
+    """Immutable, indexed copy of the crop_calendar table."""
+
+    version: Optional[int] = None
+    # Content identity of the source data (e.g. the artifact's CSV digest); None when unknown
+    data_version: Optional[str] = None
+    rows: Mapping[CalendarKey, Tuple[CalendarRow, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    # (season, crop) -> normalized variety keys, in table order
+    varieties: Mapping[Tuple[str, str], Tuple[str, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    # normalized key -> (season, crop, variety) as spelled in the table
+    names: Mapping[CalendarKey, CalendarKey] = field(default_factory=lambda: MappingProxyType({}))
+    catalog: VarietyCatalog = field(default_factory=lambda: VarietyCatalog({}))
+    # Display languages, English first; anything else requested resolves to English
+    languages: Tuple[str, ...] = (DEFAULT_LANGUAGE,)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable,
+        translations: Optional[Mapping[str, Mapping[str, str]]] = None,
+        version: Optional[int] = None,
+        data_version: Optional[str] = None,
+    ) -> "CalendarSnapshot":
+        # 12-column CSV rows (see migrate.read_csv_rows)
+        id_rows, fragments = intern_fragments(rows, translations)
+        return cls.from_fragments(id_rows, fragments, version=version, data_version=data_version)
+
+    @classmethod
+    def from_fragments(
+        cls,
+        rows: Iterable,
+        fragments: Mapping[int, Mapping[str, str]],
+        version: Optional[int] = None,
+        data_version: Optional[str] = None,
+    ) -> "CalendarSnapshot":
+        # rows: (season, crop, variety, month, 4 fragment ids); each fragment is compiled once
+        compiled = {fragment_id: CompiledWeek.compile(texts) for fragment_id, texts in fragments.items()}
+        grouped = {}
+        names = {}
+        for r in rows:
+            key = (normalize(r[0]), normalize(r[1]), normalize(r[2]))
+            names.setdefault(key, (r[0], r[1], r[2]))
+            grouped.setdefault(key, []).append(CalendarRow(month=r[3], weeks=tuple(compiled[f] for f in r[4:8])))
+
+        rows_by_key = MappingProxyType({k: tuple(v) for k, v in grouped.items()})
+        languages = ordered_languages(language for texts in fragments.values() for language in texts)
+        return cls.assemble(names, rows_by_key, version=version, data_version=data_version, languages=languages)
+
+    @classmethod
+    def assemble(
+        cls,
+        names: Mapping[CalendarKey, CalendarKey],
+        rows: Mapping[CalendarKey, Tuple[CalendarRow, ...]],
+        version: Optional[int] = None,
+        data_version: Optional[str] = None,
+        languages: Tuple[str, ...] = (DEFAULT_LANGUAGE,),
+    ) -> "CalendarSnapshot":
+        # `names` must be in table order; it drives variety ordering and the catalog
+        order = {}
+        for season, crop, variety in names:
+            order.setdefault((season, crop), []).append(variety)
+
+        return cls(
+            version=version,
+            data_version=data_version,
+            rows=rows,
+            varieties=MappingProxyType({k: tuple(v) for k, v in order.items()}),
+            names=MappingProxyType(dict(names)),
+            catalog=VarietyCatalog(names),
+            languages=languages,
+        )
+
+    def resolve_language(self, language: str) -> str:
+        return resolve_language(language, self.languages)
+
+    def expand(self, season: str, crop: str, variety: str) -> Tuple[CalendarKey, ...]:
+        # Display names of every variety matching a request where crop and/or variety may be "*"
+        season_key, crop_key, variety_key = normalize(season), normalize(crop), normalize(variety)
+        return tuple(
+            self.names[(s, c, v)]
+            for (s, c), keys in self.varieties.items()
+            if s == season_key and crop_key in (WILDCARD, c)
+            for v in keys
+            if variety_key in (WILDCARD, v)
+        )
+
+
+def source_version(db_path: str) -> Optional[int]:
+    try:
+        return os.stat(db_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class SnapshotHolder:
+    """Holds the live snapshot. Readers grab `.current` once; reloads swap the reference."""
+
+    def __init__(self):
+        self.current = CalendarSnapshot()
+
+    def swap(self, snapshot: CalendarSnapshot) -> CalendarSnapshot:
+        previous, self.current = self.current, snapshot
+        return previous
+
+
+# Plans: the date-independent calendar for one variety in one language, shared by the API and advisory.py
+class WeeklyActivity(BaseModel):
+    week_number: int
+    field_operation: str
+    irrigation: str
+    fertilizer: str
+    weed_management: str
+    protection: str
+    stage: str
+
+
+class MonthlyActivity(BaseModel):
+    month: str
+    major_operations: List[str]
+    critical_actions: List[str]
+    weeks: List[WeeklyActivity]
+
+
+MONTH_MAP = {name: i for i, name in enumerate(calendar.month_name) if name}
+
+
+class StaticPlan(NamedTuple):
+    # Date-independent part of a calendar response; safe to cache until the snapshot changes
+    context: dict
+    timeline: List[MonthlyActivity]
+    summary_by_month: dict
+    total_weeks: int
+    start_month_idx: int
+    week_index: Dict[int, WeeklyActivity]
+    sowing_week: int
+    # Day offset from the start of week 1 -> that week; sowing-date lookups index straight into it
+    days: tuple
+
+
+def build_static_plan(rows, season: str, crop: str, variety: str, language: str) -> StaticPlan:
+    global_week_count = 1
+    processed_timeline = []
+    summary_by_month = {}
+    week_index = {}
+    sowing_week = None
+
+    # Categories and stages are precomputed in the snapshot; this is pure assembly
+    for row in rows:
+        month_name = row.month
+        weeks = []
+        major_ops = []
+        critical_actions = []
+
+        for compiled in row.weeks:
+            if compiled.resting:
+                continue
+
+            # Missing translations give English
+            loc = compiled.localized[language]
+            # Check for critical icons
+            if compiled.critical:
+                critical_actions.append(loc.text)
+            if compiled.major:
+                # Filter major ops to be unique and concise
+                major_ops.append(loc.headline)
+
+            week = WeeklyActivity(
+                week_number=global_week_count,
+                field_operation=loc.field_operation,
+                irrigation=loc.irrigation,
+                fertilizer=loc.fertilizer,
+                weed_management=loc.weed_management,
+                protection=loc.protection,
+                stage=compiled.stage
+            )
+            weeks.append(week)
+            week_index[global_week_count] = week
+            if sowing_week is None and SOWING.search(compiled.localized[DEFAULT_LANGUAGE].text):
+                sowing_week = global_week_count
+            global_week_count += 1
+
+        if weeks:
+            processed_timeline.append(MonthlyActivity(
+                month=month_name,
+                major_operations=list(set(major_ops))[:3], # Top 3
+                critical_actions=list(set(critical_actions))[:2], # Top 2
+                weeks=weeks
+            ))
+            summary_by_month[month_name] = f"{len([w for w in weeks if w.stage != 'No activity'])} active weeks"
+
+    # For simplicity, we assume the first month of the list is the start of the crop
+    start_month_name = processed_timeline[0].month if processed_timeline else "June"
+
+    return StaticPlan(
+        context={
+            "selected_season": season,
+            "selected_crop": crop,
+            "selected_variety": variety,
+            "total_duration_weeks": global_week_count - 1,
+            "language": language
+        },
+        timeline=processed_timeline,
+        summary_by_month=summary_by_month,
+        total_weeks=global_week_count - 1,
+        start_month_idx=MONTH_MAP.get(start_month_name, 6),
+        week_index=week_index,
+        sowing_week=sowing_week or 1,
+        days=tuple(week_index[n] for n in sorted(week_index) for _ in range(7))
+    )
+
+
+def locate_week(plan: StaticPlan, day_offset: int):
+    # (status, week) for a day offset from sowing, straight from the plan's day table
+    if not plan.days:
+        return "upcoming", None
+    day = (plan.sowing_week - 1) * 7 + day_offset
+    if day_offset < 0:
+        # Not sown yet: the preparation week it falls in, if the calendar starts that early
+        return "upcoming", plan.days[max(day, 0)]
+    if day >= len(plan.days):
+        return "completed", plan.days[-1]
+    return "in_progress", plan.days[day]
+
+
+def sowing_status(plan: StaticPlan, sowing_date: date, as_of: date):
+    # (day offset, status, week) as of a date; the progress endpoint and advisory.py both read this
+    day_offset = (as_of - sowing_date).days
+    return (day_offset, *locate_week(plan, day_offset))
+
+
+def cache_key_for(key: CalendarKey, language: str) -> str:
+    # Keyed on the resolved catalog entry, so aliases and spellings share one cache slot
+    return f"op:{language}:{':'.join(key)}"
+
+
+def resolve_plan(snapshot: CalendarSnapshot, key: CalendarKey, language: str, cache, build=build_static_plan) -> StaticPlan:
+    # cache: anything with get/set (cache.TTLCache); each (entry, language) is built at most once per snapshot
+    language = snapshot.resolve_language(language)
+    cache_key = cache_key_for(key, language)
+    plan = cache.get(cache_key)
+    if plan is None:
+        plan = build(snapshot.rows[key], *snapshot.names[key], language)
+        cache.set(cache_key, plan)
+    return plan
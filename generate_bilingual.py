@@ -1,193 +1,385 @@
+import argparse
 import csv
-import io
-
-def translate_text(text):
-    if not text or text.strip() == "" or text.strip().lower() == "field resting":
-        return "ಜಮೀನಿಗೆ ವಿಶ್ರಾಂತಿ"
-    
-    # Mapping of common English fragments to Kannada
-    mapping = {
-        "Book Tractor & Labor": "ಟ್ರಾಕ್ಟರ್ ಮತ್ತು ಕಾರ್ಮಿಕರನ್ನು ಬುಕ್ ಮಾಡಿ",
-        "Check Weather": "ಹವಾಮಾನವನ್ನು ಪರಿಶೀಲಿಸಿ",
-        "Land prep & puddling": "ಭೂಮಿ ಸಿದ್ಧತೆ ಮತ್ತು ಹದಗೊಳಿಸುವಿಕೆ",
-        "Green Manuring": "ಹಸಿರು ಗೊಬ್ಬರ ಬಳಕೆ",
-        "Get small plants ready in trays or bed": "ಸಣ್ಣ ಸಸಿಗಳನ್ನು ಸಿದ್ಧಪಡಿಸಿಕೊಳ್ಳಿ (ಟ್ರೇ ಅಥವಾ ಮಡಿಗಳಲ್ಲಿ)",
-        "Soil testing & compost application": "ಮಣ್ಣಿನ ಪರೀಕ್ಷೆ ಮತ್ತು ಕೊಟ್ಟಿಗೆ ಗೊಬ್ಬರ ಬಳಕೆ",
-        "Care for Seedlings": "ಸಸಿಗಳ ಆರೈಕೆ ಮಾಡಿ",
-        "Transplant (15-18d)": "15-18 ದಿನಗಳ ಸಸಿಗಳನ್ನು ನಾಟಿ ಮಾಡಿ",
-        "Apply Basal Mixture (Urea+DAP+Potash)": "ನಾಟಿ ಸಮಯದಲ್ಲಿ ಯೂರಿಯಾ, ಡಿಎಪಿ ಮತ್ತು ಪೊಟ್ಯಾಶ್ ಮಿಶ್ರಣವನ್ನು ಹಾಕಿ",
-        "Apply 8 kg/Acre Zinc": "ಎಕರೆಗೆ 8 ಕೆಜಿ ಜಿಂಕ್ ಸಲ್ಫೇಟ್ ಹಾಕಿ",
-        "(for green leaves)": "(ಹಸಿರು ಎಲೆಗಳಿಗಾಗಿ)",
-        "Give water after planting": "ನಾಟಿ ಮಾಡಿದ ನಂತರ ನೀರು ಕೊಡಿ",
-        "Gaps/Weeding": "ಖಾಲಿ ಇರುವ ಜಾಗದಲ್ಲಿ ಗಿಡಗಳನ್ನು ತುಂಬಿ ಮತ್ತು ಕಳೆ ತೆಗೆಯಿರಿ",
-        "Water Saving (Water only if soil is dry)": "ನೀರಿನ ಉಳಿತಾಯ (ಮಣ್ಣು ಒಣಗಿದ್ದರೆ ಮಾತ್ರ ನೀರು ಕೊಡಿ)",
-        "Apply 25% N (tillering) split": "ಶೇ. 25 ರಷ್ಟು ಯೂರಿಯಾ ಗೊಬ್ಬರವನ್ನು (ಸಸಿ ಒಡೆಯುವ ಹಂತದಲ್ಲಿ) ಹಾಕಿ",
-        "Pull out weeds": "ಕಳೆಗಳನ್ನು ಕಿತ್ತೆಸೆಯಿರಿ",
-        "Spray early morning/evening only": "ಮುಂಜಾನೆ ಅಥವಾ ಸಂಜೆ ವೇಳೆ ಮಾತ್ರ ಸಿಂಪಡಿಸಿ",
-        "Scout: BPH": "ಪರಿಶೀಲಿಸಿ: ಜಿಗಿ ಹುಳು",
-        "Stem Borer": "ಕಾಂಡಕೊರಕ",
-        "Check for eggs": "ಮೊಟ್ಟೆಗಳಿಗಾಗಿ ಪರಿಶೀಲಿಸಿ",
-        "resistant to Gall Midge": "ಗಾಲ್ ಮಿಡ್ಜ್ (ಹಿಪ್ಪುಳ) ರೋಗ ನಿರೋಧಕ ಶಕ್ತಿ ಹೊಂದಿದೆ",
-        "Water Saving (Keep soil moist but not flooded)": "ನೀರಿನ ಉಳಿತಾಯ (ಮಣ್ಣಿನಲ್ಲಿ ತೇವಾಂಶವಿರಲಿ ಆದರೆ ನೀರು ನಿಲ್ಲಿಸಬೇಡಿ)",
-        "Book Thresher & Labor": "ಒಕ್ಕಣೆ ಯಂತ್ರ ಮತ್ತು ಕಾರ್ಮಿಕರನ್ನು ಬುಕ್ ಮಾಡಿ",
-        "Remove water before harvest": "ಕೊಯ್ಲಿಗೆ 10 ದಿನ ಮೊದಲು ನೀರನ್ನು ಹೊರಹಾಕಿ",
-        "Apply 25% N (Grain forming stage )": "ಶೇ. 25 ರಷ್ಟು ಯೂರಿಯಾ ಗೊಬ್ಬರವನ್ನು (ಹಾಲು ತುಂಬುವ ಹಂತದಲ್ಲಿ) ಹಾಕಿ",
-        "Do not water near harvest time": "ಬೆಳೆ ಕೊಯ್ಲಿಗೆ ಬರುವ ಮೊದಲು ನೀರು ಕೊಡಬೇಡಿ",
-        "Cut and collect the crop": "ಬೆಳೆಯನ್ನು ಕೊಯ್ಲು ಮಾಡಿ ಮತ್ತು ಸಂಗ್ರಹಿಸಿ",
-        "Dry grain to 14% moisture": "ಧಾನ್ಯವನ್ನು ಶೇ. 14 ರಷ್ಟು ತೇವಾಂಶ ಬರುವವರೆಗೆ ಒಣಗಿಸಿ",
-        "Air-tight Bags": "ಗಾಳಿಯಾಡದ ಚೀಲಗಳು",
-        "Ready land and give lime to soil": "ಭೂಮಿಯನ್ನು ಸಿದ್ಧಪಡಿಸಿ ಮತ್ತು ಮಣ್ಣಿಗೆ ಸುಣ್ಣ ಅಥವಾ ಡೋಲೊಮೈಟ್ ಹಾಕಿ",
-        "Apply 4 kg/Acre Borax": "ಎಕರೆಗೆ 4 ಕೆಜಿ ಬೊರಾಕ್ಸ್ ಹಾಕಿ",
-        "(for pod filling)": "(ಕಾಯಿ ತುಂಬುವಿಕೆಗಾಗಿ)",
-        "Make soft bed for seeds": "ಬೀಜ ಬಿತ್ತಲು ಮಣ್ಣನ್ನು ಹದ ಮಾಡಿ",
-        "Give small amount of water": "ಅಲ್ಪ ಪ್ರಮಾಣದ ನೀರು ಕೊಡಿ",
-        "Sow (10\"x4\")": "10x4 ಇಂಚು ಅಂತರದಲ್ಲಿ ಬಿತ್ತನೆ ಮಾಡಿ",
-        "Apply 125 kg/Acre Gypsum powder": "ಎಕರೆಗೆ 125 ಕೆಜಿ ಜಿಪ್ಸಮ್ ಪುಡಿಯನ್ನು ಹಾಕಿ",
-        "(for pod health)": "(ಕಾಯಿಗಳ ಆರೋಗ್ಯಕ್ಕಾಗಿ)",
-        "half of 250kg/Acre total": "(ಒಟ್ಟು 250 ಕೆಜಿ ಜಿಪ್ಸಮ್‌ನಲ್ಲಿ ಅರ್ಧದಷ್ಟು)",
-        "Apply 25 kg N First Dose and full dose of P & K at sowing": "ಬಿತ್ತನೆ ಸಮಯದಲ್ಲಿ 25 ಕೆಜಿ ಯೂರಿಯಾ ಮತ್ತು ಪೂರ್ಣ ಪ್ರಮಾಣದ ಡಿಎಪಿ/ಪೊಟ್ಯಾಶ್ ಹಾಕಿ",
-        "Treat with PSB & Azospirillum": "ಪಿಎಸ್ಬಿ ಮತ್ತು ಅಜೋಸ್ಪೈರಿಲಮ್ ಜೈವಿಕ ಗೊಬ್ಬರದೊಂದಿಗೆ ಬೀಜೋಪಚಾರ ಮಾಡಿ",
-        "Water when plants start to grow": "ಗಿಡಗಳು ಬೆಳೆಯಲು ಪ್ರಾರಂಭಿಸಿದಾಗ ನೀರು ಕೊಡಿ",
-        "Remove weeds first time": "ಮೊದಲ ಬಾರಿ ಕಳೆ ತೆಗೆಯಿರಿ",
-        "Monitor moisture": "ತೇವಾಂಶವನ್ನು ಗಮನಿಸಿ",
-        "(30 DAS)": "(ಬಿತ್ತನೆ ಮಾಡಿದ 30 ದಿನಗಳ ನಂತರ)",
-        "Scout: Tikka leaf spot and Rust": "ಪರಿಶೀಲಿಸಿ: ತಿಕ್ಕಾ ಎಲೆಚುಕ್ಕೆ ಮತ್ತು ತುಕ್ಕು ರೋಗ",
-        "Pull out weeds again": "ಮತ್ತೊಮ್ಮೆ ಕಳೆ ಕಿತ್ತೆಸೆಯಿರಿ",
-        "Critical moisture: ensure moisture for peg penetration": "ನಿರ್ಣಾಯಕ ಹಂತ: ಕಾಯಿಗಳು ಮಣ್ಣಿನಲ್ಲಿ ಇಳಿಯಲು ತೇವಾಂಶವಿರುವಂತೆ ನೋಡಿಕೊಳ್ಳಿ",
-        "Flowering / pegging period": "ಹೂವಾಡುವ ಮತ್ತು ಕಾಯಿ ಕಟ್ಟುವ ಹಂತ",
-        "Apply 10 kg Urea for Growth": "ಗಿಡದ ಬೆಳವಣಿಗೆಗಾಗಿ 10 ಕೆಜಿ ಯೂರಿಯಾ ಹಾಕಿ",
-        "DO NOT allow soil to dry now": "ಈ ಸಮಯದಲ್ಲಿ ಮಣ್ಣು ಒಣಗಲು ಬಿಡಬೇಡಿ",
-        "Mature pods or seeds forming": "ಕಾಯಿಗಳು ಅಥವಾ ಬೀಜಗಳು ಮಾಗುವ ಹಂತ",
-        "Fungicide/insecticide spray": "ಶಿಲೀಂಧ್ರನಾಶಕ ಅಥವಾ ಕೀಟನಾಶಕ ಸಿಂಪಡಿಸಿ",
-        "Inspect field before cutting": "ಕೊಯ್ಲಿಗೆ ಮೊದಲು ಜಮೀನನ್ನು ಪರೀಕ್ಷಿಸಿ",
-        "Dry pods to 7-8% moisture": "ಕಾಯಿಗಳನ್ನು ಶೇ. 7-8 ತೇವಾಂಶ ಬರುವವರೆಗೆ ಒಣಗಿಸಿ",
-        "prevent Aflatoxin": "ಅಫಲಾಟಾಕ್ಸಿನ್ (ಬೂಷ್ಟು) ಬರದಂತೆ ತಡೆಯಲು",
-        "Scout: Aphids, Pod Borer": "ಪರಿಶೀಲಿಸಿ: ಹೇನು ಮತ್ತು ಕಾಯಿ ಕೊರಕ",
-        "Apply before weeds come out Pendimethalin": "ಕಳೆ ಬರುವ ಮೊದಲು ಪೆಂಡಿಮೆಥಾಲಿನ್ ಬಳಸಿ",
-        "Apply 50% N and full dose of P & K": "ಶೇ. 50 ರಷ್ಟು ಯೂರಿಯಾ ಮತ್ತು ಪೂರ್ಣ ಪ್ರಮಾಣದ ಡಿಎಪಿ/ಪೊಟ್ಯಾಶ್ ಹಾಕಿ",
-        "Sowing pulses or peanuts": "ಬೇಳೆಕಾಳು ಅಥವಾ ಶೇಂಗಾ ಬಿತ್ತನೆ ಮಾಡಿ",
-        "Spray 1% Urea": "ಶೇ. 1 ರಷ್ಟು ಯೂರಿಯಾ ದ್ರಾವಣವನ್ನು ಸಿಂಪಡಿಸಿ",
-        "Check pod maturation": "ಕಾಯಿ ಬಲಿತಿರುವುದನ್ನು ಪರೀಕ್ಷಿಸಿ",
-        "Harvest when 80% pods turn black": "ಶೇ. 80 ರಷ್ಟು ಕಾಯಿಗಳು ಕಪ್ಪಾದಾಗ ಕೊಯ್ಲು ಮಾಡಿ",
-        "Store with Azadirachtin": "ಅಜಾಡಿರಾಕ್ಟಿನ್‌ನೊಂದಿಗೆ ಸಂಗ್ರಹಿಸಿ",
-        "Prepare land and test soil and apply compost": "ಭೂಮಿ ಸಿದ್ಧಪಡಿಸಿ, ಮಣ್ಣು ಪರೀಕ್ಷೆ ಮಾಡಿ ಮತ್ತು ಕೊಟ್ಟಿಗೆ ಗೊಬ್ಬರ ಬಳಸಿ",
-        "Sow seeds in trays or beds": "ಟ್ರೇ ಅಥವಾ ಮಡಿಗಳಲ್ಲಿ ಬೀಜ ಬಿತ್ತಿ",
-        "Water and care for seedlings": "ಸಸಿಗಳಿಗೆ ನೀರು ಕೊಡಿ ಮತ್ತು ಆರೈಕೆ ಮಾಡಿ",
-        "Remove weak seedlings": "ಬಲಹೀನ ಸಸಿಗಳನ್ನು ತೆಗೆಯಿರಿ",
-        "Move 15–18 day-old seedlings to main field": "15-18 ದಿನಗಳ ಸಸಿಗಳನ್ನು ಮುಖ್ಯ ಜಮೀನಿಗೆ ವರ್ಗಾಯಿಸಿ",
-        "Remove unwanted plants and replace missing ones": "ಅನಗತ್ಯ ಗಿಡಗಳನ್ನು ತೆಗೆದು ಖಾಲಿ ಇರುವ ಜಾಗದಲ್ಲಿ ಹೊಸ ಸಸಿಗಳನ್ನು ನಾಟಿ ಮಾಡಿ",
-        "Scout: Blast leaf spots": "ಪರಿಶೀಲಿಸಿ: ಬೆಂಕಿರೋಗದ ಚುಕ್ಕೆಗಳು",
-        "Blast (Prioritize Blast-tolerant varieties like KMP-220)": "ಬೆಂಕಿರೋಗ (ಕೆಎಂಪಿ-220 ನಂತಹ ರೋಗ ನಿರೋಧಕ ತಳಿಗಳಿಗೆ ಆದ್ಯತೆ ನೀಡಿ)",
-        "Check if grains are forming": "ಧಾನ್ಯಗಳು ತುಂಬುತ್ತಿವೆಯೇ ಎಂದು ಪರೀಕ್ಷಿಸಿ",
-        "Spray Tricyclazole for Blast": "ಬೆಂಕಿರೋಗಕ್ಕಾಗಿ ಟ್ರೈಸೈಕ್ಲಜೋಲ್ ಸಿಂಪಡಿಸಿ",
-        "Chlorantraniliprole for Stem Borer": "ಕಾಂಡಕೊರಕ ನಿಯಂತ್ರಣಕ್ಕೆ ಕ್ಲೋರಾಂಟ್ರಾನಿಲಿಪ್ರೋಲ್ ಬಳಸಿ",
-        "Reduce water and stop watering before harvest": "ಕೊಯ್ಲಿಗೆ ಮೊದಲು ನೀರಿನ ಪ್ರಮಾಣ ಕಡಿಮೆ ಮಾಡಿ ಮತ್ತು ನಂತರ ನಿಲ್ಲಿಸಿ",
-        "Collect and store rice and remove straw": "ಭಕ್ಕಿ ಸಂಗ್ರಹಿಸಿ ಮತ್ತು ಒಣ ಹುಲ್ಲನ್ನು ತೆಗೆಯಿರಿ",
-        "Clean and repair field": "ಜಮೀನನ್ನು ಸ್ವಚ್ಛಗೊಳಿಸಿ ಮತ್ತು ಬದುಗಳನ್ನು ಸರಿಪಡಿಸಿ",
-        "Spray Tebuconazole 2DS or Mancozeb for leaf spots": "ಎಲೆಚುಕ್ಕೆ ರೋಗಕ್ಕೆ ಟೆಬುಕೊನಜೋಲ್ ಅಥವಾ ಮ್ಯಾಂಕೋಜೋಬ್ ಸಿಂಪಡಿಸಿ",
-        "Drain water before harvest": "ಕೊಯ್ಲಿಗೆ ಮೊದಲು ನೀರನ್ನು ಹೊರಹಾಕಿ",
-        "Clean and level the land for planting": "ನಾಟಿಗಾಗಿ ಜಮೀನನ್ನು ಸ್ವಚ್ಛಗೊಳಿಸಿ ಮತ್ತು ಸಮತಟ್ಟು ಮಾಡಿ",
-        "Apply Fertilizer kg/ha (50% Nitrogen First Dose, full P&K)": "ಬಿತ್ತನೆ ಸಮಯದಲ್ಲಿ ಶೇ. 50 ಯೂರಿಯಾ ಮತ್ತು ಪೂರ್ಣ ಡಿಎಪಿ/ಪೊಟ್ಯಾಶ್ ಹಾಕಿ",
-        "Mark planting rows / Prepare irrigation": "ಸಾಲುಗಳನ್ನು ಗುರುತಿಸಿ ಮತ್ತು ನೀರಾವರಿ ಸಿದ್ಧತೆ ಮಾಡಿ",
-        "Field layout: 1.5 m between channels and 0.6 m between hills": "ವಿನ್ಯಾಸ: ಕಾಲುವೆಗಳ ನಡುವೆ 1.5 ಮೀಟರ್ ಮತ್ತು ಗುಂಡಿಗಳ ನಡುವೆ 0.6 ಮೀಟರ್ ಅಂತರವಿರಲಿ",
-        "Apply 25% Urea for Growth": "ಗಿಡದ ಬೆಳವಣಿಗೆಗಾಗಿ ಶೇ. 25 ರಷ್ಟು ಯೂರಿಯಾ ಹಾಕಿ",
-        "Apply final 25% Urea for Growth (45 DAS)": "45 ನೇ ದಿನದಲ್ಲಿ ಉಳಿದ ಶೇ. 25 ರಷ್ಟು ಯೂರಿಯಾ ಹಾಕಿ",
-        "Monitor plant health": "ಗಿಡದ ಆರೋಗ್ಯವನ್ನು ಗಮನಿಸಿ",
-        "Scout: Fruit Fly": "ಪರಿಶೀಲಿಸಿ: ಹಣ್ಣಿನ ನೊಣ",
-        "Pheromone/Fish meal traps": "ಫೆರೋಮೋನ್ ಅಥವಾ ಮೀನಿನ ಪುಡಿ ಬಲೆಗಳನ್ನು ಬಳಸಿ",
-        "2% neem oil + garlic emulsion for sucking pests": "ಹೀರುವ ಕೀಟಗಳಿಗಾಗಿ ಶೇ. 2 ರಷ್ಟು ಬೇವಿನ ಎಣ್ಣೆ ಮತ್ತು ಬೆಳ್ಳುಳ್ಳಿ ಕಷಾಯ ಬಳಸಿ",
-        "judge harvest readiness": "ಕೊಯ್ಲಿಗೆ ಸಿದ್ಧತೆಯನ್ನು ಪರೀಕ್ಷಿಸಿ",
-        "dull sound when thumping the fruit": "ಹಣ್ಣನ್ನು ತಟ್ಟಿದಾಗ ಮಂದವಾದ ಶಬ್ದ ಬಂದರೆ ಕೊಯ್ಲಿಗೆ ಸಿದ್ಧ",
-        "Apply 50% Nitrogen and full Phosphorus/Potassium as First Dose": "ಬಿತ್ತನೆ ಸಮಯದಲ್ಲಿ ಶೇ. 50 ಯೂರಿಯಾ ಮತ್ತು ಪೂರ್ಣ ಡಿಎಪಿ/ಪೊಟ್ಯಾಶ್ ಹಾಕಿ",
-        "spacing": "ಅಂತರ",
-        "Prepare seedbed": "ಬಿತ್ತನೆ ಮಡಿ ಸಿದ್ಧಪಡಿಸಿ",
-        "Sow seeds 12 inches apart in rows, with 4 inches between seeds": "ಸಾಲುಗಳ ನಡುವೆ 12 ಇಂಚು ಮತ್ತು ಬೀಜಗಳ ನಡುವೆ 4 ಇಂಚು ಅಂತರವಿರಲಿ",
-        "Irrigate lightly": "ಹಗುರವಾಗಿ ನೀರು ಕೊಡಿ",
-        "Weed at 20-25 days after sowing": "ಬಿತ್ತನೆ ಮಾಡಿದ 20-25 ದಿನಗಳ ನಂತರ ಕಳೆ ತೆಗೆಯಿರಿ",
-        "yellow mosaic and thrips": "ಹಳದಿ ಎಲೆ ರೋಗ ಮತ್ತು ನುಸಿ ಕೀಟ",
-        "Harvest when 80% pods mature": "ಶೇ. 80 ರಷ್ಟು ಕಾಯಿಗಳು ಮಾಗಿದಾಗ ಕೊಯ್ಲು ಮಾಡಿ",
-        "Dry plants on tarpaulin": "ಗಿಡಗಳನ್ನು ಟಾರ್ಪಾಲಿನ್ ಮೇಲೆ ಒಣಗಿಸಿ",
-        "Thin seedlings to one per hill": "ಪ್ರತಿ ಗುಂಡಿಯಲ್ಲಿ ಒಂದು ಸಸಿ ಮಾತ್ರ ಇರುವಂತೆ ಮಾಡಿ",
-        "Thinning": "ಗಿಡಗಳ ವಿರಳೀಕರಣ",
-        "leaf yellowing for maturation signals": "ಬೆಳೆ ಮಾಗುವ ಸೂಚನೆಯಾಗಿ ಎಲೆಗಳು ಹಳದಿ ಬಣ್ಣಕ್ಕೆ ತಿರುಗುವುದನ್ನು ಗಮನಿಸಿ",
-        "Maintain exactly 5% moisture": "ತೈಲದ ಅಂಶ ಕೆಡದಂತೆ ನಿಖರವಾಗಿ ಶೇ. 5 ರಷ್ಟು ತೇವಾಂಶ ಕಾಪಾಡಿಕೊಳ್ಳಿ",
-        "700-gauge poly bags": "700-ಗೇಜ್ ಪಾಲಿ ಬ್ಯಾಗ್ ಬಳಸಿ",
-        "Clear crop residues": "ಬೆಳೆಯ ಕಸಕಡ್ಡಿಗಳನ್ನು ಸ್ವಚ್ಛಗೊಳಿಸಿ",
-        "Apply 200kg/Acre Lime/Dolomite": "ಎಕರೆಗೆ 200 ಕೆಜಿ ಸುಣ್ಣ ಅಥವಾ ಡೋಲೊಮೈಟ್ ಹಾಕಿ",
-        "Ensure proper drainage": "ನೀರನ್ನು ಹೊರಹೋಗಲು ಸರಿಯಾದ ವ್ಯವಸ್ಥೆ ಮಾಡಿ",
-        "Near sea? Check water salinity": "ಸಮುದ್ರದ ಸಮೀಪವಿದ್ದರೆ ನೀರಿನ ಉಪ್ಪಿನಂಶ ಪರೀಕ್ಷಿಸಿ",
-        "Panicle emergence monitoring": "ತೆನೆ ಬರುವ ಹಂತವನ್ನು ಗಮನಿಸಿ",
-        "Maintain nursery irrigation": "ಸಸಿಮಡಿಗೆ ಸರಿಯಾಗಿ ನೀರು ಕೊಡಿ",
-        "Apply 6 kg/Acre MgSO4": "ಎಕರೆಗೆ 6 ಕೆಜಿ ಮೆಗ್ನೀಸಿಯಮ್ ಸಲ್ಫೇಟ್ ಹಾಕಿ",
-        "Scout: BSFB": "ಪರಿಶೀಲಿಸಿ: ಕಾಯಿ ಕೊರಕ",
-        "Scout: Whitefly": "ಪರಿಶೀಲಿಸಿ: ಬಿಳಿ ನೊಣ",
-        "YVMV vector": "ವೈವಿಎಂವಿ ವೈರಸ್ ಹರಡುವ ಕೀಟ",
-        "Apply Imidacloprid for Whiteflies": "ಬಿಳಿ ನೊಣದ ನಿಯಂತ್ರಣಕ್ಕೆ ಇಮಿಡಾಕ್ಲೋಪ್ರಿಡ್ ಬಳಸಿ",
-        "Harvest when fruit is shiny, firm and medium-sized": "ಹಣ್ಣು ಹೊಳೆಯುವಂತೆ, ಗಟ್ಟಿಯಾಗಿ ಮತ್ತು ಮಧ್ಯಮ ಗಾತ್ರದಲ್ಲಿದ್ದಾಗ ಕೊಯ್ಲು ಮಾಡಿ",
-        "Kharif": "ಖಾರಿಫ್",
-        "Rabi": "ಹಿಂಗಾರು (ರಬಿ)",
-        "Summer": "ಬೇಸಿಗೆ",
-        "Paddy": "ಭತ್ತ",
-        "Groundnut": "ಶೇಂಗಾ",
-        "Black gram": "ಉದ್ದು",
-        "Green gram": "ಹೆಸರು ಬೇಳೆ",
-        "Cowpea": "ಅಲಸಂದೆ",
-        "Sesame": "ಎಳ್ಳು",
-        "Vegetables": "ತರಕಾರಿಗಳು",
-        "Cucumber": "ಸೌತೆಕಾಯಿ",
-        "Watermelon": "ಕಲ್ಲಂಗಡಿ",
-        "Brinjal": "ಬದನೆಕಾಯಿ",
-        "Chilli": "ಮೆಣಸಿನಕಾಯಿ",
-        "Lady's Finger": "ಬೆಂಡೆಕಾಯಿ",
-        "June": "ಜೂನ್",
-        "July": "ಜುಲೈ",
-        "August": "ಆಗಸ್ಟ್",
-        "September": "ಸೆಪ್ಟೆಂಬರ್",
-        "October": "ಅಕ್ಟೋಬರ್",
-        "November": "ನವೆಂಬರ್",
-        "December": "ಡಿಸೆಂಬರ್",
-        "January": "ಜನವರಿ",
-        "February": "ಫೆಬ್ರವರಿ",
-        "March": "ಮಾರ್ಚ್",
-        "April": "ಏಪ್ರಿಲ್",
-        "May": "ಮೇ"
-    }
-    
-    parts = text.split("|")
-    translated_parts = []
-    
-    for part in parts:
-        clean_part = part.strip()
-        translated_part = clean_part
-        # Try to find replacements for key fragments within the text
-        for eng, kn in mapping.items():
-            if eng in translated_part:
-                translated_part = translated_part.replace(eng, kn)
-        
-        # If nothing was translated and it's not a known symbol, 
-        # keep it but it might need manual review
-        translated_parts.append(translated_part)
-        
-    return " | ".join(translated_parts)
-
-with open('calendar.csv', 'r') as f:
-    reader = csv.DictReader(f)
-    rows = list(reader)
-
-output_rows = []
-for row in rows:
-    new_row = row.copy()
-    new_row['Week 1 (KN)'] = translate_text(row['Week 1'])
-    new_row['Week 2 (KN)'] = translate_text(row['Week 2'])
-    new_row['Week 3 (KN)'] = translate_text(row['Week 3'])
-    new_row['Week 4 (KN)'] = translate_text(row['Week 4'])
-    output_rows.append(new_row)
-
-fieldnames = reader.fieldnames + ['Week 1 (KN)', 'Week 2 (KN)', 'Week 3 (KN)', 'Week 4 (KN)']
-
-with open('calendar_bilingual.csv', 'w', newline='') as f:
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(output_rows)
-
-print("Bilingual CSV generated successfully!")
+import re
+import sys
+import time
+from collections import Counter
+
+RESTING_KN = "ಜಮೀನಿಗೆ ವಿಶ್ರಾಂತಿ"
+
+# English fragment -> Kannada. Matched longest-first in one pass, so overlapping
+# entries (e.g. "Stem Borer" inside "Chlorantraniliprole for Stem Borer") can't clobber each other
+KN_GLOSSARY = {
+    "Book Tractor & Labor": "ಟ್ರಾಕ್ಟರ್ ಮತ್ತು ಕಾರ್ಮಿಕರನ್ನು ಬುಕ್ ಮಾಡಿ",
+    "Check Weather": "ಹವಾಮಾನವನ್ನು ಪರಿಶೀಲಿಸಿ",
+    "Land prep & puddling": "ಭೂಮಿ ಸಿದ್ಧತೆ ಮತ್ತು ಹದಗೊಳಿಸುವಿಕೆ",
+    "Green Manuring": "ಹಸಿರು ಗೊಬ್ಬರ ಬಳಕೆ",
+    "Get small plants ready in trays or bed": "ಸಣ್ಣ ಸಸಿಗಳನ್ನು ಸಿದ್ಧಪಡಿಸಿಕೊಳ್ಳಿ (ಟ್ರೇ ಅಥವಾ ಮಡಿಗಳಲ್ಲಿ)",
+    "Soil testing & compost application": "ಮಣ್ಣಿನ ಪರೀಕ್ಷೆ ಮತ್ತು ಕೊಟ್ಟಿಗೆ ಗೊಬ್ಬರ ಬಳಕೆ",
+    "Care for Seedlings": "ಸಸಿಗಳ ಆರೈಕೆ ಮಾಡಿ",
+    "Transplant (15-18d)": "15-18 ದಿನಗಳ ಸಸಿಗಳನ್ನು ನಾಟಿ ಮಾಡಿ",
+    "Apply Basal Mixture (Urea+DAP+Potash)": "ನಾಟಿ ಸಮಯದಲ್ಲಿ ಯೂರಿಯಾ, ಡಿಎಪಿ ಮತ್ತು ಪೊಟ್ಯಾಶ್ ಮಿಶ್ರಣವನ್ನು ಹಾಕಿ",
+    "Apply 8 kg/Acre Zinc": "ಎಕರೆಗೆ 8 ಕೆಜಿ ಜಿಂಕ್ ಸಲ್ಫೇಟ್ ಹಾಕಿ",
+    "(for green leaves)": "(ಹಸಿರು ಎಲೆಗಳಿಗಾಗಿ)",
+    "Give water after planting": "ನಾಟಿ ಮಾಡಿದ ನಂತರ ನೀರು ಕೊಡಿ",
+    "Gaps/Weeding": "ಖಾಲಿ ಇರುವ ಜಾಗದಲ್ಲಿ ಗಿಡಗಳನ್ನು ತುಂಬಿ ಮತ್ತು ಕಳೆ ತೆಗೆಯಿರಿ",
+    "Water Saving (Water only if soil is dry)": "ನೀರಿನ ಉಳಿತಾಯ (ಮಣ್ಣು ಒಣಗಿದ್ದರೆ ಮಾತ್ರ ನೀರು ಕೊಡಿ)",
+    "Apply 25% N (tillering) split": "ಶೇ. 25 ರಷ್ಟು ಯೂರಿಯಾ ಗೊಬ್ಬರವನ್ನು (ಸಸಿ ಒಡೆಯುವ ಹಂತದಲ್ಲಿ) ಹಾಕಿ",
+    "Pull out weeds": "ಕಳೆಗಳನ್ನು ಕಿತ್ತೆಸೆಯಿರಿ",
+    "Spray early morning/evening only": "ಮುಂಜಾನೆ ಅಥವಾ ಸಂಜೆ ವೇಳೆ ಮಾತ್ರ ಸಿಂಪಡಿಸಿ",
+    "Scout: BPH": "ಪರಿಶೀಲಿಸಿ: ಜಿಗಿ ಹುಳು",
+    "Stem Borer": "ಕಾಂಡಕೊರಕ",
+    "Check for eggs": "ಮೊಟ್ಟೆಗಳಿಗಾಗಿ ಪರಿಶೀಲಿಸಿ",
+    "resistant to Gall Midge": "ಗಾಲ್ ಮಿಡ್ಜ್ (ಹಿಪ್ಪುಳ) ರೋಗ ನಿರೋಧಕ ಶಕ್ತಿ ಹೊಂದಿದೆ",
+    "Water Saving (Keep soil moist but not flooded)": "ನೀರಿನ ಉಳಿತಾಯ (ಮಣ್ಣಿನಲ್ಲಿ ತೇವಾಂಶವಿರಲಿ ಆದರೆ ನೀರು ನಿಲ್ಲಿಸಬೇಡಿ)",
+    "Book Thresher & Labor": "ಒಕ್ಕಣೆ ಯಂತ್ರ ಮತ್ತು ಕಾರ್ಮಿಕರನ್ನು ಬುಕ್ ಮಾಡಿ",
+    "Remove water before harvest": "ಕೊಯ್ಲಿಗೆ 10 ದಿನ ಮೊದಲು ನೀರನ್ನು ಹೊರಹಾಕಿ",
+    "Apply 25% N (Grain forming stage )": "ಶೇ. 25 ರಷ್ಟು ಯೂರಿಯಾ ಗೊಬ್ಬರವನ್ನು (ಹಾಲು ತುಂಬುವ ಹಂತದಲ್ಲಿ) ಹಾಕಿ",
+    "Do not water near harvest time": "ಬೆಳೆ ಕೊಯ್ಲಿಗೆ ಬರುವ ಮೊದಲು ನೀರು ಕೊಡಬೇಡಿ",
+    "Cut and collect the crop": "ಬೆಳೆಯನ್ನು ಕೊಯ್ಲು ಮಾಡಿ ಮತ್ತು ಸಂಗ್ರಹಿಸಿ",
+    "Dry grain to 14% moisture": "ಧಾನ್ಯವನ್ನು ಶೇ. 14 ರಷ್ಟು ತೇವಾಂಶ ಬರುವವರೆಗೆ ಒಣಗಿಸಿ",
+    "Air-tight Bags": "ಗಾಳಿಯಾಡದ ಚೀಲಗಳು",
+    "Ready land and give lime to soil": "ಭೂಮಿಯನ್ನು ಸಿದ್ಧಪಡಿಸಿ ಮತ್ತು ಮಣ್ಣಿಗೆ ಸುಣ್ಣ ಅಥವಾ ಡೋಲೊಮೈಟ್ ಹಾಕಿ",
+    "Apply 4 kg/Acre Borax": "ಎಕರೆಗೆ 4 ಕೆಜಿ ಬೊರಾಕ್ಸ್ ಹಾಕಿ",
+    "(for pod filling)": "(ಕಾಯಿ ತುಂಬುವಿಕೆಗಾಗಿ)",
+    "Make soft bed for seeds": "ಬೀಜ ಬಿತ್ತಲು ಮಣ್ಣನ್ನು ಹದ ಮಾಡಿ",
+    "Give small amount of water": "ಅಲ್ಪ ಪ್ರಮಾಣದ ನೀರು ಕೊಡಿ",
+    "Sow (10\"x4\")": "10x4 ಇಂಚು ಅಂತರದಲ್ಲಿ ಬಿತ್ತನೆ ಮಾಡಿ",
+    "Apply 125 kg/Acre Gypsum powder": "ಎಕರೆಗೆ 125 ಕೆಜಿ ಜಿಪ್ಸಮ್ ಪುಡಿಯನ್ನು ಹಾಕಿ",
+    "(for pod health)": "(ಕಾಯಿಗಳ ಆರೋಗ್ಯಕ್ಕಾಗಿ)",
+    "half of 250kg/Acre total": "(ಒಟ್ಟು 250 ಕೆಜಿ ಜಿಪ್ಸಮ್‌ನಲ್ಲಿ ಅರ್ಧದಷ್ಟು)",
+    "Apply 25 kg N First Dose and full dose of P & K at sowing": "ಬಿತ್ತನೆ ಸಮಯದಲ್ಲಿ 25 ಕೆಜಿ ಯೂರಿಯಾ ಮತ್ತು ಪೂರ್ಣ ಪ್ರಮಾಣದ ಡಿಎಪಿ/ಪೊಟ್ಯಾಶ್ ಹಾಕಿ",
+    "Treat with PSB & Azospirillum": "ಪಿಎಸ್ಬಿ ಮತ್ತು ಅಜೋಸ್ಪೈರಿಲಮ್ ಜೈವಿಕ ಗೊಬ್ಬರದೊಂದಿಗೆ ಬೀಜೋಪಚಾರ ಮಾಡಿ",
+    "Water when plants start to grow": "ಗಿಡಗಳು ಬೆಳೆಯಲು ಪ್ರಾರಂಭಿಸಿದಾಗ ನೀರು ಕೊಡಿ",
+    "Remove weeds first time": "ಮೊದಲ ಬಾರಿ ಕಳೆ ತೆಗೆಯಿರಿ",
+    "Monitor moisture": "ತೇವಾಂಶವನ್ನು ಗಮನಿಸಿ",
+    "(30 DAS)": "(ಬಿತ್ತನೆ ಮಾಡಿದ 30 ದಿನಗಳ ನಂತರ)",
+    "Scout: Tikka leaf spot and Rust": "ಪರಿಶೀಲಿಸಿ: ತಿಕ್ಕಾ ಎಲೆಚುಕ್ಕೆ ಮತ್ತು ತುಕ್ಕು ರೋಗ",
+    "Pull out weeds again": "ಮತ್ತೊಮ್ಮೆ ಕಳೆ ಕಿತ್ತೆಸೆಯಿರಿ",
+    "Critical moisture: ensure moisture for peg penetration": "ನಿರ್ಣಾಯಕ ಹಂತ: ಕಾಯಿಗಳು ಮಣ್ಣಿನಲ್ಲಿ ಇಳಿಯಲು ತೇವಾಂಶವಿರುವಂತೆ ನೋಡಿಕೊಳ್ಳಿ",
+    "Flowering / pegging period": "ಹೂವಾಡುವ ಮತ್ತು ಕಾಯಿ ಕಟ್ಟುವ ಹಂತ",
+    "Apply 10 kg Urea for Growth": "ಗಿಡದ ಬೆಳವಣಿಗೆಗಾಗಿ 10 ಕೆಜಿ ಯೂರಿಯಾ ಹಾಕಿ",
+    "DO NOT allow soil to dry now": "ಈ ಸಮಯದಲ್ಲಿ ಮಣ್ಣು ಒಣಗಲು ಬಿಡಬೇಡಿ",
+    "Mature pods or seeds forming": "ಕಾಯಿಗಳು ಅಥವಾ ಬೀಜಗಳು ಮಾಗುವ ಹಂತ",
+    "Fungicide/insecticide spray": "ಶಿಲೀಂಧ್ರನಾಶಕ ಅಥವಾ ಕೀಟನಾಶಕ ಸಿಂಪಡಿಸಿ",
+    "Inspect field before cutting": "ಕೊಯ್ಲಿಗೆ ಮೊದಲು ಜಮೀನನ್ನು ಪರೀಕ್ಷಿಸಿ",
+    "Dry pods to 7-8% moisture": "ಕಾಯಿಗಳನ್ನು ಶೇ. 7-8 ತೇವಾಂಶ ಬರುವವರೆಗೆ ಒಣಗಿಸಿ",
+    "prevent Aflatoxin": "ಅಫಲಾಟಾಕ್ಸಿನ್ (ಬೂಷ್ಟು) ಬರದಂತೆ ತಡೆಯಲು",
+    "Scout: Aphids, Pod Borer": "ಪರಿಶೀಲಿಸಿ: ಹೇನು ಮತ್ತು ಕಾಯಿ ಕೊರಕ",
+    "Apply before weeds come out Pendimethalin": "ಕಳೆ ಬರುವ ಮೊದಲು ಪೆಂಡಿಮೆಥಾಲಿನ್ ಬಳಸಿ",
+    "Apply 50% N and full dose of P & K": "ಶೇ. 50 ರಷ್ಟು ಯೂರಿಯಾ ಮತ್ತು ಪೂರ್ಣ ಪ್ರಮಾಣದ ಡಿಎಪಿ/ಪೊಟ್ಯಾಶ್ ಹಾಕಿ",
+    "Sowing pulses or peanuts": "ಬೇಳೆಕಾಳು ಅಥವಾ ಶೇಂಗಾ ಬಿತ್ತನೆ ಮಾಡಿ",
+    "Spray 1% Urea": "ಶೇ. 1 ರಷ್ಟು ಯೂರಿಯಾ ದ್ರಾವಣವನ್ನು ಸಿಂಪಡಿಸಿ",
+    "Check pod maturation": "ಕಾಯಿ ಬಲಿತಿರುವುದನ್ನು ಪರೀಕ್ಷಿಸಿ",
+    "Harvest when 80% pods turn black": "ಶೇ. 80 ರಷ್ಟು ಕಾಯಿಗಳು ಕಪ್ಪಾದಾಗ ಕೊಯ್ಲು ಮಾಡಿ",
+    "Store with Azadirachtin": "ಅಜಾಡಿರಾಕ್ಟಿನ್‌ನೊಂದಿಗೆ ಸಂಗ್ರಹಿಸಿ",
+    "Prepare land and test soil and apply compost": "ಭೂಮಿ ಸಿದ್ಧಪಡಿಸಿ, ಮಣ್ಣು ಪರೀಕ್ಷೆ ಮಾಡಿ ಮತ್ತು ಕೊಟ್ಟಿಗೆ ಗೊಬ್ಬರ ಬಳಸಿ",
+    "Sow seeds in trays or beds": "ಟ್ರೇ ಅಥವಾ ಮಡಿಗಳಲ್ಲಿ ಬೀಜ ಬಿತ್ತಿ",
+    "Water and care for seedlings": "ಸಸಿಗಳಿಗೆ ನೀರು ಕೊಡಿ ಮತ್ತು ಆರೈಕೆ ಮಾಡಿ",
+    "Remove weak seedlings": "ಬಲಹೀನ ಸಸಿಗಳನ್ನು ತೆಗೆಯಿರಿ",
+    "Move 15–18 day-old seedlings to main field": "15-18 ದಿನಗಳ ಸಸಿಗಳನ್ನು ಮುಖ್ಯ ಜಮೀನಿಗೆ ವರ್ಗಾಯಿಸಿ",
+    "Remove unwanted plants and replace missing ones": "ಅನಗತ್ಯ ಗಿಡಗಳನ್ನು ತೆಗೆದು ಖಾಲಿ ಇರುವ ಜಾಗದಲ್ಲಿ ಹೊಸ ಸಸಿಗಳನ್ನು ನಾಟಿ ಮಾಡಿ",
+    "Scout: Blast leaf spots": "ಪರಿಶೀಲಿಸಿ: ಬೆಂಕಿರೋಗದ ಚುಕ್ಕೆಗಳು",
+    "Blast (Prioritize Blast-tolerant varieties like KMP-220)": "ಬೆಂಕಿರೋಗ (ಕೆಎಂಪಿ-220 ನಂತಹ ರೋಗ ನಿರೋಧಕ ತಳಿಗಳಿಗೆ ಆದ್ಯತೆ ನೀಡಿ)",
+    "(Prioritize Blast-tolerant varieties like KMP-220)": "(ಕೆಎಂಪಿ-220 ನಂತಹ ರೋಗ ನಿರೋಧಕ ತಳಿಗಳಿಗೆ ಆದ್ಯತೆ ನೀಡಿ)",
+    "Check if grains are forming": "ಧಾನ್ಯಗಳು ತುಂಬುತ್ತಿವೆಯೇ ಎಂದು ಪರೀಕ್ಷಿಸಿ",
+    "Spray Tricyclazole for Blast": "ಬೆಂಕಿರೋಗಕ್ಕಾಗಿ ಟ್ರೈಸೈಕ್ಲಜೋಲ್ ಸಿಂಪಡಿಸಿ",
+    "Chlorantraniliprole for Stem Borer": "ಕಾಂಡಕೊರಕ ನಿಯಂತ್ರಣಕ್ಕೆ ಕ್ಲೋರಾಂಟ್ರಾನಿಲಿಪ್ರೋಲ್ ಬಳಸಿ",
+    "Reduce water and stop watering before harvest": "ಕೊಯ್ಲಿಗೆ ಮೊದಲು ನೀರಿನ ಪ್ರಮಾಣ ಕಡಿಮೆ ಮಾಡಿ ಮತ್ತು ನಂತರ ನಿಲ್ಲಿಸಿ",
+    "Collect and store rice and remove straw": "ಭಕ್ಕಿ ಸಂಗ್ರಹಿಸಿ ಮತ್ತು ಒಣ ಹುಲ್ಲನ್ನು ತೆಗೆಯಿರಿ",
+    "Clean and repair field": "ಜಮೀನನ್ನು ಸ್ವಚ್ಛಗೊಳಿಸಿ ಮತ್ತು ಬದುಗಳನ್ನು ಸರಿಪಡಿಸಿ",
+    "Spray Tebuconazole 2DS or Mancozeb for leaf spots": "ಎಲೆಚುಕ್ಕೆ ರೋಗಕ್ಕೆ ಟೆಬುಕೊನಜೋಲ್ ಅಥವಾ ಮ್ಯಾಂಕೋಜೋಬ್ ಸಿಂಪಡಿಸಿ",
+    "Drain water before harvest": "ಕೊಯ್ಲಿಗೆ ಮೊದಲು ನೀರನ್ನು ಹೊರಹಾಕಿ",
+    "Clean and level the land for planting": "ನಾಟಿಗಾಗಿ ಜಮೀನನ್ನು ಸ್ವಚ್ಛಗೊಳಿಸಿ ಮತ್ತು ಸಮತಟ್ಟು ಮಾಡಿ",
+    "Apply Fertilizer kg/ha (50% Nitrogen First Dose, full P&K)": "ಬಿತ್ತನೆ ಸಮಯದಲ್ಲಿ ಶೇ. 50 ಯೂರಿಯಾ ಮತ್ತು ಪೂರ್ಣ ಡಿಎಪಿ/ಪೊಟ್ಯಾಶ್ ಹಾಕಿ",
+    "Mark planting rows / Prepare irrigation": "ಸಾಲುಗಳನ್ನು ಗುರುತಿಸಿ ಮತ್ತು ನೀರಾವರಿ ಸಿದ್ಧತೆ ಮಾಡಿ",
+    "Field layout: 1.5 m between channels and 0.6 m between hills": "ವಿನ್ಯಾಸ: ಕಾಲುವೆಗಳ ನಡುವೆ 1.5 ಮೀಟರ್ ಮತ್ತು ಗುಂಡಿಗಳ ನಡುವೆ 0.6 ಮೀಟರ್ ಅಂತರವಿರಲಿ",
+    "Apply 25% Urea for Growth": "ಗಿಡದ ಬೆಳವಣಿಗೆಗಾಗಿ ಶೇ. 25 ರಷ್ಟು ಯೂರಿಯಾ ಹಾಕಿ",
+    "Apply final 25% Urea for Growth (45 DAS)": "45 ನೇ ದಿನದಲ್ಲಿ ಉಳಿದ ಶೇ. 25 ರಷ್ಟು ಯೂರಿಯಾ ಹಾಕಿ",
+    "Monitor plant health": "ಗಿಡದ ಆರೋಗ್ಯವನ್ನು ಗಮನಿಸಿ",
+    "Scout: Fruit Fly": "ಪರಿಶೀಲಿಸಿ: ಹಣ್ಣಿನ ನೊಣ",
+    "Pheromone/Fish meal traps": "ಫೆರೋಮೋನ್ ಅಥವಾ ಮೀನಿನ ಪುಡಿ ಬಲೆಗಳನ್ನು ಬಳಸಿ",
+    "2% neem oil + garlic emulsion for sucking pests": "ಹೀರುವ ಕೀಟಗಳಿಗಾಗಿ ಶೇ. 2 ರಷ್ಟು ಬೇವಿನ ಎಣ್ಣೆ ಮತ್ತು ಬೆಳ್ಳುಳ್ಳಿ ಕಷಾಯ ಬಳಸಿ",
+    "judge harvest readiness": "ಕೊಯ್ಲಿಗೆ ಸಿದ್ಧತೆಯನ್ನು ಪರೀಕ್ಷಿಸಿ",
+    "dull sound when thumping the fruit": "ಹಣ್ಣನ್ನು ತಟ್ಟಿದಾಗ ಮಂದವಾದ ಶಬ್ದ ಬಂದರೆ ಕೊಯ್ಲಿಗೆ ಸಿದ್ಧ",
+    "Apply 50% Nitrogen and full Phosphorus/Potassium as First Dose": "ಬಿತ್ತನೆ ಸಮಯದಲ್ಲಿ ಶೇ. 50 ಯೂರಿಯಾ ಮತ್ತು ಪೂರ್ಣ ಡಿಎಪಿ/ಪೊಟ್ಯಾಶ್ ಹಾಕಿ",
+    "spacing": "ಅಂತರ",
+    "Prepare seedbed": "ಬಿತ್ತನೆ ಮಡಿ ಸಿದ್ಧಪಡಿಸಿ",
+    "Sow seeds 12 inches apart in rows, with 4 inches between seeds": "ಸಾಲುಗಳ ನಡುವೆ 12 ಇಂಚು ಮತ್ತು ಬೀಜಗಳ ನಡುವೆ 4 ಇಂಚು ಅಂತರವಿರಲಿ",
+    "Irrigate lightly": "ಹಗುರವಾಗಿ ನೀರು ಕೊಡಿ",
+    "Weed at 20-25 days after sowing": "ಬಿತ್ತನೆ ಮಾಡಿದ 20-25 ದಿನಗಳ ನಂತರ ಕಳೆ ತೆಗೆಯಿರಿ",
+    "yellow mosaic and thrips": "ಹಳದಿ ಎಲೆ ರೋಗ ಮತ್ತು ನುಸಿ ಕೀಟ",
+    "Harvest when 80% pods mature": "ಶೇ. 80 ರಷ್ಟು ಕಾಯಿಗಳು ಮಾಗಿದಾಗ ಕೊಯ್ಲು ಮಾಡಿ",
+    "Dry plants on tarpaulin": "ಗಿಡಗಳನ್ನು ಟಾರ್ಪಾಲಿನ್ ಮೇಲೆ ಒಣಗಿಸಿ",
+    "Thin seedlings to one per hill": "ಪ್ರತಿ ಗುಂಡಿಯಲ್ಲಿ ಒಂದು ಸಸಿ ಮಾತ್ರ ಇರುವಂತೆ ಮಾಡಿ",
+    "Thinning": "ಗಿಡಗಳ ವಿರಳೀಕರಣ",
+    "leaf yellowing for maturation signals": "ಬೆಳೆ ಮಾಗುವ ಸೂಚನೆಯಾಗಿ ಎಲೆಗಳು ಹಳದಿ ಬಣ್ಣಕ್ಕೆ ತಿರುಗುವುದನ್ನು ಗಮನಿಸಿ",
+    "Maintain exactly 5% moisture": "ತೈಲದ ಅಂಶ ಕೆಡದಂತೆ ನಿಖರವಾಗಿ ಶೇ. 5 ರಷ್ಟು ತೇವಾಂಶ ಕಾಪಾಡಿಕೊಳ್ಳಿ",
+    "700-gauge poly bags": "700-ಗೇಜ್ ಪಾಲಿ ಬ್ಯಾಗ್ ಬಳಸಿ",
+    "Clear crop residues": "ಬೆಳೆಯ ಕಸಕಡ್ಡಿಗಳನ್ನು ಸ್ವಚ್ಛಗೊಳಿಸಿ",
+    "Apply 200kg/Acre Lime/Dolomite": "ಎಕರೆಗೆ 200 ಕೆಜಿ ಸುಣ್ಣ ಅಥವಾ ಡೋಲೊಮೈಟ್ ಹಾಕಿ",
+    "Ensure proper drainage": "ನೀರನ್ನು ಹೊರಹೋಗಲು ಸರಿಯಾದ ವ್ಯವಸ್ಥೆ ಮಾಡಿ",
+    "Near sea? Check water salinity": "ಸಮುದ್ರದ ಸಮೀಪವಿದ್ದರೆ ನೀರಿನ ಉಪ್ಪಿನಂಶ ಪರೀಕ್ಷಿಸಿ",
+    "Panicle emergence monitoring": "ತೆನೆ ಬರುವ ಹಂತವನ್ನು ಗಮನಿಸಿ",
+    "Maintain nursery irrigation": "ಸಸಿಮಡಿಗೆ ಸರಿಯಾಗಿ ನೀರು ಕೊಡಿ",
+    "Apply 6 kg/Acre MgSO4": "ಎಕರೆಗೆ 6 ಕೆಜಿ ಮೆಗ್ನೀಸಿಯಮ್ ಸಲ್ಫೇಟ್ ಹಾಕಿ",
+    "Scout: BSFB": "ಪರಿಶೀಲಿಸಿ: ಕಾಯಿ ಕೊರಕ",
+    "Scout: Whitefly": "ಪರಿಶೀಲಿಸಿ: ಬಿಳಿ ನೊಣ",
+    "YVMV vector": "ವೈವಿಎಂವಿ ವೈರಸ್ ಹರಡುವ ಕೀಟ",
+    "Apply Imidacloprid for Whiteflies": "ಬಿಳಿ ನೊಣದ ನಿಯಂತ್ರಣಕ್ಕೆ ಇಮಿಡಾಕ್ಲೋಪ್ರಿಡ್ ಬಳಸಿ",
+    "Harvest when fruit is shiny, firm and medium-sized": "ಹಣ್ಣು ಹೊಳೆಯುವಂತೆ, ಗಟ್ಟಿಯಾಗಿ ಮತ್ತು ಮಧ್ಯಮ ಗಾತ್ರದಲ್ಲಿದ್ದಾಗ ಕೊಯ್ಲು ಮಾಡಿ",
+    "Soil test & compost": "ಮಣ್ಣು ಪರೀಕ್ಷೆ ಮತ್ತು ಕೊಟ್ಟಿಗೆ ಗೊಬ್ಬರ",
+    "125 kg/Acre Gypsum powder": "ಎಕರೆಗೆ 125 ಕೆಜಿ ಜಿಪ್ಸಮ್ ಪುಡಿ",
+    "(half of 250kg/Acre total)": "(ಒಟ್ಟು 250 ಕೆಜಿ ಜಿಪ್ಸಮ್‌ನಲ್ಲಿ ಅರ್ಧದಷ್ಟು)",
+    "give small water": "ಅಲ್ಪ ಪ್ರಮಾಣದ ನೀರು ಕೊಡಿ",
+    "Apply 10 kg Urea for Growth to maximize pod yield": "ಹೆಚ್ಚಿನ ಕಾಯಿ ಇಳುವರಿಗಾಗಿ 10 ಕೆಜಿ ಯೂರಿಯಾ ಹಾಕಿ",
+    "DO NOT allow soil to dry now - critical for pod formation": "ಈ ಸಮಯದಲ್ಲಿ ಮಣ್ಣು ಒಣಗಲು ಬಿಡಬೇಡಿ - ಕಾಯಿ ಕಟ್ಟಲು ಇದು ನಿರ್ಣಾಯಕ ಹಂತ",
+    "See if pods are growing well": "ಕಾಯಿಗಳು ಚೆನ್ನಾಗಿ ಬೆಳೆಯುತ್ತಿವೆಯೇ ಎಂದು ನೋಡಿ",
+    "(If you see 5-10 in one hill )": "(ಒಂದು ಗುಣಿಯಲ್ಲಿ 5-10 ಕಂಡುಬಂದರೆ)",
+    "(If you see 5-10 in one leaf )": "(ಒಂದು ಎಲೆಯಲ್ಲಿ 5-10 ಕಂಡುಬಂದರೆ)",
+    "Gall Midge (Mahaveer is resistant)": "ಗಾಲ್ ಮಿಡ್ಜ್ (ಹಿಪ್ಪುಳ) (ಮಹಾವೀರ್ ತಳಿ ಇದಕ್ಕೆ ನಿರೋಧಕ ಶಕ್ತಿ ಹೊಂದಿದೆ)",
+    "Note: Mahaveer is highly resistant to Gall Midge": "ಸೂಚನೆ: ಮಹಾವೀರ್ ತಳಿಯು ಗಾಲ್ ಮಿಡ್ಜ್ (ಹಿಪ್ಪುಳ) ಕೀಟಕ್ಕೆ ಹೆಚ್ಚಿನ ನಿರೋಧಕ ಶಕ್ತಿ ಹೊಂದಿದೆ",
+    "Transplant seedlings to field (if nursery)": "ಸಸಿಗಳನ್ನು ಜಮೀನಿಗೆ ನಾಟಿ ಮಾಡಿ (ಸಸಿಮಡಿ ಮಾಡಿದ್ದರೆ)",
+    "Give water first time after sowing": "ಬಿತ್ತನೆಯ ನಂತರ ಮೊದಲ ಬಾರಿ ನೀರು ಕೊಡಿ",
+    "Keep harvest safe and dry": "ಕೊಯ್ಲು ಮಾಡಿದ ಬೆಳೆಯನ್ನು ಸುರಕ್ಷಿತವಾಗಿ ಒಣ ಜಾಗದಲ್ಲಿ ಇಡಿ",
+    "Measure crop yield": "ಬೆಳೆಯ ಇಳುವರಿಯನ್ನು ಅಳೆಯಿರಿ",
+    "Field cleanup": "ಜಮೀನನ್ನು ಸ್ವಚ್ಛಗೊಳಿಸಿ",
+    "8 kg/Acre Zinc": "ಎಕರೆಗೆ 8 ಕೆಜಿ ಜಿಂಕ್ ಸಲ್ಫೇಟ್",
+    "(about ankle deep)": "(ಸುಮಾರು ಪಾದದ ಗಂಟಿನಷ್ಟು ಆಳ)",
+    "(ETL: 1-2 egg masses/sq.m)": "(ಆರ್ಥಿಕ ನಷ್ಟದ ಮಿತಿ: ಪ್ರತಿ ಚದರ ಮೀಟರ್‌ಗೆ 1-2 ಮೊಟ್ಟೆ ಗುಂಪುಗಳು)",
+    "(ETL: 1% leaf area)": "(ಆರ್ಥಿಕ ನಷ್ಟದ ಮಿತಿ: ಶೇ. 1 ಎಲೆ ಭಾಗ)",
+    "(ETL 1% leaf area)": "(ಆರ್ಥಿಕ ನಷ್ಟದ ಮಿತಿ: ಶೇ. 1 ಎಲೆ ಭಾಗ)",
+    "if needed": "ಅಗತ್ಯವಿದ್ದರೆ",
+    "Start sowing seeds in nursery trays": "ಸಸಿಮಡಿ ಟ್ರೇಗಳಲ್ಲಿ ಬೀಜ ಬಿತ್ತನೆ ಪ್ರಾರಂಭಿಸಿ",
+    "Continue irrigation": "ನೀರಾವರಿ ಮುಂದುವರಿಸಿ",
+    "Remove weeds again": "ಮತ್ತೊಮ್ಮೆ ಕಳೆ ತೆಗೆಯಿರಿ",
+    "Remove weeds": "ಕಳೆ ತೆಗೆಯಿರಿ",
+    "Irrigation (weather dependent)": "ನೀರಾವರಿ (ಹವಾಮಾನಕ್ಕೆ ಅನುಗುಣವಾಗಿ)",
+    "Check crop often": "ಬೆಳೆಯನ್ನು ಆಗಾಗ ಪರಿಶೀಲಿಸಿ",
+    "Use spray to stop disease": "ರೋಗ ತಡೆಯಲು ಸಿಂಪಡಣೆ ಮಾಡಿ",
+    "Get ready to drain water before harvest": "ಕೊಯ್ಲಿಗೆ ಮೊದಲು ನೀರನ್ನು ಹೊರಹಾಕಲು ಸಿದ್ಧರಾಗಿ",
+    "Start cutting crop by hand or machine": "ಕೈಯಿಂದ ಅಥವಾ ಯಂತ್ರದಿಂದ ಬೆಳೆ ಕೊಯ್ಲು ಪ್ರಾರಂಭಿಸಿ",
+    "Dry pods to 7-8% moisture to prevent Aflatoxin": "ಅಫಲಾಟಾಕ್ಸಿನ್ (ಬೂಷ್ಟು) ಬರದಂತೆ ತಡೆಯಲು ಕಾಯಿಗಳನ್ನು ಶೇ. 7-8 ತೇವಾಂಶ ಬರುವವರೆಗೆ ಒಣಗಿಸಿ",
+    "See how much you harvested": "ಎಷ್ಟು ಇಳುವರಿ ಬಂದಿದೆ ಎಂದು ನೋಡಿ",
+    "(10,000 ppm @ 7.5 ml/kg)": "(10,000 ಪಿಪಿಎಂ, ಪ್ರತಿ ಕೆಜಿಗೆ 7.5 ಮಿ.ಲೀ.)",
+    "Remove weak seedlings and continue watering": "ಬಲಹೀನ ಸಸಿಗಳನ್ನು ತೆಗೆಯಿರಿ ಮತ್ತು ನೀರು ಕೊಡುವುದನ್ನು ಮುಂದುವರಿಸಿ",
+    "Apply Fertilizer": "ಗೊಬ್ಬರ ಹಾಕಿ",
+    "Water newly planted seedlings": "ಹೊಸದಾಗಿ ನಾಟಿ ಮಾಡಿದ ಸಸಿಗಳಿಗೆ ನೀರು ಕೊಡಿ",
+    "Continue plant care and monitoring": "ಗಿಡಗಳ ಆರೈಕೆ ಮತ್ತು ಗಮನಿಸುವಿಕೆಯನ್ನು ಮುಂದುವರಿಸಿ",
+    "Adjust water based on need": "ಅಗತ್ಯಕ್ಕೆ ತಕ್ಕಂತೆ ನೀರಿನ ಪ್ರಮಾಣ ಹೊಂದಿಸಿ",
+    "Manage water based on need": "ಅಗತ್ಯಕ್ಕೆ ತಕ್ಕಂತೆ ನೀರು ನಿರ್ವಹಿಸಿ",
+    "Water based on rain or dryness": "ಮಳೆ ಅಥವಾ ಒಣಹವೆಗೆ ತಕ್ಕಂತೆ ನೀರು ಕೊಡಿ",
+    "Harvesting starts": "ಕೊಯ್ಲು ಪ್ರಾರಂಭ",
+    "Weed removal": "ಕಳೆ ತೆಗೆಯುವುದು",
+    "Don’t let soil dry up": "ಮಣ್ಣು ಒಣಗಲು ಬಿಡಬೇಡಿ",
+    "Scout for late-stage pests": "ಕೊನೆಯ ಹಂತದ ಕೀಟಗಳಿಗಾಗಿ ಪರಿಶೀಲಿಸಿ",
+    "Scout for capsule borer": "ಕಾಯಿ ಕೊರಕಕ್ಕಾಗಿ ಪರಿಶೀಲಿಸಿ",
+    "Scout for pests": "ಕೀಟಗಳಿಗಾಗಿ ಪರಿಶೀಲಿಸಿ",
+    "Prepare for harvest": "ಕೊಯ್ಲಿಗೆ ಸಿದ್ಧತೆ ಮಾಡಿ",
+    "Prepare for pod harvest": "ಕಾಯಿ ಕೊಯ್ಲಿಗೆ ಸಿದ್ಧತೆ ಮಾಡಿ",
+    "Clean and repair field and leave land ready for next crop": "ಜಮೀನನ್ನು ಸ್ವಚ್ಛಗೊಳಿಸಿ, ಬದುಗಳನ್ನು ಸರಿಪಡಿಸಿ ಮತ್ತು ಮುಂದಿನ ಬೆಳೆಗೆ ಭೂಮಿಯನ್ನು ಸಿದ್ಧವಾಗಿಡಿ",
+    "Pest / disease scouting": "ಕೀಟ / ರೋಗ ಪರಿಶೀಲನೆ",
+    "Irrigation if required": "ಅಗತ್ಯವಿದ್ದರೆ ನೀರಾವರಿ",
+    "Start cutting (hand/machine)": "ಕೊಯ್ಲು ಪ್ರಾರಂಭಿಸಿ (ಕೈಯಿಂದ/ಯಂತ್ರದಿಂದ)",
+    "Drying, pod separation, yield check, remove waste": "ಒಣಗಿಸುವುದು, ಕಾಯಿ ಬೇರ್ಪಡಿಸುವುದು, ಇಳುವರಿ ಪರಿಶೀಲನೆ, ಕಸ ತೆಗೆಯುವುದು",
+    "(Monitor with Pheromone/Fish meal traps)": "(ಫೆರೋಮೋನ್ ಅಥವಾ ಮೀನಿನ ಪುಡಿ ಬಲೆಗಳಿಂದ ಗಮನಿಸಿ)",
+    "(Cue-lure / Fish meal traps)": "(ಕ್ಯೂ-ಲ್ಯೂರ್ / ಮೀನಿನ ಪುಡಿ ಬಲೆಗಳು)",
+    "(Monitor with pheromone traps)": "(ಫೆರೋಮೋನ್ ಬಲೆಗಳಿಂದ ಗಮನಿಸಿ)",
+    "(Pheromone traps 100/ha)": "(ಹೆಕ್ಟೇರಿಗೆ 100 ಫೆರೋಮೋನ್ ಬಲೆಗಳು)",
+    "Irrigate lightly after sowing": "ಬಿತ್ತನೆಯ ನಂತರ ಹಗುರವಾಗಿ ನೀರು ಕೊಡಿ",
+    "Irrigate at flowering": "ಹೂ ಬಿಡುವ ಹಂತದಲ್ಲಿ ನೀರು ಕೊಡಿ",
+    "Apply specific NPK": "ನಿರ್ದಿಷ್ಟ ಪ್ರಮಾಣದ ಎನ್‌ಪಿಕೆ ಗೊಬ್ಬರ ಹಾಕಿ",
+    "Nursery/seeding in trays": "ಟ್ರೇಗಳಲ್ಲಿ ಸಸಿಮಡಿ/ಬೀಜ ಬಿತ್ತನೆ",
+    "Give compost or chemical fertilizer": "ಕೊಟ್ಟಿಗೆ ಗೊಬ್ಬರ ಅಥವಾ ರಾಸಾಯನಿಕ ಗೊಬ್ಬರ ಕೊಡಿ",
+    "Put young plants into field": "ಎಳೆಯ ಸಸಿಗಳನ್ನು ಜಮೀನಿಗೆ ನಾಟಿ ಮಾಡಿ",
+    "Transplant at 15x10 cm spacing": "15x10 ಸೆಂ.ಮೀ. ಅಂತರದಲ್ಲಿ ನಾಟಿ ಮಾಡಿ",
+    "Post transplant irrigation": "ನಾಟಿಯ ನಂತರ ನೀರಾವರಿ",
+    "Apply Fertilizer (50% N First Dose, full P & K)": "ಗೊಬ್ಬರ ಹಾಕಿ (ಮೊದಲ ಕಂತಾಗಿ ಶೇ. 50 ಯೂರಿಯಾ, ಪೂರ್ಣ ಡಿಎಪಿ/ಪೊಟ್ಯಾಶ್)",
+    "Apply final 25% Nitrogen (Grain forming stage split)": "ಕೊನೆಯ ಶೇ. 25 ರಷ್ಟು ಯೂರಿಯಾ ಹಾಕಿ (ಹಾಲು ತುಂಬುವ ಹಂತದ ಕಂತು)",
+    "Begin to remove water from field": "ಜಮೀನಿನಿಂದ ನೀರನ್ನು ಹೊರಹಾಕಲು ಪ್ರಾರಂಭಿಸಿ",
+    "Field draining & field checks": "ಜಮೀನಿನ ನೀರು ಹೊರಹಾಕುವಿಕೆ ಮತ್ತು ಜಮೀನಿನ ಪರಿಶೀಲನೆ",
+    "Field cleaning and bund maintenance": "ಜಮೀನಿನ ಸ್ವಚ್ಛತೆ ಮತ್ತು ಬದುಗಳ ನಿರ್ವಹಣೆ",
+    "Monitor crop health": "ಬೆಳೆಯ ಆರೋಗ್ಯವನ್ನು ಗಮನಿಸಿ",
+    "(45 DAS)": "(ಬಿತ್ತನೆ ಮಾಡಿದ 45 ದಿನಗಳ ನಂತರ)",
+    "(31 DAS)": "(ಬಿತ್ತನೆ ಮಾಡಿದ 31 ದಿನಗಳ ನಂತರ)",
+    "Scout: Aphids, Pod Borer, Mosaic Virus": "ಪರಿಶೀಲಿಸಿ: ಹೇನು, ಕಾಯಿ ಕೊರಕ ಮತ್ತು ಮೊಸಾಯಿಕ್ ವೈರಸ್",
+    "Dry grain to 9-10% moisture": "ಧಾನ್ಯವನ್ನು ಶೇ. 9-10 ರಷ್ಟು ತೇವಾಂಶ ಬರುವವರೆಗೆ ಒಣಗಿಸಿ",
+    "Apply Apply 50% Nitrogen and full Phosphorus/Potassium as First Dose (Fertilizer )": "ಬಿತ್ತನೆ ಸಮಯದಲ್ಲಿ ಶೇ. 50 ಯೂರಿಯಾ ಮತ್ತು ಪೂರ್ಣ ಡಿಎಪಿ/ಪೊಟ್ಯಾಶ್ ಗೊಬ್ಬರ ಹಾಕಿ",
+    "Apply 50% Nitrogen and full P & K as First Dose": "ಮೊದಲ ಕಂತಾಗಿ ಶೇ. 50 ಯೂರಿಯಾ ಮತ್ತು ಪೂರ್ಣ ಡಿಎಪಿ/ಪೊಟ್ಯಾಶ್ ಹಾಕಿ",
+    "Apply 50% Nitrogen split and full dose of Phosphorus and Potassium as First Dose (62.Fertilizer )": "ಮೊದಲ ಕಂತಾಗಿ ಶೇ. 50 ಯೂರಿಯಾ ಮತ್ತು ಪೂರ್ಣ ಪ್ರಮಾಣದ ಡಿಎಪಿ/ಪೊಟ್ಯಾಶ್ ಗೊಬ್ಬರ ಹಾಕಿ",
+    "Apply 12.5:25:12.Fertilizer (5) kg/ha as First Dose dose": "ಮೊದಲ ಕಂತಾಗಿ ಹೆಕ್ಟೇರಿಗೆ 12.5:25:12.5 ಕೆಜಿ ಎನ್:ಪಿ:ಕೆ ಗೊಬ್ಬರ ಹಾಕಿ",
+    "Sow seeds at 250x60 cm spacing": "250x60 ಸೆಂ.ಮೀ. ಅಂತರದಲ್ಲಿ ಬೀಜ ಬಿತ್ತಿ",
+    "Treat seeds and sow at 45x10 cm spacing": "ಬೀಜೋಪಚಾರ ಮಾಡಿ 45x10 ಸೆಂ.ಮೀ. ಅಂತರದಲ್ಲಿ ಬಿತ್ತನೆ ಮಾಡಿ",
+    "Apply remaining 50% Urea for Growth": "ಗಿಡದ ಬೆಳವಣಿಗೆಗಾಗಿ ಉಳಿದ ಶೇ. 50 ರಷ್ಟು ಯೂರಿಯಾ ಹಾಕಿ",
+    "Apply Urea for Growth split (e.g., 1/3 of the 50 kg/Acre total) at the fruit initiation stage": "ಕಾಯಿ ಕಟ್ಟುವ ಹಂತದಲ್ಲಿ ಬೆಳವಣಿಗೆಗಾಗಿ ಯೂರಿಯಾದ ಒಂದು ಕಂತು ಹಾಕಿ (ಉದಾ: ಎಕರೆಗೆ ಒಟ್ಟು 50 ಕೆಜಿಯಲ್ಲಿ 1/3 ಭಾಗ)",
+    "Check for withering of the tendril at the fruit axil and a dull sound when thumping the fruit to judge harvest readiness": "ಕೊಯ್ಲಿಗೆ ಸಿದ್ಧವಾಗಿದೆಯೇ ಎಂದು ತಿಳಿಯಲು ಹಣ್ಣಿನ ಬಳಿಯ ಬಳ್ಳಿಯ ಸುರುಳಿ ಒಣಗಿದೆಯೇ ಮತ್ತು ಹಣ್ಣನ್ನು ತಟ್ಟಿದಾಗ ಮಂದವಾದ ಶಬ್ದ ಬರುತ್ತದೆಯೇ ಎಂದು ಪರೀಕ್ಷಿಸಿ",
+    "Harvest when fruit gives a 'dull' sound when tapped and tendril dries": "ಹಣ್ಣನ್ನು ತಟ್ಟಿದಾಗ 'ಮಂದ' ಶಬ್ದ ಬಂದಾಗ ಮತ್ತು ಬಳ್ಳಿಯ ಸುರುಳಿ ಒಣಗಿದಾಗ ಕೊಯ್ಲು ಮಾಡಿ",
+    "Treat seeds with PSB & Azospirillum and inoculate with Rhizobium": "ಪಿಎಸ್ಬಿ ಮತ್ತು ಅಜೋಸ್ಪೈರಿಲಮ್‌ನೊಂದಿಗೆ ಬೀಜೋಪಚಾರ ಮಾಡಿ ಮತ್ತು ರೈಜೋಬಿಯಂ ಲೇಪನ ಮಾಡಿ",
+    "Sow at Sow seeds 12 inches apart in rows, with 4 inches between seeds spacing": "ಸಾಲುಗಳ ನಡುವೆ 12 ಇಂಚು ಮತ್ತು ಬೀಜಗಳ ನಡುವೆ 4 ಇಂಚು ಅಂತರದಲ್ಲಿ ಬಿತ್ತನೆ ಮಾಡಿ",
+    "Treat seeds with PSB & Azospirillum and sow at Sow seeds 12 inches apart in rows, with 4 inches between seeds spacing": "ಪಿಎಸ್ಬಿ ಮತ್ತು ಅಜೋಸ್ಪೈರಿಲಮ್‌ನೊಂದಿಗೆ ಬೀಜೋಪಚಾರ ಮಾಡಿ, ಸಾಲುಗಳ ನಡುವೆ 12 ಇಂಚು ಮತ್ತು ಬೀಜಗಳ ನಡುವೆ 4 ಇಂಚು ಅಂತರದಲ್ಲಿ ಬಿತ್ತನೆ ಮಾಡಿ",
+    "Growth Dose small nitrogen dose if needed": "ಅಗತ್ಯವಿದ್ದರೆ ಬೆಳವಣಿಗೆಗಾಗಿ ಸ್ವಲ್ಪ ಯೂರಿಯಾ ಹಾಕಿ",
+    "Growth Dose small nitrogen dose": "ಬೆಳವಣಿಗೆಗಾಗಿ ಸ್ವಲ್ಪ ಯೂರಿಯಾ ಹಾಕಿ",
+    "Growth Dose 50% N (3 weeks after sowing)": "ಬೆಳವಣಿಗೆಗಾಗಿ ಶೇ. 50 ಯೂರಿಯಾ ಹಾಕಿ (ಬಿತ್ತನೆ ಮಾಡಿದ 3 ವಾರಗಳ ನಂತರ)",
+    "Check for yellow mosaic and thrips": "ಹಳದಿ ಎಲೆ ರೋಗ ಮತ್ತು ನುಸಿ ಕೀಟಕ್ಕಾಗಿ ಪರಿಶೀಲಿಸಿ",
+    "Check for leaf spot and phyllody": "ಎಲೆಚುಕ್ಕೆ ಮತ್ತು ಫಿಲೋಡಿ ರೋಗಕ್ಕಾಗಿ ಪರಿಶೀಲಿಸಿ",
+    "Check for aphids and pod borer": "ಹೇನು ಮತ್ತು ಕಾಯಿ ಕೊರಕಕ್ಕಾಗಿ ಪರಿಶೀಲಿಸಿ",
+    "Monitor for leaf spot": "ಎಲೆಚುಕ್ಕೆ ರೋಗವನ್ನು ಗಮನಿಸಿ",
+    "Check pod maturity": "ಕಾಯಿ ಬಲಿತಿರುವುದನ್ನು ಪರೀಕ್ಷಿಸಿ",
+    "Monitor capsule Fully ripe stage": "ಕಾಯಿಗಳು ಪೂರ್ಣವಾಗಿ ಮಾಗುವ ಹಂತವನ್ನು ಗಮನಿಸಿ",
+    "Monitor pod filling": "ಕಾಯಿ ತುಂಬುವಿಕೆಯನ್ನು ಗಮನಿಸಿ",
+    "Check root health": "ಬೇರಿನ ಆರೋಗ್ಯವನ್ನು ಪರಿಶೀಲಿಸಿ",
+    "Observe leaf yellowing for maturation signals": "ಬೆಳೆ ಮಾಗುವ ಸೂಚನೆಯಾಗಿ ಎಲೆಗಳು ಹಳದಿ ಬಣ್ಣಕ್ಕೆ ತಿರುಗುವುದನ್ನು ಗಮನಿಸಿ",
+    "Thresh": "ಒಕ್ಕಣೆ ಮಾಡಿ",
+    "Thresh and dry grain": "ಒಕ್ಕಣೆ ಮಾಡಿ ಧಾನ್ಯವನ್ನು ಒಣಗಿಸಿ",
+    "Thresh on tarpaulin": "ಟಾರ್ಪಾಲಿನ್ ಮೇಲೆ ಒಕ್ಕಣೆ ಮಾಡಿ",
+    "Threshing & drying": "ಒಕ್ಕಣೆ ಮತ್ತು ಒಣಗಿಸುವುದು",
+    "Prepare threshing floor": "ಒಕ್ಕಣೆ ಕಣವನ್ನು ಸಿದ್ಧಪಡಿಸಿ",
+    "Dry pods in sun": "ಕಾಯಿಗಳನ್ನು ಬಿಸಿಲಿನಲ್ಲಿ ಒಣಗಿಸಿ",
+    "Dry bundles upright for a week": "ಕಟ್ಟುಗಳನ್ನು ಒಂದು ವಾರ ನೇರವಾಗಿ ನಿಲ್ಲಿಸಿ ಒಣಗಿಸಿ",
+    "Prepare firm seedbed": "ಗಟ್ಟಿಯಾದ ಬಿತ್ತನೆ ಮಡಿ ಸಿದ್ಧಪಡಿಸಿ",
+    "Prepare fine seedbed": "ನಯವಾದ ಬಿತ್ತನೆ ಮಡಿ ಸಿದ್ಧಪಡಿಸಿ",
+    "Spray if needed": "ಅಗತ್ಯವಿದ್ದರೆ ಸಿಂಪಡಿಸಿ",
+    "Spray for capsule borer if needed": "ಅಗತ್ಯವಿದ್ದರೆ ಕಾಯಿ ಕೊರಕಕ್ಕಾಗಿ ಸಿಂಪಡಿಸಿ",
+    "Spray pest control if needed": "ಅಗತ್ಯವಿದ್ದರೆ ಕೀಟನಾಶಕ ಸಿಂಪಡಿಸಿ",
+    "Weed if needed": "ಅಗತ್ಯವಿದ್ದರೆ ಕಳೆ ತೆಗೆಯಿರಿ",
+    "Fumigate store if needed": "ಅಗತ್ಯವಿದ್ದರೆ ಉಗ್ರಾಣಕ್ಕೆ ಧೂಮೀಕರಣ ಮಾಡಿ",
+    "Plan harvest": "ಕೊಯ್ಲಿಗೆ ಯೋಜನೆ ಮಾಡಿ",
+    "Plan for harvest in Feb Week 1": "ಫೆಬ್ರವರಿ ಮೊದಲ ವಾರದಲ್ಲಿ ಕೊಯ್ಲಿಗೆ ಯೋಜನೆ ಮಾಡಿ",
+    "Harvest planning": "ಕೊಯ್ಲಿನ ಯೋಜನೆ",
+    "Stop irrigation": "ನೀರಾವರಿ ನಿಲ್ಲಿಸಿ",
+    "Harvest when capsules yellow and split": "ಕಾಯಿಗಳು ಹಳದಿಯಾಗಿ ಬಿರಿಯುವಾಗ ಕೊಯ್ಲು ಮಾಡಿ",
+    "Harvest dry pods in splits": "ಒಣಗಿದ ಕಾಯಿಗಳನ್ನು ಹಂತ ಹಂತವಾಗಿ ಕೊಯ್ಲು ಮಾಡಿ",
+    "Maintain exactly 5% moisture using 700-gauge poly bags to prevent oil degradation": "ತೈಲದ ಅಂಶ ಕೆಡದಂತೆ 700-ಗೇಜ್ ಪಾಲಿ ಬ್ಯಾಗ್ ಬಳಸಿ ನಿಖರವಾಗಿ ಶೇ. 5 ರಷ್ಟು ತೇವಾಂಶ ಕಾಪಾಡಿಕೊಳ್ಳಿ",
+    "Maintain soil moisture": "ಮಣ್ಣಿನ ತೇವಾಂಶ ಕಾಪಾಡಿಕೊಳ್ಳಿ",
+    "Prepare land for next crop": "ಮುಂದಿನ ಬೆಳೆಗೆ ಭೂಮಿಯನ್ನು ಸಿದ್ಧಪಡಿಸಿ",
+    "Check stored seed moisture": "ಸಂಗ್ರಹಿಸಿದ ಬೀಜದ ತೇವಾಂಶವನ್ನು ಪರೀಕ್ಷಿಸಿ",
+    "See if grains are starting to grow": "ಧಾನ್ಯಗಳು ಬೆಳೆಯಲು ಪ್ರಾರಂಭಿಸಿವೆಯೇ ಎಂದು ನೋಡಿ",
+    "Second week of October: Cut and collect the crop (130-135 days maturity)": "ಅಕ್ಟೋಬರ್ ಎರಡನೇ ವಾರ: ಬೆಳೆಯನ್ನು ಕೊಯ್ಲು ಮಾಡಿ ಮತ್ತು ಸಂಗ್ರಹಿಸಿ (130-135 ದಿನಗಳಲ್ಲಿ ಬಲಿಯುತ್ತದೆ)",
+    "First week:": "ಮೊದಲ ವಾರ:",
+    "Second week:": "ಎರಡನೇ ವಾರ:",
+    "Spray for Rice Blast (Prioritize Blast-tolerant varieties like KMP-220)": "ಭತ್ತದ ಬೆಂಕಿರೋಗಕ್ಕಾಗಿ ಸಿಂಪಡಿಸಿ (ಕೆಎಂಪಿ-220 ನಂತಹ ರೋಗ ನಿರೋಧಕ ತಳಿಗಳಿಗೆ ಆದ್ಯತೆ ನೀಡಿ)",
+    "and Stem Borer": "ಮತ್ತು ಕಾಂಡಕೊರಕ",
+    "Store rice and clean field": "ಭತ್ತವನ್ನು ಸಂಗ್ರಹಿಸಿ ಮತ್ತು ಜಮೀನನ್ನು ಸ್ವಚ್ಛಗೊಳಿಸಿ",
+    "Brinjal needs 125:100:50": "ಬದನೆಕಾಯಿಗೆ 125:100:50 ಅನುಪಾತದಲ್ಲಿ ಎನ್:ಪಿ:ಕೆ ಗೊಬ್ಬರ ಬೇಕು",
+    "Spray Spinosad 45 SC for BSFB": "ಕಾಯಿ ಕೊರಕಕ್ಕಾಗಿ ಸ್ಪಿನೋಸ್ಯಾಡ್ 45 ಎಸ್‌ಸಿ ಸಿಂಪಡಿಸಿ",
+    "Scout: Thrips and Mites": "ಪರಿಶೀಲಿಸಿ: ನುಸಿ ಕೀಟ ಮತ್ತು ಜೇಡ ನುಸಿ",
+    "Spray Fipronil 80% WG or Diafenthiuron": "ಫಿಪ್ರೊನಿಲ್ 80% ಡಬ್ಲ್ಯೂಜಿ ಅಥವಾ ಡಯಾಫೆಂಥಿಯುರಾನ್ ಸಿಂಪಡಿಸಿ",
+    "Spray Imidacloprid for Whiteflies": "ಬಿಳಿ ನೊಣದ ನಿಯಂತ್ರಣಕ್ಕೆ ಇಮಿಡಾಕ್ಲೋಪ್ರಿಡ್ ಸಿಂಪಡಿಸಿ",
+    "Use machine to cut crop": "ಯಂತ್ರದಿಂದ ಬೆಳೆ ಕೊಯ್ಲು ಮಾಡಿ",
+    "Completing harvest": "ಕೊಯ್ಲು ಪೂರ್ಣಗೊಳಿಸಿ",
+    "Clean the field after harvest": "ಕೊಯ್ಲಿನ ನಂತರ ಜಮೀನನ್ನು ಸ್ವಚ್ಛಗೊಳಿಸಿ",
+    "Kharif": "ಖಾರಿಫ್",
+    "Rabi": "ಹಿಂಗಾರು (ರಬಿ)",
+    "Summer": "ಬೇಸಿಗೆ",
+    "Paddy": "ಭತ್ತ",
+    "Groundnut": "ಶೇಂಗಾ",
+    "Black gram": "ಉದ್ದು",
+    "Green gram": "ಹೆಸರು ಬೇಳೆ",
+    "Cowpea": "ಅಲಸಂದೆ",
+    "Sesame": "ಎಳ್ಳು",
+    "Vegetables": "ತರಕಾರಿಗಳು",
+    "Cucumber": "ಸೌತೆಕಾಯಿ",
+    "Watermelon": "ಕಲ್ಲಂಗಡಿ",
+    "Brinjal": "ಬದನೆಕಾಯಿ",
+    "Chilli": "ಮೆಣಸಿನಕಾಯಿ",
+    "Lady's Finger": "ಬೆಂಡೆಕಾಯಿ",
+    "June": "ಜೂನ್",
+    "July": "ಜುಲೈ",
+    "August": "ಆಗಸ್ಟ್",
+    "September": "ಸೆಪ್ಟೆಂಬರ್",
+    "October": "ಅಕ್ಟೋಬರ್",
+    "November": "ನವೆಂಬರ್",
+    "December": "ಡಿಸೆಂಬರ್",
+    "January": "ಜನವರಿ",
+    "February": "ಫೆಬ್ರವರಿ",
+    "March": "ಮಾರ್ಚ್",
+    "April": "ಏಪ್ರಿಲ್",
+    "May": "ಮೇ"
+}
+
+LATIN_WORD = re.compile(r"[A-Za-z]{2,}")
+
+
+class Translator:
+    """Single-pass glossary translator with a per-fragment cache."""
+
+    def __init__(self, glossary: dict, resting: str = RESTING_KN):
+        self.glossary = glossary
+        self.resting = resting
+        # Alternation tries keys in order, so longest-first gives leftmost-longest matches
+        self.pattern = re.compile("|".join(re.escape(k) for k in sorted(glossary, key=len, reverse=True)))
+        self._cache = {}
+        # fragment -> times seen, for fragments that still contain English after translation
+        self.untranslated = Counter()
+
+    def translate_fragment(self, fragment: str) -> str:
+        cached = self._cache.get(fragment)
+        if cached is None:
+            translated = self.pattern.sub(lambda m: self.glossary[m.group(0)], fragment)
+            # English words left outside any glossary match mean the fragment needs a new entry
+            cached = self._cache[fragment] = (translated, bool(LATIN_WORD.search(self.pattern.sub("", fragment))))
+        translated, incomplete = cached
+        if incomplete:
+            self.untranslated[fragment] += 1
+        return translated
+
+    def translate(self, text: str) -> str:
+        if not text or text.strip() == "" or text.strip().lower() == "field resting":
+            return self.resting
+        return " | ".join(self.translate_fragment(part.strip()) for part in text.split("|"))
+
+    def stats(self) -> dict:
+        return {"unique_fragments": len(self._cache), "untranslated": len(self.untranslated)}
+
+
+def generate(input_path: str, output_path: str, translator: Translator) -> int:
+    with open(input_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames + ['Week 1 (KN)', 'Week 2 (KN)', 'Week 3 (KN)', 'Week 4 (KN)']
+
+        # Streams row by row, so input size only costs time
+        count = 0
+        with open(output_path, 'w', newline='', encoding='utf-8') as out:
+            writer = csv.DictWriter(out, fieldnames=fieldnames)
+            writer.writeheader()
+            for row in reader:
+                for week in ('Week 1', 'Week 2', 'Week 3', 'Week 4'):
+                    row[f'{week} (KN)'] = translator.translate(row[week])
+                writer.writerow(row)
+                count += 1
+    return count
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Add Kannada week columns to the crop calendar CSV.")
+    parser.add_argument("--input", default="calendar.csv")
+    parser.add_argument("--output", default="calendar_bilingual.csv")
+    parser.add_argument("--untranslated", metavar="PATH", help="write every untranslated fragment and its count as CSV")
+    parser.add_argument("--strict", action="store_true", help="exit 1 if any fragment is left untranslated")
+    args = parser.parse_args(argv)
+
+    translator = Translator(KN_GLOSSARY)
+    started = time.perf_counter()
+    count = generate(args.input, args.output, translator)
+    elapsed = time.perf_counter() - started
+
+    stats = translator.stats()
+    print(f"Bilingual CSV generated successfully! {count} rows, {stats['unique_fragments']} unique fragments in {elapsed:.3f}s")
+    if translator.untranslated:
+        print(f"⚠️ {stats['untranslated']} fragments still contain English (add them to KN_GLOSSARY):")
+        for fragment, seen in translator.untranslated.most_common(20):
+            print(f"  {seen:>4}x  {fragment}")
+        if stats['untranslated'] > 20:
+            print(f"  ... and {stats['untranslated'] - 20} more")
+        if args.untranslated:
+            with open(args.untranslated, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['fragment', 'count'])
+                writer.writerows(translator.untranslated.most_common())
+        if args.strict:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
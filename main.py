@@ -1,20 +1,88 @@
-from fastapi import FastAPI, HTTPException, Query
+import time
+# Startup budget is measured from here, so this stays above the framework imports
+BOOT_STARTED = time.perf_counter()
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
-import aiosqlite
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Union
+from datetime import date, datetime
+import asyncio
+import atexit
+import dataclasses
+import gzip
+import hashlib
+import orjson
 import os
 import logging
+import queue
+import sqlite3
 from contextlib import asynccontextmanager
-from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import brotli
+except ImportError:  # Optional: clients still get gzip
+    brotli = None
+
+try:
+    import msgpack
+except ImportError:  # Optional: Accept: application/msgpack falls back to JSON
+    msgpack = None
+
+from admission import ConcurrencyGate, Overloaded, RateLimiter, RateLimitMiddleware, client_address
+from artifact import load_artifact
+from cache import SingleFlight, TTLCache
+from database import Database
+from engine import (
+    DATA_VERSION_QUERY, FRAGMENTS_QUERY, SNAPSHOT_QUERY, WILDCARD, CalendarKey, CalendarSnapshot, MonthlyActivity,
+    SnapshotHolder, StaticPlan, build_static_plan, cache_key_for, sowing_status, source_version,
+)
+from engine import resolve_plan as resolve_snapshot_plan
+from projection import Projection, columnar, parse_projection, project
+from metrics import REGISTRY, SNAPSHOT_RELOADS, SNAPSHOT_VARIETIES, STAGE_LATENCY, STARTUP, MetricsMiddleware, watch_admission, watch_cache, watch_pool, watch_single_flight
 
 # Production Logging Configuration
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+# Handlers only enqueue; a background listener thread does the actual (blocking) writes
+_log_queue = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_output)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_log_handler = QueueHandler(_log_queue)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))  # Final formatting happens in the listener
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
 logger = logging.getLogger("CropCalendarAPI")
 
 DB_PATH = "calendar.db"
+# Built by compile_calendar.py; preferred over DB_PATH when present
+ARTIFACT_PATH = os.environ.get("CALENDAR_ARTIFACT", "calendar.bin")
+RELOAD_INTERVAL = float(os.environ.get("CALENDAR_RELOAD_INTERVAL", "5"))
+CACHE_MAXSIZE = int(os.environ.get("CALENDAR_CACHE_SIZE", "512"))
+CACHE_TTL = float(os.environ.get("CALENDAR_CACHE_TTL", "3600"))
+BATCH_MAX_ITEMS = int(os.environ.get("CALENDAR_BATCH_MAX_ITEMS", "200"))
+# Progress lookups are O(1) each, but validation and encoding are not; larger registries use advisory.py
+PROGRESS_BATCH_MAX_ITEMS = int(os.environ.get("CALENDAR_PROGRESS_BATCH_MAX_ITEMS", "5000"))
+# Items handled between yields to the event loop, so one batch can't stall concurrent requests
+PROGRESS_BATCH_SLICE = 500
+# Render every (variety, language) after each load: "1" before serving, "background" while
+# serving (scale-to-zero deployments answer the first request sooner), "0" never
+PREWARM = os.environ.get("CALENDAR_PREWARM", "1")
+# "0" drops /docs, /redoc and /openapi.json; the schema itself is only ever built on first request
+DOCS = os.environ.get("CALENDAR_DOCS", "1") == "1"
+DB_POOL_SIZE = int(os.environ.get("CALENDAR_DB_POOL_SIZE", "4"))
+# Per-client token bucket (requests/second, burst); off by default. Buckets key on the peer address,
+# so behind a router set FORWARDED_ALLOW_IPS to the router's addresses (not "*") before enabling it
+RATE_LIMIT = float(os.environ.get("CALENDAR_RATE_LIMIT", "0"))
+RATE_BURST = float(os.environ.get("CALENDAR_RATE_BURST", "40"))
+# Cache-miss renders running at once, renders allowed to wait for a slot, and how long they wait
+MISS_CONCURRENCY = int(os.environ.get("CALENDAR_MISS_CONCURRENCY", "4"))
+MISS_QUEUE_SIZE = int(os.environ.get("CALENDAR_MISS_QUEUE_SIZE", "32"))
+MISS_QUEUE_TIMEOUT = float(os.environ.get("CALENDAR_MISS_QUEUE_TIMEOUT", "2"))
 
 # Pydantic Schema Models
 class CalendarRequest(BaseModel):
@@ -23,20 +91,11 @@ class CalendarRequest(BaseModel):
     variety: str
     language: str = "en"
 
-class WeeklyActivity(BaseModel):
-    week_number: int
-    field_operation: str
-    irrigation: str
-    fertilizer: str
-    weed_management: str
-    protection: str
-    stage: str
-
-class MonthlyActivity(BaseModel):
-    month: str
-    major_operations: List[str]
-    critical_actions: List[str]
-    weeks: List[WeeklyActivity]
+class CalendarQuery(CalendarRequest):
+    # Optional projection, same syntax as the GET query parameters
+    fields: Optional[str] = None
+    months: Optional[str] = None
+    weeks: Optional[str] = None
 
 class ProgressTracker(BaseModel):
     current_week: int
@@ -49,230 +108,686 @@ class OperationalPlanResponse(BaseModel):
     summary_by_month: dict
     progress: ProgressTracker
 
+class BatchCalendarRequest(BaseModel):
+    # crop and/or variety may be "*" to expand to every matching variety of the season
+    items: List[CalendarRequest]
 
-# Persistent Database Manager with Optimization
-class Database:
-    def __init__(self, db_path: str):
-        self.db_path = db_path
+class BatchItemResult(BaseModel):
+    request: CalendarRequest
+    status: int
+    data: Optional[OperationalPlanResponse] = None
+    error: Optional[Union[str, dict]] = None
 
-    async def get_conn(self):
-        conn = await aiosqlite.connect(self.db_path)
-        conn.row_factory = aiosqlite.Row
-        # Performance Tuning
-        await conn.execute("PRAGMA journal_mode=WAL")
-        await conn.execute("PRAGMA synchronous=NORMAL")
-        return conn
+class BatchCalendarResponse(BaseModel):
+    results: List[BatchItemResult]
 
-db = Database(DB_PATH)
-_cache = {}
+class ProgressResponse(BaseModel):
+    context: dict
+    as_of: date
+    sowing_date: Optional[date] = None
+    # Days since sowing (negative before it); None when estimated from the calendar month
+    day_offset: Optional[int] = None
+    # "estimated" without a sowing date; otherwise "upcoming", "in_progress" or "completed"
+    status: str
+    progress: ProgressTracker
+
+class ProgressItem(BaseModel):
+    id: Optional[str] = None
+    season: str
+    crop: str
+    variety: str
+    language: str = "en"
+    sowing_date: date
+    as_of: Optional[date] = None
+
+class BatchProgressRequest(BaseModel):
+    items: List[ProgressItem]
+    # Applies to items without their own as_of; defaults to today
+    as_of: Optional[date] = None
+
+class ProgressItemResult(BaseModel):
+    id: Optional[str] = None
+    status: int
+    data: Optional[ProgressResponse] = None
+    error: Optional[Union[str, dict]] = None
+
+class BatchProgressResponse(BaseModel):
+    results: List[ProgressItemResult]
+
+
+# Read-only connection pool; the request path never touches it, reloads and exports do
+db = Database(DB_PATH, size=DB_POOL_SIZE, immutable=os.environ.get("CALENDAR_DB_IMMUTABLE") == "1")
+store = SnapshotHolder()
+_cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+# Encoded response bodies, keyed by (cache key, date) because progress changes daily
+_rendered = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+# Projected and/or compact-encoded bodies, keyed by (full body digest, projection, media type)
+_projected = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL)
+# Concurrent misses for the same variant share one render
+_inflight = SingleFlight()
+# Background prewarm passes
+_background = set()
+limiter = RateLimiter(RATE_LIMIT, RATE_BURST)
+# Bounds request-driven misses only; prewarm renders are not admitted through it
+_miss_gate = ConcurrencyGate(MISS_CONCURRENCY, MISS_QUEUE_SIZE, MISS_QUEUE_TIMEOUT)
+watch_cache("plan", _cache)
+watch_cache("rendered", _rendered)
+watch_cache("projected", _projected)
+watch_single_flight(_inflight)
+watch_pool(db)
+watch_admission(limiter, _miss_gate)
+
+async def reload_snapshot(force: bool = False) -> bool:
+    # Build the new snapshot completely, then swap it in with a single assignment
+    source = ARTIFACT_PATH if os.path.exists(ARTIFACT_PATH) else DB_PATH
+    version = source_version(source)
+    if version is None or (not force and version == store.current.version):
+        return False
+    if source == ARTIFACT_PATH:
+        with STAGE_LATENCY.time(stage="artifact_load"):
+            snapshot = load_artifact(ARTIFACT_PATH)
+    else:
+        with STAGE_LATENCY.time(stage="db_query"):
+            # migrate.py publishes by renaming a new file over the old one; pooled connections
+            # still see the old file, so the mtime change gates a reset before the stamp is read
+            await db.reset()
+            data_version = await read_data_version()
+            if not force and data_version is not None and data_version == store.current.data_version:
+                # Same data republished: keep the snapshot and its warm caches
+                store.swap(dataclasses.replace(store.current, version=version))
+                return False
+            rows = await db.fetch_all(SNAPSHOT_QUERY)
+            fragments = {}
+            for fragment_id, language, text in await db.fetch_all(FRAGMENTS_QUERY):
+                fragments.setdefault(fragment_id, {})[language] = text
+        with STAGE_LATENCY.time(stage="categorize"):
+            snapshot = CalendarSnapshot.from_fragments(rows, fragments, version=version, data_version=data_version)
+    store.swap(snapshot)
+    SNAPSHOT_RELOADS.inc(source=source)
+    SNAPSHOT_VARIETIES.set(len(snapshot.names))
+    _cache.clear()
+    _rendered.clear()
+    _projected.clear()
+    logger.info(f"📦 Calendar snapshot loaded from {source}: {len(snapshot.names)} varieties in {', '.join(snapshot.languages)}")
+    if PREWARM == "1":
+        logger.info(f"🔥 Pre-warmed {await prewarm()} calendar variants")
+    elif PREWARM == "background":
+        schedule_prewarm()
+    return True
+
+async def read_data_version() -> Optional[str]:
+    try:
+        rows = await db.fetch_all(DATA_VERSION_QUERY)
+    except sqlite3.OperationalError:
+        return None  # Database built before migrate.py stamped versions
+    return rows[0][0] if rows else None
+
+async def watch_snapshot():
+    while True:
+        await asyncio.sleep(RELOAD_INTERVAL)
+        try:
+            await reload_snapshot()
+        except Exception as e:
+            logger.error(f"Snapshot reload failed, keeping previous data: {str(e)}")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("⚡ High-Performance Bilingual Mode Starting...")
-    if not os.path.exists(DB_PATH):
-        logger.error(f"FATAL: {DB_PATH} missing.")
+    started = time.perf_counter()
+    if not os.path.exists(ARTIFACT_PATH) and not os.path.exists(DB_PATH):
+        logger.error(f"FATAL: neither {ARTIFACT_PATH} nor {DB_PATH} found.")
+    else:
+        await reload_snapshot(force=True)
+    ready = time.perf_counter()
+    STARTUP.set(started - BOOT_STARTED, phase="import")
+    STARTUP.set(ready - started, phase="snapshot")
+    logger.info(f"⚡ Ready in {(ready - BOOT_STARTED) * 1000:.0f} ms "
+                f"(import {(started - BOOT_STARTED) * 1000:.0f} ms, snapshot {(ready - started) * 1000:.0f} ms)")
+    watcher = asyncio.create_task(watch_snapshot()) if RELOAD_INTERVAL > 0 else None
     yield
+    if watcher:
+        watcher.cancel()
+    for task in list(_background):
+        task.cancel()
+    await db.close()
 
 app = FastAPI(
     title="Udupi Crop Calendar BILINGUAL API",
     default_response_class=ORJSONResponse,
-    lifespan=lifespan
+    lifespan=lifespan,
+    docs_url="/docs" if DOCS else None,
+    redoc_url="/redoc" if DOCS else None,
+    openapi_url="/openapi.json" if DOCS else None
 )
 
 # Middleware Stack
 app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Inside CORS so browsers can read 429s, inside metrics so they are counted
+app.add_middleware(RateLimitMiddleware, limiter=limiter, exempt=("/metrics",))
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+app.add_middleware(MetricsMiddleware)
 
 @app.get("/", tags=["Status"])
 async def root():
-    return {"status": "optimised", "engine": "FastAPI + aiosqlite (Bilingual)"}
+    return {
+        "status": "optimised",
+        "engine": "FastAPI + in-memory snapshot (Bilingual)",
+        "cache": _cache.stats(),
+        "rendered_cache": _rendered.stats(),
+        "projected_cache": _projected.stats(),
+        "db_pool": db.stats(),
+        "rate_limit": limiter.stats(),
+        "miss_gate": _miss_gate.stats()
+    }
 
 @app.get("/calendar", response_model=OperationalPlanResponse, tags=["Calendar"])
 async def get_calendar(
+    request: Request,
     season: str = Query(..., description="E.g., Kharif, Rabi"),
     crop: str = Query(..., description="E.g., Paddy"),
     variety: str = Query(..., description="E.g., MO-4"),
-    language: str = Query("en", description="en or kn")
+    language: str = Query("en", description="en, kn or any other loaded language; unknown codes get English"),
+    fields: Optional[str] = Query(None, description="Comma-separated dotted paths, e.g. progress,timeline.weeks.stage"),
+    months: Optional[str] = Query(None, description="E.g., June,August or Nov-Feb"),
+    weeks: Optional[str] = Query(None, description="week_number or range, e.g. 3-8")
 ):
-    return await fetch_calendar_data(season, crop, variety, language)
+    request.state.language = store.current.resolve_language(language)
+    projection = parse_request_projection(fields, months, weeks)
+    rendered = await fetch_calendar_data(season, crop, variety, language)
+    return encoded_response(request, await shape_response(request, rendered, projection))
 
 @app.post("/calendar", response_model=OperationalPlanResponse, tags=["Calendar"])
-async def post_calendar(request: CalendarRequest):
-    return await fetch_calendar_data(request.season, request.crop, request.variety, request.language)
-
-async def fetch_calendar_data(season: str, crop: str, variety: str, language: str = "en"):
-    cache_key = f"op:{language}:{season.lower()}:{crop.lower()}:{variety.lower()}"
-    if cache_key in _cache:
-        logger.info(f"🚀 Cache Hit: {cache_key}")
-        return _cache[cache_key]
-
+async def post_calendar(request: Request, body: CalendarQuery):
+    request.state.language = store.current.resolve_language(body.language)
+    projection = parse_request_projection(body.fields, body.months, body.weeks)
+    rendered = await fetch_calendar_data(body.season, body.crop, body.variety, body.language)
+    return encoded_response(request, await shape_response(request, rendered, projection))
+
+@app.post("/calendar/batch", response_model=BatchCalendarResponse, tags=["Calendar"])
+async def post_calendar_batch(request: Request, batch: BatchCalendarRequest):
+    expanded = expand_batch(batch.items)
+    # Charged per resolved item: one wildcard item can stand for every variety of a crop
+    limiter.charge(client_address(request.scope), len(expanded) - 1)
     try:
-        conn = await db.get_conn()
-        variety_query = f"%{variety}%"
-        
-        # We always need the English version for logic, and the localized version for display
-        suffix = "_kn" if language.lower() == "kn" else ""
-        query = f"""
-            SELECT month, 
-                   week_1, week_2, week_3, week_4,
-                   week_1{suffix} as l_week_1, 
-                   week_2{suffix} as l_week_2, 
-                   week_3{suffix} as l_week_3, 
-                   week_4{suffix} as l_week_4 
-            FROM crop_calendar 
-            WHERE LOWER(season) = LOWER(?) 
-              AND LOWER(crop) = LOWER(?) 
-              AND LOWER(variety) LIKE LOWER(?)
-            ORDER BY id ASC
-        """
-        
-        async with conn.execute(query, (season, crop, variety_query)) as cursor:
-            rows = await cursor.fetchall()
-        await conn.close()
-
-        if not rows:
-            raise HTTPException(status_code=404, detail="No matching calendar found.")
-
-        # Logic for parsing and categorizing
-        timeline = []
-        all_activities = []
-        
-        # Keywords for categorization
-        cat_map = {
-            "irrigation": ["💧", "water", "irrigate", "moist", "drain", "flooded", "remove water", "stop watering", "ನೀರು", "ನೀರಾವರಿ"],
-            "fertilizer": ["🧪", "Urea", "DAP", "Potash", "NPK", "Zinc", "MgSO4", "Borax", "Gypsum", "Basal", "compost", "manure", "Nitrogen", "Growth Dose", "ಗೊಬ್ಬರ", "ಯೂರಿಯಾ"],
-            "weed": ["Weed", "weeder", "pendimethalin", "ಕಳೆ"],
-            "protection": ["🔎", "⚠️", "Scout", "Spray", "BSFB", "Blast", "Stem Borer", "Aphids", "Whitefly", "Gall Midge", "BPH", "Tikka", "Rust", "Mosaic", "fungicide", "insecticide", "ಪರಿಶೀಲಿಸಿ", "ಸಿಂಪಡಿಸಿ"],
-            "field": ["🚜", "📅", "✂️", "Tractor", "Labor", "Thresher", "Land prep", "puddling", "Transplant", "Sow", "Harvest", "Cut", "Collect", "Dry", "Store", "ಟ್ರಾಕ್ಟರ್", "ಕಾರ್ಮಿಕ", "ಬಿತ್ತನೆ", "ನಾಟಿ", "ಕೊಯ್ಲು"]
-        }
-
-        def categorize(text, category):
-            if not text or "resting" in text.lower() or "ವಿಶ್ರಾಂತಿ" in text:
-                return "No specific activity"
-            fragments = text.split("|")
-            relevant = [f.strip() for f in fragments if any(k.lower() in f.lower() for k in cat_map[category])]
-            return " | ".join(relevant) if relevant else "Standard care"
-
-        def infer_stage(week_idx, text):
-            text_l = text.lower()
-            if "harvest" in text_l or "cut" in text_l or "store" in text_l: return "Harvest"
-            if "mature" in text_l or "yellow" in text_l or "stop watering" in text_l: return "Maturity"
-            if "flower" in text_l or "panicle" in text_l or "grain forming" in text_l or "pod" in text_l: return "Reproductive"
-            if "transplant" in text_l or "sow" in text_l or "nursery" in text_l or "land prep" in text_l: return "Vegetative"
-            return "Vegetative" # Default
-
-        global_week_count = 1
-        current_month_name = ""
-        from datetime import datetime
-        now = datetime.now()
-        current_month_idx = now.month # 1-12
-        
-        # Find if we are in the active season
-        # Simple heuristic: if the current month name matches a row in the fetched data
-        # This is a bit complex since many crops are multi-month.
-        
-        processed_timeline = []
-        summary_by_month = {}
-        
-        for row in rows:
-            month_name = row['month']
-            weeks = []
-            major_ops = []
-            critical_actions = []
-            
-            for i in range(1, 5):
-                raw_en = row[f'week_{i}']
-                raw_loc = row[f'l_week_{i}']
-                
-                if "resting" in raw_en.lower():
-                    continue
-                
-                # Check for critical icons
-                if "⚠️" in raw_en or "critical" in raw_en.lower():
-                    critical_actions.append(raw_loc)
-                if "📅" in raw_en or "🚜" in raw_en:
-                    # Filter major ops to be unique and concise
-                    major_ops.append(raw_loc.split("|")[0].strip())
-
-                weeks.append(WeeklyActivity(
-                    week_number=global_week_count,
-                    field_operation=categorize(raw_loc, "field"),
-                    irrigation=categorize(raw_loc, "irrigation"),
-                    fertilizer=categorize(raw_loc, "fertilizer"),
-                    weed_management=categorize(raw_loc, "weed"),
-                    protection=categorize(raw_loc, "protection"),
-                    stage=infer_stage(global_week_count, raw_en)
-                ))
-                global_week_count += 1
-            
-            if weeks:
-                processed_timeline.append(MonthlyActivity(
-                    month=month_name,
-                    major_operations=list(set(major_ops))[:3], # Top 3
-                    critical_actions=list(set(critical_actions))[:2], # Top 2
-                    weeks=weeks
-                ))
-                summary_by_month[month_name] = f"{len([w for w in weeks if w.stage != 'No activity'])} active weeks"
-
-        # Progress Tracker Logic
-        # For simplicity, we assume the first month of the list is the start of the crop
-        # And we compare with current real-world month.
-        import calendar
-        month_map = {name: i for i, name in enumerate(calendar.month_name) if name}
-        
-        start_month_name = processed_timeline[0].month if processed_timeline else "June"
-        start_month_idx = month_map.get(start_month_name, 6)
-        
-        # Calculate current week relative to start month
-        months_since_start = (current_month_idx - start_month_idx) % 12
-        current_week_num = (months_since_start * 4) + ((now.day - 1) // 7) + 1
-        
-        # Clamp or find the closest activity
-        active_week = None
-        for m in processed_timeline:
-            for w in m.weeks:
-                if w.week_number == current_week_num:
-                    active_week = w
-                    break
-        
-        # Fallback to last known if current date is past harvest, or "Upcoming" if before
-        if not active_week:
-            if current_week_num > global_week_count:
-                active_week = processed_timeline[-1].weeks[-1] if processed_timeline else None
-            else:
-                active_week = processed_timeline[0].weeks[0] if processed_timeline else None
-
-        progress = ProgressTracker(
-            current_week=current_week_num if current_week_num < 24 else 0, # Sanity check for crop duration
-            current_phase=active_week.stage if active_week else "Planning",
-            upcoming_operation=active_week.field_operation if active_week else "Soil preparation"
-        )
-
-        response = OperationalPlanResponse(
-            context={
-                "selected_season": season,
-                "selected_crop": crop,
-                "selected_variety": variety,
-                "total_duration_weeks": global_week_count - 1,
-                "language": language
-            },
-            timeline=processed_timeline,
-            summary_by_month=summary_by_month,
-            progress=progress
+        async with _miss_gate.slot():
+            return fetch_calendar_batch(expanded)
+    except Overloaded as e:
+        raise overloaded(e)
+
+@app.get("/calendar/progress", response_model=ProgressResponse, tags=["Calendar"])
+async def get_progress(
+    request: Request,
+    season: str = Query(..., description="E.g., Kharif, Rabi"),
+    crop: str = Query(..., description="E.g., Paddy"),
+    variety: str = Query(..., description="E.g., MO-4"),
+    language: str = Query("en", description="en, kn or any other loaded language; unknown codes get English"),
+    sowing_date: Optional[date] = Query(None, description="YYYY-MM-DD; without it progress is estimated from the calendar month"),
+    as_of: Optional[date] = Query(None, description="YYYY-MM-DD; defaults to today")
+):
+    request.state.language = store.current.resolve_language(language)
+    key = resolve_key(season, crop, variety)
+    plan = resolve_plan(key, language)
+    return ORJSONResponse(progress_payload(plan, sowing_date, as_of or date.today()))
+
+@app.post("/calendar/progress/batch", response_model=BatchProgressResponse, tags=["Calendar"])
+async def post_progress_batch(request: Request, batch: BatchProgressRequest):
+    if len(batch.items) > PROGRESS_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch has {len(batch.items)} items; limit is {PROGRESS_BATCH_MAX_ITEMS}.")
+    limiter.charge(client_address(request.scope), len(batch.items) - 1)
+    try:
+        async with _miss_gate.slot():
+            return ORJSONResponse(await fetch_progress_batch(batch.items, batch.as_of or date.today()))
+    except Overloaded as e:
+        raise overloaded(e)
+
+@app.get("/calendar/export", tags=["Calendar"])
+async def export_calendar(
+    request: Request,
+    language: Optional[str] = Query(None, description="One language; every loaded language when omitted"),
+    since: Optional[str] = Query(None, description="data_version from a previous export; unchanged data streams only the meta line")
+):
+    snapshot = store.current
+    version = snapshot_data_version(snapshot)
+    languages = (snapshot.resolve_language(language),) if language else snapshot.languages
+    request.state.language = languages[0] if language else "all"
+    headers = {"ETag": f'"{version}"', "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match", ""), version):
+        return Response(status_code=304, headers=headers)
+    return StreamingResponse(
+        export_lines(snapshot, languages, unchanged=since == version),
+        media_type="application/x-ndjson",
+        headers=headers
+    )
+
+@app.get("/metrics", response_class=PlainTextResponse, tags=["Status"])
+async def metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+def compute_progress(plan: StaticPlan, now: datetime) -> ProgressTracker:
+    # Calculate current week relative to start month, compared with the current real-world month
+    months_since_start = (now.month - plan.start_month_idx) % 12
+    current_week_num = (months_since_start * 4) + ((now.day - 1) // 7) + 1
+
+    active_week = plan.week_index.get(current_week_num)
+
+    # Fallback to last known if current date is past harvest, or "Upcoming" if before
+    if not active_week and plan.timeline:
+        if current_week_num > plan.total_weeks + 1:
+            active_week = plan.timeline[-1].weeks[-1]
+        else:
+            active_week = plan.timeline[0].weeks[0]
+
+    return ProgressTracker(
+        current_week=current_week_num if current_week_num < 24 else 0, # Sanity check for crop duration
+        current_phase=active_week.stage if active_week else "Planning",
+        upcoming_operation=active_week.field_operation if active_week else "Soil preparation"
+    )
+
+def sowing_progress(plan: StaticPlan, sowing_date: date, as_of: date):
+    # (day offset, status, tracker dict); no scanning, no month arithmetic
+    day_offset, status, week = sowing_status(plan, sowing_date, as_of)
+    if week is None:
+        return day_offset, status, {"current_week": 0, "current_phase": "Planning", "upcoming_operation": "Soil preparation"}
+    return day_offset, status, {
+        "current_week": week.week_number if status == "in_progress" else 0,
+        "current_phase": week.stage,
+        "upcoming_operation": week.field_operation
+    }
+
+def progress_payload(plan: StaticPlan, sowing_date: Optional[date], as_of: date) -> dict:
+    if sowing_date is None:
+        day_offset, status = None, "estimated"
+        tracker = jsonable_encoder(compute_progress(plan, datetime.combine(as_of, datetime.min.time())))
+    else:
+        day_offset, status, tracker = sowing_progress(plan, sowing_date, as_of)
+    return {
+        "context": {
+            "selected_season": plan.context["selected_season"],
+            "selected_crop": plan.context["selected_crop"],
+            "selected_variety": plan.context["selected_variety"],
+            "language": plan.context["language"]
+        },
+        "as_of": as_of,
+        "sowing_date": sowing_date,
+        "day_offset": day_offset,
+        "status": status,
+        "progress": tracker
+    }
+
+def resolve_key(season: str, crop: str, variety: str) -> CalendarKey:
+    with STAGE_LATENCY.time(stage="lookup"):
+        resolution = store.current.catalog.resolve(season, crop, variety)
+    if resolution.key is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"message": resolution.message, "candidates": list(resolution.candidates)}
         )
-
-        _cache[cache_key] = response
-        logger.info(f"💾 Cache Seeded: {cache_key}")
-        return response
-
+    return resolution.key
+
+def build_timed_plan(rows, season: str, crop: str, variety: str, language: str) -> StaticPlan:
+    with STAGE_LATENCY.time(stage="model_build"):
+        plan = build_static_plan(rows, season, crop, variety, language)
+    logger.debug(f"💾 Cache Seeded: {cache_key_for((season, crop, variety), language)}")
+    return plan
+
+def resolve_plan(key: CalendarKey, language: str) -> StaticPlan:
+    return resolve_snapshot_plan(store.current, key, language, _cache, build=build_timed_plan)
+
+def assemble_response(plan: StaticPlan, now: datetime) -> OperationalPlanResponse:
+    # Progress depends on today's date, so it is recomputed on every hit
+    return OperationalPlanResponse(
+        context=plan.context,
+        timeline=plan.timeline,
+        summary_by_month=plan.summary_by_month,
+        progress=compute_progress(plan, now)
+    )
+
+JSON_TYPE = "application/json"
+COLUMNAR_TYPE = "application/vnd.cropcalendar.columnar+json"
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack")
+
+class RenderedPlan(NamedTuple):
+    # One calendar variant for one day, serialized and compressed once
+    payload: dict
+    etag: str  # digest of the identity body; quoted and suffixed per encoding on the wire
+    identity: bytes
+    gzip: Optional[bytes]
+    br: Optional[bytes]
+    media_type: str = JSON_TYPE
+
+def encode_body(payload: dict, body: bytes, media_type: str = JSON_TYPE) -> RenderedPlan:
+    with STAGE_LATENCY.time(stage="compress"):
+        # Below the GZipMiddleware threshold compression costs more than it saves
+        compressed_gzip = gzip.compress(body, compresslevel=9) if len(body) >= 1000 else None
+        compressed_br = brotli.compress(body) if brotli and compressed_gzip else None
+    return RenderedPlan(
+        payload=payload,
+        etag=hashlib.blake2b(body, digest_size=16).hexdigest(),
+        identity=body,
+        gzip=compressed_gzip,
+        br=compressed_br,
+        media_type=media_type
+    )
+
+def render_plan(plan: StaticPlan, now: datetime) -> RenderedPlan:
+    with STAGE_LATENCY.time(stage="serialize"):
+        payload = jsonable_encoder(assemble_response(plan, now))
+        body = orjson.dumps(payload)
+    return encode_body(payload, body)
+
+def parse_qvalues(header: str) -> Dict[str, float]:
+    # Accept / Accept-Encoding -> {token: q}, in header order. q is found by name among all the
+    # parameters ("application/json;charset=utf-8;q=0" is q=0); a malformed q counts as 0
+    accepted = {}
+    for part in header.split(","):
+        name, *params = part.split(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value.strip())
+                except ValueError:
+                    q = 0.0
+        accepted[name] = q
+    return accepted
+
+def negotiate_format(accept: str) -> str:
+    # Highest-q supported media type; JSON when nothing better is acceptable
+    supported = [JSON_TYPE, COLUMNAR_TYPE, *(MSGPACK_TYPES if msgpack else ())]
+    best, best_q = JSON_TYPE, 0.0
+    for name, q in parse_qvalues(accept).items():
+        if name in supported and q > best_q:
+            best, best_q = name, q
+    return best
+
+def parse_request_projection(fields: Optional[str], months: Optional[str], weeks: Optional[str]) -> Projection:
+    try:
+        return parse_projection(fields, months, weeks)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def shape_body(payload: dict, projection: Projection, media_type: str) -> RenderedPlan:
+    with STAGE_LATENCY.time(stage="project"):
+        payload = project(payload, projection)
+    with STAGE_LATENCY.time(stage="serialize"):
+        if media_type == COLUMNAR_TYPE:
+            body = orjson.dumps(columnar(payload))
+        elif media_type in MSGPACK_TYPES:
+            body = msgpack.packb(payload, use_bin_type=True)
+        else:
+            body = orjson.dumps(payload)
+    return encode_body(payload, body, media_type)
+
+async def shape_response(request: Request, rendered: RenderedPlan, projection: Projection) -> RenderedPlan:
+    # Projection and compact formats work on the rendered payload dict; models are never rebuilt
+    media_type = negotiate_format(request.headers.get("accept", ""))
+    if projection.identity and media_type == JSON_TYPE:
+        return rendered
+    key = (rendered.etag, projection.key, media_type)
+    shaped = _projected.get(key)
+    if shaped is None:
+        # A new projection is cache-miss work like a render: admitted through the gate, off the loop
+        try:
+            async with _miss_gate.slot():
+                shaped = await asyncio.to_thread(shape_body, rendered.payload, projection, media_type)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Overloaded as e:
+            raise overloaded(e)
+        _projected.set(key, shaped)
+    return shaped
+
+def negotiate_encoding(accept_encoding: str, rendered: RenderedPlan) -> Optional[str]:
+    accepted = parse_qvalues(accept_encoding)
+    for encoding in ("br", "gzip"):
+        if getattr(rendered, encoding) is not None and accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+def etag_matches(if_none_match: str, digest: str) -> bool:
+    # Weak comparison (RFC 9110): ignore W/ and the per-encoding suffix, compare the body digest
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag.strip('"').split("-")[0] == digest:
+            return True
+    return False
+
+def encoded_response(request: Request, rendered: RenderedPlan) -> Response:
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""), rendered)
+    # Strong ETags must differ per content-coding
+    etag = f'"{rendered.etag}-{encoding}"' if encoding else f'"{rendered.etag}"'
+    headers = {"ETag": etag, "Vary": "Accept, Accept-Encoding", "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match", ""), rendered.etag):
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        return Response(content=getattr(rendered, encoding), media_type=rendered.media_type, headers=headers)
+    return Response(content=rendered.identity, media_type=rendered.media_type, headers=headers)
+
+def render_variants(snapshot: CalendarSnapshot, variants: list, now: datetime) -> list:
+    # Runs in a worker thread, so it only builds; the caches are filled back on the event loop
+    return [
+        (key, language, plan, render_plan(plan, now))
+        for key, language in variants
+        for plan in (build_timed_plan(snapshot.rows[key], *snapshot.names[key], language),)
+    ]
+
+async def prewarm() -> int:
+    # Awaited before the first request is served; on a hot reload, requests keep being served meanwhile
+    now = datetime.now()
+    snapshot = store.current
+    variants = [(key, language) for key in snapshot.names for language in snapshot.languages]
+    if len(variants) > _rendered.maxsize:
+        logger.warning(f"CALENDAR_CACHE_SIZE={_rendered.maxsize} is below the {len(variants)} calendar variants")
+    warmed = await asyncio.to_thread(render_variants, snapshot, variants, now)
+    if store.current is not snapshot:
+        return 0  # A reload started its own pass
+    for key, language, plan, rendered in warmed:
+        cache_key = cache_key_for(key, language)
+        _cache.set(cache_key, plan)
+        _rendered.set((cache_key, now.date()), rendered)
+    return len(warmed)
+
+async def prewarm_in_background(snapshot: CalendarSnapshot) -> None:
+    # One variant at a time through the single-flight map, so a request for a variant that is
+    # being warmed joins that render instead of starting its own
+    now = datetime.now()
+    for key in snapshot.names:
+        for language in snapshot.languages:
+            if store.current is not snapshot:
+                return  # A reload started its own pass
+            render_key = (cache_key_for(key, language), now.date())
+            if render_key not in _rendered:
+                await _inflight.do(render_key, lambda: render_variant(key, language, now, render_key))
+    logger.info(f"🔥 Pre-warmed {len(snapshot.names) * len(snapshot.languages)} calendar variants in the background")
+
+def schedule_prewarm() -> None:
+    task = asyncio.create_task(prewarm_in_background(store.current))
+    _background.add(task)  # The loop only keeps weak references to tasks
+    task.add_done_callback(_background.discard)
+
+async def render_variant(key: CalendarKey, language: str, now: datetime, render_key) -> RenderedPlan:
+    snapshot = store.current
+    if key not in snapshot.rows:
+        # Resolved against a snapshot that a reload has since replaced
+        raise HTTPException(status_code=404, detail={"message": "Calendar entry no longer available.", "candidates": []})
+    plan = resolve_plan(key, language)
+    # Serialization and gzip/brotli run off the event loop; zlib and brotli release the GIL
+    rendered = await asyncio.to_thread(render_plan, plan, now)
+    # A reload during the render cleared the caches; a stale body must not land in the fresh ones
+    if store.current.rows is snapshot.rows:
+        _rendered.set(render_key, rendered)
+    return rendered
+
+def overloaded(e: Overloaded) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+async def admitted_render(key: CalendarKey, language: str, now: datetime, render_key) -> RenderedPlan:
+    async with _miss_gate.slot():
+        return await render_variant(key, language, now, render_key)
+
+async def fetch_calendar_data(season: str, crop: str, variety: str, language: str = "en") -> RenderedPlan:
+    try:
+        now = datetime.now()
+        key = resolve_key(season, crop, variety)
+        render_key = (cache_key_for(key, store.current.resolve_language(language)), now.date())
+        rendered = _rendered.get(render_key)
+        if rendered is None:
+            rendered = await _inflight.do(render_key, lambda: admitted_render(key, language, now, render_key))
+        return rendered
+
+    except Overloaded as e:
+        raise overloaded(e)
     except Exception as e:
         if isinstance(e, HTTPException): raise e
         logger.error(f"Server Error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal performance failure: {str(e)}")
 
+def expand_batch(items: List[CalendarRequest]) -> List[tuple]:
+    # Wildcard items become one (request, error) per concrete variety before anything is resolved
+    snapshot = store.current
+    expanded = []
+    for item in items:
+        if WILDCARD not in (item.crop, item.variety):
+            expanded.append((item, None))
+            continue
+        matches = snapshot.expand(item.season, item.crop, item.variety)
+        if not matches:
+            expanded.append((item, "No matching calendar found."))
+        for season, crop, variety in matches:
+            expanded.append((CalendarRequest(season=season, crop=crop, variety=variety, language=item.language), None))
+
+    if len(expanded) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch expands to {len(expanded)} items; limit is {BATCH_MAX_ITEMS}.")
+    return expanded
+
+def fetch_calendar_batch(expanded: List[tuple]) -> BatchCalendarResponse:
+    snapshot = store.current
+    now = datetime.now()
+    resolved = {}
+    results = []
+    for request, error in expanded:
+        if error:
+            results.append(BatchItemResult(request=request, status=404, error=error))
+            continue
+        try:
+            key = resolve_key(request.season, request.crop, request.variety)
+        except HTTPException as e:
+            results.append(BatchItemResult(request=request, status=e.status_code, error=e.detail))
+            continue
+        # Requests resolving to the same variety share one plan and one progress computation
+        cache_key = cache_key_for(key, snapshot.resolve_language(request.language))
+        if cache_key not in resolved:
+            try:
+                resolved[cache_key] = {"status": 200, "data": assemble_response(resolve_plan(key, request.language), now)}
+            except Exception as e:
+                logger.error(f"Server Error: {str(e)}")
+                resolved[cache_key] = {"status": 500, "error": f"Internal performance failure: {str(e)}"}
+        results.append(BatchItemResult(request=request, **resolved[cache_key]))
+
+    return BatchCalendarResponse(results=results)
+
+def snapshot_data_version(snapshot: CalendarSnapshot) -> str:
+    # Content digest when loaded from the artifact; the DB source only has its mtime
+    return snapshot.data_version or str(snapshot.version)
+
+def export_entry(plan: StaticPlan, names: CalendarKey, language: str) -> bytes:
+    # Progress is left out: it depends on the day, and the device computes it locally
+    body = orjson.dumps(jsonable_encoder({
+        "context": plan.context,
+        "timeline": plan.timeline,
+        "summary_by_month": plan.summary_by_month
+    }))
+    season, crop, variety = names
+    header = orjson.dumps({
+        "type": "entry",
+        "season": season,
+        "crop": crop,
+        "variety": variety,
+        "language": language,
+        "hash": hashlib.blake2b(body, digest_size=16).hexdigest()
+    })
+    # Splice the serialized plan in rather than encoding it twice
+    return header[:-1] + b',"plan":' + body + b"}\n"
+
+async def export_lines(snapshot: CalendarSnapshot, languages: tuple, unchanged: bool = False) -> AsyncIterator[bytes]:
+    # One line per (variety, language); the snapshot is pinned so a reload mid-stream can't mix versions
+    keys = sorted(snapshot.names)
+    yield orjson.dumps({
+        "type": "meta",
+        "data_version": snapshot_data_version(snapshot),
+        "languages": list(languages),
+        "entries": 0 if unchanged else len(keys) * len(languages),
+        "unchanged": unchanged
+    }) + b"\n"
+    if unchanged:
+        return
+    count = 0
+    for key in keys:
+        for language in languages:
+            plan = None
+            if snapshot is store.current:
+                plan = _cache.get(cache_key_for(key, language))
+            if plan is None:
+                # Built and dropped per entry; exporting must not flush the serving cache
+                plan = build_static_plan(snapshot.rows[key], *snapshot.names[key], language)
+            yield export_entry(plan, snapshot.names[key], language)
+            count += 1
+        await asyncio.sleep(0)
+    # Lets clients tell a complete download from a dropped connection
+    yield orjson.dumps({"type": "end", "entries": count}) + b"\n"
+
+async def fetch_progress_batch(items: List[ProgressItem], as_of: date) -> dict:
+    # Plain dicts end to end: at thousands of items, per-item models dominate the cost
+    snapshot = store.current
+    keys = {}
+    results = []
+    for i, item in enumerate(items):
+        if i and i % PROGRESS_BATCH_SLICE == 0:
+            await asyncio.sleep(0)
+            if store.current is not snapshot:
+                # Reloaded in between: earlier resolutions may point at keys the new snapshot lacks
+                snapshot = store.current
+                keys = {}
+        lookup = (item.season, item.crop, item.variety)
+        if lookup not in keys:
+            try:
+                keys[lookup] = (resolve_key(*lookup), None)
+            except HTTPException as e:
+                keys[lookup] = (None, e)
+        key, error = keys[lookup]
+        if error is not None:
+            results.append({"id": item.id, "status": error.status_code, "data": None, "error": error.detail})
+            continue
+        # Plans come from the shared cache, so each (variety, language) is built at most once
+        plan = resolve_plan(key, snapshot.resolve_language(item.language))
+        data = progress_payload(plan, item.sowing_date, item.as_of or as_of)
+        results.append({"id": item.id, "status": 200, "data": data, "error": None})
+    return {"results": results}
+
+
+def ensure_artifact():
+    # Compile once in the parent so every worker mmaps the same file and shares its pages
+    # Compared by content digest, so translations.csv edits and format bumps recompile too
+    from artifact import artifact_data_version
+    from compile_calendar import compile_calendar
+    from migrate import CSV_PATH, TRANSLATIONS_PATH, source_digest
+    if os.path.exists(CSV_PATH) and artifact_data_version(ARTIFACT_PATH) != source_digest(CSV_PATH, TRANSLATIONS_PATH):
+        compile_calendar(CSV_PATH, ARTIFACT_PATH, TRANSLATIONS_PATH)
+
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8000))
+    workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+    ensure_artifact()
     # use_colors=True and other standard options via uvicorn[standard]
-    uvicorn.run("main:app", host="0.0.0.0", port=port, log_level="info")
+    # A single worker serves this module's app; an import string would load (and build) main a second time
+    uvicorn.run(app if workers == 1 else "main:app", host="0.0.0.0", port=port, workers=workers, log_level="info")
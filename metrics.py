@@ -0,0 +1,238 @@
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Minimal Prometheus text-format (0.0.4) metrics; no client library needed
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+STAGE_BUCKETS = (0.00001, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.25)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in (*zip(names, values), *extra)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in sorted(self._values.items()):
+            lines.extend(self._render_child(key, value))
+        return lines
+
+    def _render_child(self, key, value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {value}"]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def set_total(self, value: float, **labels) -> None:
+        # Mirror a total that is maintained elsewhere (e.g. TTLCache counters)
+        self._values[self._key(labels)] = value
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        child = self._values.get(key)
+        if child is None:
+            # [per-bucket counts..., +Inf count], sum
+            child = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        child[0][bisect.bisect_left(self.buckets, value)] += 1
+        child[1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _render_child(self, key, value) -> List[str]:
+        counts, total = value
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, (('le', le),))} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {total}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: List[Metric] = []
+        # Called right before rendering, to copy point-in-time values (cache stats, pool sizes) into gauges
+        self.collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        for collect in self.collectors:
+            collect()
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+REQUESTS = REGISTRY.register(Counter(
+    "calendar_requests_total", "HTTP requests handled.", ("route", "method", "status", "language")))
+REQUEST_LATENCY = REGISTRY.register(Histogram(
+    "calendar_request_duration_seconds", "End-to-end request latency.", ("route", "language")))
+IN_FLIGHT = REGISTRY.register(Gauge(
+    "calendar_requests_in_flight", "Requests currently being handled."))
+STAGE_LATENCY = REGISTRY.register(Histogram(
+    "calendar_stage_duration_seconds", "Time spent per pipeline stage.", ("stage",), buckets=STAGE_BUCKETS))
+CACHE_EVENTS = REGISTRY.register(Counter(
+    "calendar_cache_events_total", "Cache hits, misses, evictions and expirations.", ("cache", "event")))
+CACHE_SIZE = REGISTRY.register(Gauge(
+    "calendar_cache_entries", "Entries currently cached.", ("cache",)))
+CACHE_HIT_RATIO = REGISTRY.register(Gauge(
+    "calendar_cache_hit_ratio", "Lifetime hit ratio per cache.", ("cache",)))
+SINGLE_FLIGHT = REGISTRY.register(Counter(
+    "calendar_singleflight_total", "Cache misses that computed (leader) or joined an in-flight computation (coalesced).", ("event",)))
+SINGLE_FLIGHT_IN_FLIGHT = REGISTRY.register(Gauge(
+    "calendar_singleflight_in_flight", "Distinct cache keys currently being computed."))
+DB_POOL = REGISTRY.register(Gauge(
+    "calendar_db_pool_connections", "Read-only SQLite pool connections by state.", ("state",)))
+DB_POOL_EVENTS = REGISTRY.register(Counter(
+    "calendar_db_pool_events_total", "Pool connections created/discarded, checkouts and checkouts that had to wait.", ("event",)))
+SNAPSHOT_VARIETIES = REGISTRY.register(Gauge(
+    "calendar_snapshot_varieties", "Varieties in the live calendar snapshot."))
+SNAPSHOT_RELOADS = REGISTRY.register(Counter(
+    "calendar_snapshot_reloads_total", "Snapshot loads, by source.", ("source",)))
+RATE_LIMIT = REGISTRY.register(Counter(
+    "calendar_rate_limit_total", "Requests checked against per-client token buckets, by decision.", ("decision",)))
+RATE_LIMIT_CLIENTS = REGISTRY.register(Gauge(
+    "calendar_rate_limit_clients", "Clients with a tracked token bucket."))
+MISS_GATE = REGISTRY.register(Gauge(
+    "calendar_miss_gate_slots", "Cache-miss render slots: limit, active and waiting.", ("state",)))
+MISS_GATE_EVENTS = REGISTRY.register(Counter(
+    "calendar_miss_gate_events_total", "Cache-miss renders admitted, queued, shed (queue full) or timed out waiting.", ("event",)))
+STARTUP = REGISTRY.register(Gauge(
+    "calendar_startup_seconds", "Worker cold start: module import and first snapshot load (including a blocking prewarm).", ("phase",)))
+
+
+def watch_cache(name: str, cache) -> None:
+    def collect():
+        stats = cache.stats()
+        for event in ("hits", "misses", "evictions", "expirations"):
+            CACHE_EVENTS.set_total(stats[event], cache=name, event=event)
+        CACHE_SIZE.set(stats["size"], cache=name)
+        CACHE_HIT_RATIO.set(stats["hit_ratio"], cache=name)
+    REGISTRY.collectors.append(collect)
+
+
+def watch_single_flight(flight) -> None:
+    def collect():
+        stats = flight.stats()
+        SINGLE_FLIGHT.set_total(stats["leaders"], event="leader")
+        SINGLE_FLIGHT.set_total(stats["coalesced"], event="coalesced")
+        SINGLE_FLIGHT_IN_FLIGHT.set(stats["in_flight"])
+    REGISTRY.collectors.append(collect)
+
+
+def watch_pool(pool) -> None:
+    def collect():
+        stats = pool.stats()
+        for state in ("size", "idle", "in_use"):
+            DB_POOL.set(stats[state], state=state)
+        for event in ("created", "discarded", "acquisitions", "waits"):
+            DB_POOL_EVENTS.set_total(stats[event], event=event)
+    REGISTRY.collectors.append(collect)
+
+
+def watch_admission(limiter, gate) -> None:
+    def collect():
+        stats = limiter.stats()
+        RATE_LIMIT.set_total(stats["allowed"], decision="allowed")
+        RATE_LIMIT.set_total(stats["limited"], decision="limited")
+        RATE_LIMIT_CLIENTS.set(stats["clients"])
+        stats = gate.stats()
+        for state in ("limit", "active", "waiting"):
+            MISS_GATE.set(stats[state], state=state)
+        for event in ("admitted", "queued", "shed", "timed_out"):
+            MISS_GATE_EVENTS.set_total(stats[event], event=event)
+    REGISTRY.collectors.append(collect)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware: in-flight gauge plus per-route/language counters and latency histograms."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        # Handlers record the resolved language in request.state, which lives in scope["state"]
+        state = scope.setdefault("state", {})
+        IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            IN_FLIGHT.dec()
+            route = getattr(scope.get("route"), "path", "unmatched")
+            language = state.get("language", "none")
+            REQUESTS.inc(route=route, method=scope["method"], status=status[0], language=language)
+            REQUEST_LATENCY.observe(elapsed, route=route, language=language)
@@ -1,56 +1,32 @@
 import csv
+import hashlib
 import sqlite3
 import os
+import time
+
+from artifact import artifact_data_version
+from database import readonly_uri
+from engine import DEFAULT_LANGUAGE, intern_fragments
 
 CSV_PATH = 'calendar_bilingual.csv'
 DB_PATH = 'calendar.db'
+# Optional: language,source,text rows adding languages beyond the CSV's English and Kannada.
+# `source` is an English week cell or one of its `|` fragments
+TRANSLATIONS_PATH = 'translations.csv'
 
-def migrate():
-    if not os.path.exists(CSV_PATH):
-        print(f"Error: {CSV_PATH} not found. Run generate_bilingual.py first.")
-        return
-
-    # Connect to SQLite
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+# Week columns hold fragment ids; the text of every language lives in fragment/fragment_translation
+COLUMNS = ("season", "crop", "variety", "month", "week_1", "week_2", "week_3", "week_4")
+# Identifies a row across runs; everything else is content
+NATURAL_KEY = ("season", "crop", "variety", "month")
+# Bumped when the table layout changes; a database stamped with another version is rebuilt from scratch
+SCHEMA_VERSION = "2"
 
-    # Drop existing table if exists
-    cursor.execute("DROP TABLE IF EXISTS crop_calendar")
-
-    # Create table with bilingual columns
-    cursor.execute("""
-        CREATE TABLE crop_calendar (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            season TEXT,
-            crop TEXT,
-            variety TEXT,
-            month TEXT,
-            week_1 TEXT,
-            week_2 TEXT,
-            week_3 TEXT,
-            week_4 TEXT,
-            week_1_kn TEXT,
-            week_2_kn TEXT,
-            week_3_kn TEXT,
-            week_4_kn TEXT
-        )
-    """)
-
-    # Create index for fast lookups
-    cursor.execute("CREATE INDEX idx_search ON crop_calendar (season, crop, variety)")
-
-    # Read CSV and Insert Data
-    with open(CSV_PATH, 'r', encoding='utf-8') as f:
+def read_csv_rows(csv_path: str = CSV_PATH):
+    # (season, crop, variety, month, week_1..week_4, week_1_kn..week_4_kn), in file order
+    with open(csv_path, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         for row in reader:
-            cursor.execute("""
-                INSERT INTO crop_calendar (
-                    season, crop, variety, month, 
-                    week_1, week_2, week_3, week_4,
-                    week_1_kn, week_2_kn, week_3_kn, week_4_kn
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            yield (
                 row['Season'].strip(),
                 row['Crop'].strip(),
                 row['Variety'].strip(),
@@ -63,11 +39,226 @@ def migrate():
                 row['Week 2 (KN)'].strip(),
                 row['Week 3 (KN)'].strip(),
                 row['Week 4 (KN)'].strip()
-            ))
+            )
+
+def read_translations(path: str = TRANSLATIONS_PATH) -> dict:
+    # {language: {English source: text}}; empty when the file is absent
+    if not os.path.exists(path):
+        return {}
+    tables = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            text = row['text'].strip()
+            if text:
+                tables.setdefault(row['language'].strip().lower(), {})[row['source'].strip()] = text
+    return tables
+
+def source_digest(csv_path: str, translations_path: str = TRANSLATIONS_PATH) -> str:
+    digest = hashlib.sha256()
+    for path in (csv_path, translations_path):
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+def row_hash(row: tuple) -> str:
+    return hashlib.blake2b("\x1f".join(row).encode("utf-8"), digest_size=16).hexdigest()
+
+def create_schema(cursor):
+    cursor.execute(f"""
+        CREATE TABLE crop_calendar (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            {", ".join(f"{c} TEXT NOT NULL" for c in NATURAL_KEY)},
+            {", ".join(f"{c} INTEGER NOT NULL REFERENCES fragment (id)" for c in COLUMNS[4:])},
+            position INTEGER NOT NULL,
+            row_hash TEXT NOT NULL
+        )
+    """)
+    # One row per unique English week text, however many calendar rows use it
+    cursor.execute("CREATE TABLE fragment (id INTEGER PRIMARY KEY, source TEXT NOT NULL)")
+    cursor.execute("""
+        CREATE TABLE fragment_translation (
+            fragment_id INTEGER NOT NULL REFERENCES fragment (id),
+            language TEXT NOT NULL,
+            text TEXT NOT NULL,
+            PRIMARY KEY (fragment_id, language)
+        ) WITHOUT ROWID
+    """)
+    cursor.execute("CREATE TABLE calendar_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+def create_indexes(cursor):
+    # Built after the bulk load; maintaining them row by row during the insert is slower
+    cursor.execute(f"CREATE UNIQUE INDEX idx_natural_key ON crop_calendar ({', '.join(NATURAL_KEY)})")
+    cursor.execute("CREATE INDEX idx_position ON crop_calendar (position)")
+    cursor.execute("CREATE UNIQUE INDEX idx_fragment_source ON fragment (source)")
+
+def read_meta(db_path: str = DB_PATH) -> dict:
+    try:
+        conn = sqlite3.connect(readonly_uri(db_path), uri=True)
+    except sqlite3.OperationalError:
+        return {}
+    try:
+        return dict(conn.execute("SELECT key, value FROM calendar_meta").fetchall())
+    except sqlite3.OperationalError:
+        return {}
+    finally:
+        conn.close()
+
+def existing_state(cursor):
+    # (natural key -> (row_hash, position), source -> fragment id, (fragment id, language) -> text)
+    cursor.execute(f"SELECT {', '.join(NATURAL_KEY)}, row_hash, position FROM crop_calendar")
+    rows = {r[:4]: (r[4], r[5]) for r in cursor.fetchall()}
+    cursor.execute("SELECT source, id FROM fragment")
+    fragments = dict(cursor.fetchall())
+    cursor.execute("SELECT fragment_id, language, text FROM fragment_translation")
+    translations = {(r[0], r[1]): r[2] for r in cursor.fetchall()}
+    return rows, fragments, translations
+
+def publish_artifact(csv_path: str, translations_path: str, data_version: str) -> None:
+    # The API serves calendar.bin in preference to the database once it exists, so an existing
+    # artifact is recompiled whenever it lags the data just migrated
+    from compile_calendar import ARTIFACT_PATH, compile_calendar  # compile_calendar imports this module
+    if os.path.exists(ARTIFACT_PATH) and artifact_data_version(ARTIFACT_PATH) != data_version:
+        compile_calendar(csv_path, ARTIFACT_PATH, translations_path)
+
+def migrate(csv_path: str = CSV_PATH, db_path: str = DB_PATH, translations_path: str = TRANSLATIONS_PATH) -> bool:
+    if not os.path.exists(csv_path):
+        print(f"Error: {csv_path} not found. Run generate_bilingual.py first.")
+        return False
 
-    conn.commit()
+    data_version = source_digest(csv_path, translations_path)
+    meta = read_meta(db_path)
+    current_schema = meta.get("schema_version") == SCHEMA_VERSION
+    if current_schema and meta.get("data_version") == data_version:
+        print(f"Up to date: {db_path} already at data version {data_version}")
+        publish_artifact(csv_path, translations_path, data_version)
+        return False
+
+    csv_rows = list(read_csv_rows(csv_path))
+    try:
+        id_rows, fragments = intern_fragments(csv_rows, read_translations(translations_path))
+    except ValueError as e:
+        print(f"Error: {csv_path}: {e}")
+        return False
+
+    # Work on a private copy and publish it with one rename; readers never see a half-loaded table
+    tmp_path = db_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path, isolation_level=None)
+    cursor = conn.cursor()
+
+    previous, known, known_translations = {}, {}, {}
+    if current_schema:
+        source = sqlite3.connect(readonly_uri(db_path), uri=True)
+        source.backup(conn)
+        source.close()
+        previous, known, known_translations = existing_state(cursor)
+    # Rollback journal: the published file must not depend on a -wal sidecar
+    cursor.execute("PRAGMA journal_mode=DELETE")
+
+    # Fragments already in the database keep their ids, so unchanged rows keep unchanged values
+    next_id = max(known.values(), default=0) + 1
+    fragment_ids = {}
+    new_fragments = []
+    for local_id, texts in fragments.items():
+        source_text = texts[DEFAULT_LANGUAGE]
+        if source_text not in known:
+            known[source_text] = next_id
+            new_fragments.append((next_id, source_text))
+            next_id += 1
+        fragment_ids[local_id] = known[source_text]
+    translations = {
+        (fragment_ids[local_id], language): text
+        for local_id, texts in fragments.items()
+        for language, text in texts.items() if language != DEFAULT_LANGUAGE
+    }
+    rows = [
+        (*r[:4], *(fragment_ids[f] for f in r[4:8]), position, row_hash(csv_row[:8]))
+        for position, (r, csv_row) in enumerate(zip(id_rows, csv_rows))
+    ]
+
+    placeholders = ", ".join("?" * (len(COLUMNS) + 2))
+    insert_rows = f"INSERT INTO crop_calendar ({', '.join(COLUMNS)}, position, row_hash) VALUES ({placeholders})"
+    cursor.execute("BEGIN")
+    try:
+        if not previous:
+            for table in ("crop_calendar", "fragment", "fragment_translation", "calendar_meta"):
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            create_schema(cursor)
+            cursor.executemany("INSERT INTO fragment (id, source) VALUES (?, ?)", new_fragments)
+            cursor.executemany(
+                "INSERT INTO fragment_translation (fragment_id, language, text) VALUES (?, ?, ?)",
+                [(*k, text) for k, text in translations.items()]
+            )
+            cursor.executemany(insert_rows, rows)
+            create_indexes(cursor)
+            changed, moved, removed = rows, [], []
+            retranslated = list(translations)
+        else:
+            # Content changes are upserted; rows that only shifted position get a one-column update
+            changed, moved = [], []
+            for r in rows:
+                old = previous.get(r[:4])
+                if old is None or old[0] != r[-1]:
+                    changed.append(r)
+                elif old[1] != r[-2]:
+                    moved.append((r[-2], *r[:4]))
+            current = {r[:4] for r in rows}
+            removed = [k for k in previous if k not in current]
+            cursor.executemany("INSERT INTO fragment (id, source) VALUES (?, ?)", new_fragments)
+            cursor.executemany(
+                "DELETE FROM fragment_translation WHERE fragment_id = ? AND language = ?",
+                [k for k in known_translations if k not in translations]
+            )
+            # Translation edits land here; rows only hash their English cells
+            retranslated = [(*k, text) for k, text in translations.items() if known_translations.get(k) != text]
+            cursor.executemany(
+                "INSERT INTO fragment_translation (fragment_id, language, text) VALUES (?, ?, ?) "
+                "ON CONFLICT (fragment_id, language) DO UPDATE SET text = excluded.text",
+                retranslated
+            )
+            cursor.executemany(
+                f"DELETE FROM crop_calendar WHERE {' AND '.join(f'{c} = ?' for c in NATURAL_KEY)}",
+                removed
+            )
+            updates = ", ".join(f"{c} = excluded.{c}" for c in COLUMNS[4:] + ("position", "row_hash"))
+            cursor.executemany(
+                f"{insert_rows} ON CONFLICT ({', '.join(NATURAL_KEY)}) DO UPDATE SET {updates}",
+                changed
+            )
+            cursor.executemany(
+                f"UPDATE crop_calendar SET position = ? WHERE {' AND '.join(f'{c} = ?' for c in NATURAL_KEY)}",
+                moved
+            )
+            # Fragments no row points at any more
+            used = " UNION ".join(f"SELECT {c} FROM crop_calendar" for c in COLUMNS[4:])
+            cursor.execute(f"DELETE FROM fragment_translation WHERE fragment_id NOT IN ({used})")
+            cursor.execute(f"DELETE FROM fragment WHERE id NOT IN ({used})")
+        cursor.executemany(
+            "INSERT OR REPLACE INTO calendar_meta (key, value) VALUES (?, ?)",
+            [
+                ("data_version", data_version),
+                ("schema_version", SCHEMA_VERSION),
+                ("row_count", str(len(rows))),
+                ("fragment_count", str(len(fragments))),
+                ("loaded_at", str(int(time.time())))
+            ]
+        )
+        cursor.execute("COMMIT")
+    except Exception:
+        cursor.execute("ROLLBACK")
+        conn.close()
+        os.remove(tmp_path)
+        raise
     conn.close()
-    print(f"Bilingual Migration successful: {CSV_PATH} -> {DB_PATH}")
+
+    os.replace(tmp_path, db_path)
+    print(f"Bilingual Migration successful: {csv_path} -> {db_path} "
+          f"(data {data_version}, {len(changed)} upserted, {len(moved)} moved, {len(removed)} removed, "
+          f"{len(retranslated)} translations updated, {len(rows)} rows, {len(fragments)} fragments)")
+    publish_artifact(csv_path, translations_path, data_version)
+    return True
 
 if __name__ == "__main__":
     migrate()
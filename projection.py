@@ -0,0 +1,143 @@
+import calendar
+from typing import Any, FrozenSet, NamedTuple, Optional, Tuple
+
+# Field selection and month/week filtering over an already-rendered calendar payload (plain dicts
+# and lists), plus the columnar layout. Nothing here touches the Pydantic models.
+
+MONTHS = tuple(calendar.month_name[1:])
+_MONTH_LOOKUP = {
+    **{name.lower(): name for name in MONTHS},
+    **{abbr.lower(): name for abbr, name in zip(calendar.month_abbr[1:], MONTHS)},
+}
+
+
+class Projection(NamedTuple):
+    # Field tree: {"progress": {}, "timeline": {"weeks": {"stage": {}}}}; an empty dict keeps the whole value
+    fields: Optional[dict] = None
+    months: Optional[FrozenSet[str]] = None
+    weeks: Optional[Tuple[int, int]] = None
+
+    @property
+    def identity(self) -> bool:
+        return self.fields is None and self.months is None and self.weeks is None
+
+    @property
+    def key(self) -> tuple:
+        # Hashable and order-insensitive, for caching projected bodies
+        return (_freeze(self.fields), tuple(sorted(self.months or ())) or None, self.weeks)
+
+
+def _freeze(tree: Optional[dict]):
+    if tree is None:
+        return None
+    return tuple(sorted((name, _freeze(sub)) for name, sub in tree.items()))
+
+
+def parse_fields(value: Optional[str]) -> Optional[dict]:
+    # "progress,timeline.weeks.stage" -> {"progress": {}, "timeline": {"weeks": {"stage": {}}}}
+    if not value or not value.strip():
+        return None
+    tree = {}
+    for path in value.split(","):
+        parts = [p.strip() for p in path.split(".")]
+        if not all(parts):
+            raise ValueError(f"Invalid field path '{path.strip()}'.")
+        node = tree
+        for i, part in enumerate(parts):
+            if part in node and not node[part]:
+                break  # A shorter path already selects the whole subtree
+            node = node.setdefault(part, {})
+            if i == len(parts) - 1:
+                node.clear()
+    return tree
+
+
+def _month(name: str) -> str:
+    month = _MONTH_LOOKUP.get(name.strip().lower())
+    if month is None:
+        raise ValueError(f"Unknown month '{name.strip()}'.")
+    return month
+
+
+def parse_months(value: Optional[str]) -> Optional[FrozenSet[str]]:
+    # "June,August" or "Nov-Feb" (inclusive, may wrap past December)
+    if not value or not value.strip():
+        return None
+    selected = set()
+    for part in value.split(","):
+        start, sep, end = part.partition("-")
+        if not sep:
+            selected.add(_month(start))
+            continue
+        first, last = MONTHS.index(_month(start)), MONTHS.index(_month(end))
+        span = (last - first) % 12
+        selected.update(MONTHS[(first + i) % 12] for i in range(span + 1))
+    return frozenset(selected)
+
+
+def parse_weeks(value: Optional[str]) -> Optional[Tuple[int, int]]:
+    # "5" or "3-8", matched against week_number (1-based, inclusive)
+    if not value or not value.strip():
+        return None
+    start, sep, end = value.partition("-")
+    try:
+        first = int(start)
+        last = int(end) if sep else first
+    except ValueError:
+        raise ValueError(f"Invalid week range '{value}'; use N or N-M.") from None
+    if first < 1 or last < first:
+        raise ValueError(f"Invalid week range '{value}'; use N or N-M.")
+    return first, last
+
+
+def parse_projection(fields: Optional[str] = None, months: Optional[str] = None, weeks: Optional[str] = None) -> Projection:
+    return Projection(parse_fields(fields), parse_months(months), parse_weeks(weeks))
+
+
+def select(value: Any, tree: dict, path: str = "") -> Any:
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [select(item, tree, path) for item in value]
+    if not isinstance(value, dict):
+        raise ValueError(f"Field '{path}' has no sub-fields.")
+    unknown = [name for name in tree if name not in value]
+    if unknown:
+        raise ValueError(f"Unknown field '{path + '.' if path else ''}{unknown[0]}'. Available: {', '.join(value)}.")
+    return {name: select(value[name], sub, f"{path}.{name}" if path else name) for name, sub in tree.items()}
+
+
+def project(payload: dict, projection: Projection) -> dict:
+    if projection.months is not None or projection.weeks is not None:
+        timeline = []
+        for month in payload["timeline"]:
+            if projection.months is not None and month["month"] not in projection.months:
+                continue
+            if projection.weeks is not None:
+                first, last = projection.weeks
+                weeks = [w for w in month["weeks"] if first <= w["week_number"] <= last]
+                if not weeks:
+                    continue
+                month = {**month, "weeks": weeks}
+            timeline.append(month)
+        kept = {m["month"] for m in timeline}
+        payload = {
+            **payload,
+            "timeline": timeline,
+            "summary_by_month": {k: v for k, v in payload["summary_by_month"].items() if k in kept},
+        }
+    if projection.fields is not None:
+        payload = select(payload, projection.fields)
+    return payload
+
+
+def columnar(value: Any) -> Any:
+    # Lists of objects become one list per key: [{"a": 1}, {"a": 2}] -> {"a": [1, 2]}
+    if isinstance(value, dict):
+        return {k: columnar(v) for k, v in value.items()}
+    if isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+        keys = list(value[0])
+        return {k: [columnar(item.get(k)) for item in value] for k in keys}
+    if isinstance(value, list):
+        return [columnar(item) for item in value]
+    return value
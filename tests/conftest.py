@@ -0,0 +1,71 @@
+import csv
+import os
+import sys
+
+import pytest
+
+# The service is a set of flat modules at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HEADER = (
+    "Season", "Crop", "Variety", "Month", "Week 1", "Week 2", "Week 3", "Week 4",
+    "Week 1 (KN)", "Week 2 (KN)", "Week 3 (KN)", "Week 4 (KN)",
+)
+
+# Two paddy varieties sharing most week texts, and one groundnut variety
+SAMPLE_ROWS = (
+    ("Kharif", "Paddy", "MO-4 (Bhadra)", "June",
+     "🚜 Book Tractor & Labor", "🌱 Sow seeds in trays or beds", "💧 Water and care for seedlings", "🌱 Move 15–18 day-old seedlings to main field",
+     "🚜 ಟ್ರಾಕ್ಟರ್ ಬುಕ್ ಮಾಡಿ", "🌱 ಟ್ರೇಗಳಲ್ಲಿ ಬೀಜ ಬಿತ್ತಿ", "💧 ಸಸಿಗಳಿಗೆ ನೀರು ಕೊಡಿ", "🌱 ಸಸಿಗಳನ್ನು ವರ್ಗಾಯಿಸಿ"),
+    ("Kharif", "Paddy", "MO-4 (Bhadra)", "July",
+     "🧪 Apply 25% N (tillering) split", "Pull out weeds", "🔎⚠️ Scout: BPH", "Field resting",
+     "🧪 ಯೂರಿಯಾ ಹಾಕಿ", "ಕಳೆ ಕಿತ್ತೆಸೆಯಿರಿ", "🔎⚠️ ಪರಿಶೀಲಿಸಿ: ಜಿಗಿ ಹುಳು", "ಜಮೀನಿಗೆ ವಿಶ್ರಾಂತಿ"),
+    ("Kharif", "Paddy", "MO-4 (Bhadra)", "August",
+     "Panicle emergence monitoring", "💧 Drain water before harvest", "✂️ Cut and collect the crop", "Dry grain to 14% moisture",
+     "ತೆನೆ ಗಮನಿಸಿ", "💧 ನೀರನ್ನು ಹೊರಹಾಕಿ", "✂️ ಕೊಯ್ಲು ಮಾಡಿ", "ಧಾನ್ಯ ಒಣಗಿಸಿ"),
+    ("Kharif", "Paddy", "Jaya", "June",
+     "🚜 Book Tractor & Labor", "🌱 Sow seeds in trays or beds", "💧 Water and care for seedlings", "🌱 Move 15–18 day-old seedlings to main field",
+     "🚜 ಟ್ರಾಕ್ಟರ್ ಬುಕ್ ಮಾಡಿ", "🌱 ಟ್ರೇಗಳಲ್ಲಿ ಬೀಜ ಬಿತ್ತಿ", "💧 ಸಸಿಗಳಿಗೆ ನೀರು ಕೊಡಿ", "🌱 ಸಸಿಗಳನ್ನು ವರ್ಗಾಯಿಸಿ"),
+    ("Kharif", "Paddy", "Jaya", "July",
+     "🧪 Apply 25% N (tillering) split", "Pull out weeds", "✂️ Cut and collect the crop", "Field resting",
+     "🧪 ಯೂರಿಯಾ ಹಾಕಿ", "ಕಳೆ ಕಿತ್ತೆಸೆಯಿರಿ", "✂️ ಕೊಯ್ಲು ಮಾಡಿ", "ಜಮೀನಿಗೆ ವಿಶ್ರಾಂತಿ"),
+    ("Rabi", "Groundnut", "TMV-2", "November",
+     "Ready land and give lime to soil", "🌱 Sow (10\"x4\")", "Give small amount of water", "Pull out weeds",
+     "ಭೂಮಿ ಸಿದ್ಧಪಡಿಸಿ", "🌱 ಬಿತ್ತನೆ ಮಾಡಿ", "ಅಲ್ಪ ನೀರು ಕೊಡಿ", "ಕಳೆ ಕಿತ್ತೆಸೆಯಿರಿ"),
+)
+
+
+def write_calendar(path, rows=SAMPLE_ROWS):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    # Default paths (calendar.bin, translations.csv) are relative; keep every test out of the checkout
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def sample_csv(workdir):
+    return write_calendar(workdir / "calendar_bilingual.csv")
+
+
+@pytest.fixture
+def client():
+    # The API over the sample snapshot, swapped in directly: no lifespan, so the checkout's data files are never read
+    import main
+    from engine import CalendarSnapshot
+    from fastapi.testclient import TestClient
+
+    previous = main.store.swap(CalendarSnapshot.from_rows(SAMPLE_ROWS))
+    for cache in (main._cache, main._rendered, main._projected):
+        cache.clear()
+    yield TestClient(main.app)
+    main.store.swap(previous)
+    for cache in (main._cache, main._rendered, main._projected):
+        cache.clear()
@@ -0,0 +1,61 @@
+from datetime import date, timedelta
+
+import pytest
+
+import advisory
+from conftest import SAMPLE_ROWS
+from engine import CalendarSnapshot
+from main import sowing_progress
+
+AS_OF = date(2026, 7, 1)
+OPERATIONS = ("week", "stage", "field_operation", "irrigation", "fertilizer", "weed_management", "protection", "critical_actions")
+
+
+@pytest.fixture(autouse=True)
+def snapshot(monkeypatch):
+    monkeypatch.setattr(advisory, "_snapshot", CalendarSnapshot.from_rows(SAMPLE_ROWS))
+    monkeypatch.setattr(advisory, "_as_of", AS_OF)
+    advisory._plans.clear()
+    advisory._plan_cache.clear()
+
+
+def advise(days_since_sowing: int) -> dict:
+    sowing_date = AS_OF - timedelta(days=days_since_sowing)
+    return advisory.advise({"id": "f1", "season": "kharif", "crop": "paddy", "variety": "mo-4", "sowing_date": sowing_date.isoformat()})
+
+
+def api_tracker(days_since_sowing: int) -> tuple:
+    plan, _, _ = advisory.resolve("kharif", "paddy", "mo-4", "en")
+    return sowing_progress(plan, AS_OF - timedelta(days=days_since_sowing), AS_OF)
+
+
+def test_in_progress_reports_todays_operations():
+    result = advise(10)
+
+    assert result["status"] == "in_progress"
+    assert result["day_offset"] == 10
+    assert result["variety"] == "MO-4 (Bhadra)"
+    assert set(OPERATIONS) <= set(result)
+    _, status, tracker = api_tracker(10)
+    assert status == result["status"]
+    assert tracker["current_week"] == result["week"]
+    assert tracker["current_phase"] == result["stage"]
+
+
+@pytest.mark.parametrize("days_since_sowing, status", [(-3, "upcoming"), (365, "completed")])
+def test_upcoming_and_completed_report_status_only(days_since_sowing, status):
+    result = advise(days_since_sowing)
+
+    assert result["status"] == status
+    assert result["day_offset"] == days_since_sowing
+    assert not set(OPERATIONS) & set(result)
+    assert "error" not in result
+    # The API agrees: no current week outside the growing window
+    _, api_status, tracker = api_tracker(days_since_sowing)
+    assert api_status == status
+    assert tracker["current_week"] == 0
+
+
+def test_errors_skip_the_plan():
+    assert advisory.advise({"season": "kharif", "crop": "paddy", "variety": "nope", "sowing_date": "2026-06-01"})["error"]
+    assert advisory.advise({"season": "kharif", "crop": "paddy", "variety": "mo-4", "sowing_date": "June"})["error"] == "Invalid sowing_date 'June'."
@@ -0,0 +1,76 @@
+import pytest
+
+import main
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    # 10 requests at once, refilling 1/s on a clock that never moves
+    monkeypatch.setattr(main.limiter, "rate", 1.0)
+    monkeypatch.setattr(main.limiter, "burst", 10.0)
+    monkeypatch.setattr(main.limiter, "clock", lambda: 0.0)
+    main.limiter._buckets.clear()
+    yield main.limiter
+    main.limiter._buckets.clear()
+
+
+def tokens_left(limiter) -> float:
+    return limiter._buckets["testclient"][0]
+
+
+def test_batch_is_charged_per_expanded_item(client, limiter):
+    # One wildcard item resolving to both paddy varieties costs two requests, not one
+    response = client.post("/calendar/batch", json={"items": [{"season": "Kharif", "crop": "Paddy", "variety": "*"}]})
+
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == 2
+    assert tokens_left(limiter) == 8
+
+
+def test_rejected_batch_is_not_charged_per_item(client, limiter, monkeypatch):
+    monkeypatch.setattr(main, "BATCH_MAX_ITEMS", 1)
+    response = client.post("/calendar/batch", json={"items": [{"season": "Kharif", "crop": "*", "variety": "*"}]})
+
+    assert response.status_code == 413
+    assert tokens_left(limiter) == 9
+
+
+def test_batch_expands_wildcards_in_table_order(client):
+    response = client.post("/calendar/batch", json={"items": [
+        {"season": "Kharif", "crop": "Paddy", "variety": "*", "language": "kn"},
+        {"season": "Rabi", "crop": "*", "variety": "*"},
+    ]})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(r["request"]["variety"], r["request"]["language"], r["status"]) for r in results] == [
+        ("MO-4 (Bhadra)", "kn", 200), ("Jaya", "kn", 200), ("TMV-2", "en", 200),
+    ]
+    assert results[0]["data"]["context"]["language"] == "kn"
+    assert results[2]["data"]["context"]["selected_crop"] == "Groundnut"
+
+
+def test_batch_reports_unknown_items_without_failing_the_rest(client):
+    response = client.post("/calendar/batch", json={"items": [
+        {"season": "Kharif", "crop": "Paddy", "variety": "MO4"},
+        {"season": "Kharif", "crop": "Paddy", "variety": "Basmati"},
+        {"season": "Summer", "crop": "*", "variety": "*"},
+    ]})
+
+    assert response.status_code == 200
+    ok, unknown, no_match = response.json()["results"]
+    assert ok["status"] == 200
+    assert ok["data"]["context"]["selected_variety"] == "MO-4 (Bhadra)"
+    assert unknown["status"] == 404
+    assert unknown["error"]["message"] == "Unknown variety 'Basmati' for Paddy in Kharif."
+    assert (no_match["status"], no_match["error"]) == (404, "No matching calendar found.")
+
+
+def test_batch_limit_counts_expanded_items(client, monkeypatch):
+    monkeypatch.setattr(main, "BATCH_MAX_ITEMS", 2)
+    items = [{"season": "Kharif", "crop": "Paddy", "variety": "*"}]
+
+    assert client.post("/calendar/batch", json={"items": items}).status_code == 200
+    response = client.post("/calendar/batch", json={"items": items + [{"season": "Rabi", "crop": "Groundnut", "variety": "TMV-2"}]})
+    assert response.status_code == 413
+    assert response.json()["detail"] == "Batch expands to 3 items; limit is 2."
@@ -0,0 +1,78 @@
+import pytest
+
+import engine
+from conftest import SAMPLE_ROWS
+from artifact import FORMAT_VERSION, HEADER, MAGIC, artifact_data_version, load_artifact, write_artifact
+from engine import CalendarSnapshot, normalize
+
+# Hindi covers a single fragment; every other week falls back to English
+HINDI = {"hi": {"Pull out weeds": "खरपतवार निकालें"}}
+
+
+def stamp_format(path, fmt):
+    # Rewrites the header as an older build would have written it
+    with open(path, "r+b") as f:
+        _, _, _, index_length = HEADER.unpack(f.read(HEADER.size))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, fmt, 0, index_length))
+
+
+@pytest.fixture
+def snapshot():
+    return CalendarSnapshot.from_rows(SAMPLE_ROWS, HINDI, data_version="abc123")
+
+
+def test_round_trip_keeps_order_flags_and_categorized_text(workdir, snapshot):
+    write_artifact("calendar.bin", snapshot, "abc123")
+    loaded = load_artifact("calendar.bin")
+
+    assert artifact_data_version("calendar.bin") == "abc123"
+    assert loaded.data_version == "abc123"
+    assert loaded.languages == snapshot.languages == ("en", "hi", "kn")
+    assert list(loaded.names.items()) == list(snapshot.names.items())
+    for key in snapshot.names:
+        for written, read in zip(snapshot.rows[key], loaded.rows[key]):
+            assert read.month == written.month
+            for a, b in zip(written.weeks, read.weeks):
+                assert (b.resting, b.critical, b.major, b.stage) == (a.resting, a.critical, a.major, a.stage)
+                for language in snapshot.languages:
+                    assert b.localized[language] == a.localized[language]
+
+
+def test_categories_are_stored_not_derived_on_load(workdir, snapshot, monkeypatch):
+    write_artifact("calendar.bin", snapshot, "abc123")
+    # Serving from the artifact must never run the keyword regexes
+    monkeypatch.setattr(engine, "categorize", lambda *args: pytest.fail("categorized at serve time"))
+    july = load_artifact("calendar.bin").rows[(normalize("Kharif"), normalize("Paddy"), normalize("MO-4 (Bhadra)"))][1]
+
+    weeds = july.weeks[1].localized
+    assert weeds["en"].weed_management == "Pull out weeds"
+    # Hindi has no keyword rules; its categories were borrowed from the English text at compile time
+    assert weeds["hi"].weed_management == "खरपतवार निकालें"
+    assert weeds["kn"].weed_management == "ಕಳೆ ಕಿತ್ತೆಸೆಯಿರಿ"
+    # Untranslated weeks fall back to English
+    assert july.weeks[0].localized["hi"] == july.weeks[0].localized["en"]
+
+
+def test_other_format_versions_are_rejected(workdir, snapshot):
+    write_artifact("calendar.bin", snapshot, "abc123")
+    stamp_format("calendar.bin", FORMAT_VERSION - 1)
+
+    # A stale format reads as "no artifact", so the caller recompiles instead of serving it
+    assert artifact_data_version("calendar.bin") is None
+    with pytest.raises(ValueError, match=f"this build reads v{FORMAT_VERSION}"):
+        load_artifact("calendar.bin")
+    assert artifact_data_version("missing.bin") is None
+
+
+def test_ensure_artifact_compiles_missing_and_outdated_files(workdir, sample_csv):
+    import main
+
+    main.ensure_artifact()
+    version = artifact_data_version("calendar.bin")
+    assert version
+    stamp_format("calendar.bin", FORMAT_VERSION - 1)
+
+    main.ensure_artifact()
+    assert artifact_data_version("calendar.bin") == version
+    assert len(load_artifact("calendar.bin").names) == 3
@@ -0,0 +1,123 @@
+import sqlite3
+
+from conftest import SAMPLE_ROWS, write_calendar
+from artifact import load_artifact
+from compile_calendar import compile_calendar
+from engine import normalize
+from migrate import migrate
+
+
+def kannada_of(db_path, source):
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT t.text FROM fragment f JOIN fragment_translation t ON t.fragment_id = f.id "
+            "WHERE f.source = ? AND t.language = 'kn'",
+            (source,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return row and row[0]
+
+
+def edit_kannada(rows, row_indexes, week, text):
+    edited = [list(r) for r in rows]
+    for i in row_indexes:
+        edited[i][8 + week] = text
+    return [tuple(r) for r in edited]
+
+
+def test_kannada_edit_on_later_row_fails_migration(workdir, sample_csv, capsys):
+    assert migrate(sample_csv, "calendar.db")
+    before = kannada_of("calendar.db", "🚜 Book Tractor & Labor")
+
+    # Row 5 of the CSV (Jaya, June) shares week 1 with row 2 but now disagrees with it
+    write_calendar(sample_csv, edit_kannada(SAMPLE_ROWS, [3], 0, "🚜 ಟ್ರಾಕ್ಟರ್ ಮತ್ತು ಕೂಲಿ ಬುಕ್ ಮಾಡಿ"))
+    assert not migrate(sample_csv, "calendar.db")
+
+    out = capsys.readouterr().out
+    assert "'🚜 Book Tractor & Labor'" in out
+    assert "row 2 -> " in out and "row 5 -> " in out
+    assert kannada_of("calendar.db", "🚜 Book Tractor & Labor") == before
+    assert not compile_calendar(sample_csv, "calendar.bin")
+
+
+def test_consistent_kannada_edit_reaches_database_and_artifact(workdir, sample_csv):
+    assert migrate(sample_csv, "calendar.db")
+    assert compile_calendar(sample_csv, "calendar.bin")
+
+    edited = "🚜 ಟ್ರಾಕ್ಟರ್ ಮತ್ತು ಕೂಲಿ ಬುಕ್ ಮಾಡಿ"
+    write_calendar(sample_csv, edit_kannada(SAMPLE_ROWS, [0, 3], 0, edited))
+    assert migrate(sample_csv, "calendar.db")
+
+    assert kannada_of("calendar.db", "🚜 Book Tractor & Labor") == edited
+    snapshot = load_artifact("calendar.bin")
+    for name in ("MO-4 (Bhadra)", "Jaya"):
+        june = snapshot.rows[(normalize("Kharif"), normalize("Paddy"), normalize(name))][0]
+        assert june.weeks[0].localized["kn"].text == edited
+
+
+def table(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT c.variety, c.month, c.position, c.week_1, f.source FROM crop_calendar c "
+            "JOIN fragment f ON f.id = c.week_1 ORDER BY c.position"
+        ).fetchall()
+        meta = dict(conn.execute("SELECT key, value FROM calendar_meta"))
+    finally:
+        conn.close()
+    return rows, meta
+
+
+def test_rerun_with_unchanged_sources_is_a_no_op(workdir, sample_csv, capsys):
+    assert migrate(sample_csv, "calendar.db")
+    rows, meta = table("calendar.db")
+    assert len(rows) == len(SAMPLE_ROWS)
+    assert meta["schema_version"] == "2"
+
+    assert not migrate(sample_csv, "calendar.db")
+    assert "Up to date" in capsys.readouterr().out
+    assert table("calendar.db") == (rows, meta)
+
+
+def test_incremental_run_applies_edits_removals_and_moves(workdir, sample_csv):
+    assert migrate(sample_csv, "calendar.db")
+    before_rows, before_meta = table("calendar.db")
+    before = {(variety, month): (week_1, source) for variety, month, _, week_1, source in before_rows}
+
+    edited = [list(r) for r in SAMPLE_ROWS]
+    edited[1][4] = "🧪 Apply 30% N (tillering) split"
+    # Groundnut moves to the top, Jaya's July row is dropped
+    write_calendar(sample_csv, [edited[5], *edited[:4]])
+    assert migrate(sample_csv, "calendar.db")
+
+    rows, meta = table("calendar.db")
+    assert [(variety, month) for variety, month, *_ in rows] == [
+        ("TMV-2", "November"), ("MO-4 (Bhadra)", "June"), ("MO-4 (Bhadra)", "July"), ("MO-4 (Bhadra)", "August"), ("Jaya", "June"),
+    ]
+    after = {(variety, month): (week_1, source) for variety, month, _, week_1, source in rows}
+    assert after[("MO-4 (Bhadra)", "July")][1] == "🧪 Apply 30% N (tillering) split"
+    # Unchanged texts keep their fragment ids
+    assert after[("MO-4 (Bhadra)", "June")] == before[("MO-4 (Bhadra)", "June")]
+    assert after[("TMV-2", "November")] == before[("TMV-2", "November")]
+    assert meta["data_version"] != before_meta["data_version"]
+    assert not (workdir / "calendar.db.tmp").exists()
+
+
+def test_database_path_with_uri_characters(workdir, sample_csv):
+    db_path = str(workdir / "data?v=1#x%20" / "calendar.db")
+    (workdir / "data?v=1#x%20").mkdir()
+
+    assert migrate(sample_csv, db_path)
+    assert not migrate(sample_csv, db_path)  # read_meta found the stamp through the quoted URI
+    assert len(table(db_path)[0]) == len(SAMPLE_ROWS)
+
+
+def test_stale_artifact_is_recompiled(workdir, sample_csv):
+    assert compile_calendar(sample_csv, "calendar.bin")
+    assert migrate(sample_csv, "calendar.db")
+
+    write_calendar(sample_csv, SAMPLE_ROWS[:3])
+    assert migrate(sample_csv, "calendar.db")
+    assert list(load_artifact("calendar.bin").names.values()) == [("Kharif", "Paddy", "MO-4 (Bhadra)")]
@@ -0,0 +1,75 @@
+from datetime import date
+
+import pytest
+
+from conftest import SAMPLE_ROWS
+from engine import CalendarSnapshot, build_static_plan, locate_week, normalize, sowing_status
+
+MO4 = (normalize("Kharif"), normalize("Paddy"), normalize("MO-4 (Bhadra)"))
+
+
+@pytest.fixture
+def plan():
+    # 11 active weeks (the resting week is skipped), sown in week 2
+    snapshot = CalendarSnapshot.from_rows(SAMPLE_ROWS)
+    return build_static_plan(snapshot.rows[MO4], *snapshot.names[MO4], "en")
+
+
+def test_day_table_covers_every_active_week(plan):
+    assert plan.sowing_week == 2
+    assert plan.total_weeks == 11
+    assert len(plan.days) == 77
+    assert [plan.days[d].week_number for d in (0, 6, 7, 76)] == [1, 1, 2, 11]
+
+
+@pytest.mark.parametrize("day_offset, status, week_number", [
+    (-7, "upcoming", 1),     # preparation week before sowing
+    (-30, "upcoming", 1),    # earlier than the calendar starts: clamped to its first week
+    (-1, "upcoming", 1),
+    (0, "in_progress", 2),   # sowing day
+    (6, "in_progress", 2),
+    (7, "in_progress", 3),
+    (69, "in_progress", 11), # last day of the last week
+    (70, "completed", 11),
+    (400, "completed", 11),
+])
+def test_locate_week(plan, day_offset, status, week_number):
+    located_status, week = locate_week(plan, day_offset)
+    assert (located_status, week.week_number) == (status, week_number)
+
+
+def test_empty_plan_is_upcoming(plan):
+    assert locate_week(plan._replace(days=()), 10) == ("upcoming", None)
+
+
+def test_sowing_status_counts_days_from_sowing(plan):
+    day_offset, status, week = sowing_status(plan, date(2026, 6, 1), date(2026, 6, 15))
+    assert (day_offset, status, week.week_number) == (14, "in_progress", 4)
+
+
+def test_progress_endpoint_uses_the_sowing_date(client):
+    response = client.get("/calendar/progress", params={
+        "season": "Kharif", "crop": "Paddy", "variety": "MO-4", "sowing_date": "2026-06-01", "as_of": "2026-06-15",
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["day_offset"], body["status"]) == (14, "in_progress")
+    assert body["progress"]["current_week"] == 4
+    assert body["context"]["selected_variety"] == "MO-4 (Bhadra)"
+
+
+def test_progress_batch_reports_each_item(client):
+    response = client.post("/calendar/progress/batch", json={"as_of": "2026-06-15", "items": [
+        {"id": "a", "season": "Kharif", "crop": "Paddy", "variety": "MO-4", "sowing_date": "2026-06-01"},
+        {"id": "b", "season": "Kharif", "crop": "Paddy", "variety": "Jaya", "sowing_date": "2026-06-20"},
+        {"id": "c", "season": "Kharif", "crop": "Paddy", "variety": "Jaya", "sowing_date": "2026-01-01", "as_of": "2026-12-01"},
+        {"id": "d", "season": "Kharif", "crop": "Paddy", "variety": "Nope", "sowing_date": "2026-06-01"},
+    ]})
+
+    assert response.status_code == 200
+    results = {r["id"]: r for r in response.json()["results"]}
+    assert [results[i]["data"]["status"] for i in "abc"] == ["in_progress", "upcoming", "completed"]
+    assert results["a"]["data"]["progress"]["current_week"] == 4
+    assert results["d"]["status"] == 404
+    assert "Jaya" in results["d"]["error"]["candidates"]